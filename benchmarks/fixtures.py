@@ -0,0 +1,140 @@
+from copy import deepcopy
+from typing import Any, Dict, Tuple
+
+from src.core.stress_engine import StressTestEngine
+
+# 벤치마크 결과가 실행마다 비교 가능하도록 입력값을 모두 고정한다.
+CATEGORY_RATES = {
+    "SGOV Buffer": {"dy": 0.045, "pa": 0.0, "tr": 0.045},
+    "Bond Buffer": {"dy": 0.04, "pa": 0.0, "tr": 0.04},
+    "High Income": {"dy": 0.09, "pa": -0.01, "tr": 0.08},
+    "Dividend Growth": {"dy": 0.035, "pa": 0.05, "tr": 0.085},
+    "Growth Engine": {"dy": 0.006, "pa": 0.09, "tr": 0.096},
+}
+STRATEGY_WEIGHTS = {
+    "SGOV Buffer": 0.15,
+    "Bond Buffer": 0.10,
+    "High Income": 0.15,
+    "Dividend Growth": 0.35,
+    "Growth Engine": 0.25,
+}
+STRESS_SCENARIOS = ("BEAR", "STAGFLATION", "DIVIDEND_CUT")
+
+ProjectionCase = Tuple[Dict[str, float], Dict[str, Any]]
+
+
+def _account_stats() -> Dict[str, Any]:
+    return {
+        "dividend_yield": 0.04,
+        "expected_return": 0.08,
+        "strategy_weights": dict(STRATEGY_WEIGHTS),
+        "category_return_rates": deepcopy(CATEGORY_RATES),
+    }
+
+
+def projection_params(**overrides: Any) -> Dict[str, Any]:
+    params: Dict[str, Any] = {
+        "simulation_years": 30,
+        "simulation_start_year": 2026,
+        "simulation_start_month": 1,
+        "birth_year": 1972,
+        "birth_month": 8,
+        "private_pension_start_age": 55,
+        "national_pension_start_age": 65,
+        "household_monthly_need": 9000000,
+        "target_monthly_cashflow": 9000000,
+        "inflation_rate": 0.025,
+        "corp_salary": 2000000,
+        "monthly_bookkeeping_fee": 300000,
+        "annual_corp_tax_adjustment_fee": 500000,
+        "employee_count": 1,
+        "initial_shareholder_loan": 300000000,
+        "national_pension_amount": 1500000,
+        "pension_withdrawal_target": 2000000,
+        "personal_withdrawal_target": 0,
+        "personal_property_assessed_value": 600000000,
+        "planned_cashflows": [
+            {"year": 2030, "month": 6, "amount": 50000000, "type": "OUTFLOW", "entity": "CORP"}
+        ],
+        "portfolio_stats": {
+            "corp": _account_stats(),
+            "pension": _account_stats(),
+            "personal": _account_stats(),
+        },
+        "category_return_rates": {
+            account: deepcopy(CATEGORY_RATES) for account in ("corp", "pension", "personal")
+        },
+        "appreciation_rates": {
+            "cash_sgov": 0.0,
+            "bond_buffer": 0.0,
+            "high_income": -0.01,
+            "dividend_stocks": 0.05,
+            "growth_stocks": 0.09,
+        },
+        "distribution_rules": {
+            "corp": {"Dividend Growth": {"growth_rate": 0.05, "stress_cut_rate": 0.2}},
+        },
+    }
+    params.update(overrides)
+    return params
+
+
+def projection_cases() -> Dict[str, ProjectionCase]:
+    """계좌 구성(법인 단독, 부부 개인, 3계좌)과 스트레스 시나리오별 30년 실행 입력."""
+    all_accounts = {"corp": 1500000000.0, "pension": 500000000.0, "personal": 800000000.0}
+    cases: Dict[str, ProjectionCase] = {
+        "projection.corp_only": (
+            {"corp": 1500000000.0, "pension": 0.0, "personal": 0.0},
+            projection_params(pension_enabled=False, personal_enabled=False),
+        ),
+        "projection.couple_personal": (
+            {"corp": 0.0, "pension": 400000000.0, "personal": 2000000000.0},
+            projection_params(
+                corp_enabled=False,
+                personal_split_mode="couple",
+                personal_withdrawal_target=9000000,
+                personal_external_financial_income=15000000,
+            ),
+        ),
+        "projection.all_accounts": (dict(all_accounts), projection_params()),
+    }
+    stress_engine = StressTestEngine()
+    for scenario in STRESS_SCENARIOS:
+        cases[f"projection.stress_{scenario.lower()}"] = (
+            dict(all_accounts),
+            stress_engine.apply_scenario(projection_params(), scenario),
+        )
+    return cases
+
+
+# TaxEngine 핫패스 입력: (재산 과세표준, 연 소득) / 연 배당 / 연 실현손익 / 법인 이익
+HEALTH_INSURANCE_INPUTS = [
+    (property_value, annual_income)
+    for property_value in range(0, 2000000001, 100000000)
+    for annual_income in range(0, 200000001, 10000000)
+]
+DIVIDEND_INPUTS = [float(amount) for amount in range(0, 100000001, 500000)]
+CAPITAL_GAIN_INPUTS = [float(amount) for amount in range(-50000000, 150000001, 500000)]
+CORP_PROFIT_INPUTS = [float(amount) for amount in range(0, 1000000001, 2500000)]
+
+
+def monthly_health_insurance_inputs(years: int = 30) -> list:
+    """
+    월 루프의 건강보험료 호출 순서를 재현한 입력: 매월 부부 소유자별 (0, 반영 금융소득)과
+    가계 (재산 공시가격, 소유자 소득 합계). 반영 소득은 11월 반영 월에만 바뀐다.
+    """
+    inputs = []
+    for year_offset in range(years):
+        for month in range(1, 13):
+            reflected_year = year_offset if month >= 11 else year_offset - 1
+            owner_incomes = [
+                max(0.0, 12000000.0 + 750000.0 * reflected_year) * share for share in (0.6, 0.4)
+            ]
+            owner_incomes = [income if income > 10000000 else 0.0 for income in owner_incomes]
+            inputs.extend((0.0, income) for income in owner_incomes)
+            inputs.append((600000000.0 + 5000000.0 * year_offset, sum(owner_incomes)))
+    return inputs
+
+
+# 종합소득 과세표준 (누진구간 경계 포함)
+PROGRESSIVE_TAX_INPUTS = [float(amount) for amount in range(0, 1200000001, 1000000)]
@@ -0,0 +1,247 @@
+"""
+고정 fixture 기반 성능 벤치마크.
+
+    python -m benchmarks.run_benchmarks --save bench_baseline.json
+    python -m benchmarks.run_benchmarks --compare bench_baseline.json --threshold 0.25
+
+`--compare`는 기준선 대비 best 시간이 threshold 비율을 넘게 느려진 항목이 있으면
+종료 코드 1을 반환한다. 기준선은 같은 머신에서 만든 파일과 비교해야 의미가 있다.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+from copy import deepcopy
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from benchmarks.fixtures import (
+    CAPITAL_GAIN_INPUTS,
+    CORP_PROFIT_INPUTS,
+    DIVIDEND_INPUTS,
+    HEALTH_INSURANCE_INPUTS,
+    PROGRESSIVE_TAX_INPUTS,
+    monthly_health_insurance_inputs,
+    projection_cases,
+)
+from src.backend.api import DividendBackend
+from src.core.projection_engine import ProjectionEngine
+from src.core.tax_engine import TaxEngine
+
+DEFAULTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "defaults")
+DEFAULT_THRESHOLD = 0.25
+
+# 벤치마크 이름 -> 준비 함수. 준비 함수는 fixture를 만든 뒤 측정할 무인자 함수를 반환한다.
+BenchmarkFactory = Callable[[], Callable[[], Any]]
+
+
+def _projection_benchmark(initial_assets: Dict[str, float], params: Dict[str, Any]):
+    def factory() -> Callable[[], Any]:
+        engine = ProjectionEngine(tax_engine=TaxEngine())
+        return lambda: engine.run_30yr_simulation(initial_assets, deepcopy(params))
+
+    return factory
+
+
+def _cost_comparison_benchmark(simulation_mode: str) -> BenchmarkFactory:
+    def factory() -> Callable[[], Any]:
+        data_dir = tempfile.TemporaryDirectory()
+        backend = DividendBackend(
+            data_dir=data_dir.name,
+            defaults_dir=DEFAULTS_DIR,
+            ensure_default_master_bundle=True,
+        )
+        override = {"simulation_mode": simulation_mode}
+
+        def run() -> Any:
+            # 임시 데이터 디렉터리는 측정 함수가 살아 있는 동안 유지한다.
+            _ = data_dir
+            result = backend.run_cost_comparison(override)
+            if not result.get("success"):
+                raise RuntimeError(result.get("message"))
+            return result
+
+        return run
+
+    return factory
+
+
+def _tax_benchmark(method: Callable[[TaxEngine], Callable[[], Any]]) -> BenchmarkFactory:
+    def factory() -> Callable[[], Any]:
+        return method(TaxEngine())
+
+    return factory
+
+
+def _health_insurance(tax_engine: TaxEngine) -> Callable[[], Any]:
+    def run() -> None:
+        for property_value, annual_income in HEALTH_INSURANCE_INPUTS:
+            tax_engine.calculate_local_health_insurance_detailed(property_value, annual_income)
+
+    return run
+
+
+def _monthly_health_insurance(tax_engine: TaxEngine) -> Callable[[], Any]:
+    """30년 월 루프의 소유자별·가계 건강보험료 호출 (월 3회 × 360개월)."""
+    inputs = monthly_health_insurance_inputs()
+
+    def run() -> None:
+        for property_value, annual_income in inputs:
+            tax_engine.calculate_local_health_insurance_detailed(property_value, annual_income)
+
+    return run
+
+
+def _progressive_income_tax(tax_engine: TaxEngine) -> Callable[[], Any]:
+    def run() -> None:
+        for tax_base in PROGRESSIVE_TAX_INPUTS:
+            tax_engine.calculate_progressive_income_tax(tax_base)
+
+    return run
+
+
+def _dividend_tax(tax_engine: TaxEngine) -> Callable[[], Any]:
+    def run() -> None:
+        for gross_dividend in DIVIDEND_INPUTS:
+            tax_engine.calculate_us_dividend_tax(
+                gross_dividend,
+                other_financial_income=5000000,
+                other_comprehensive_tax_base=30000000,
+            )
+
+    return run
+
+
+def _capital_gains_tax(tax_engine: TaxEngine) -> Callable[[], Any]:
+    def run() -> None:
+        for realized_gain in CAPITAL_GAIN_INPUTS:
+            tax_engine.calculate_us_capital_gains_tax(realized_gain)
+
+    return run
+
+
+def _corp_tax(tax_engine: TaxEngine) -> Callable[[], Any]:
+    def run() -> None:
+        for profit in CORP_PROFIT_INPUTS:
+            tax_engine.calculate_corp_tax(profit)
+
+    return run
+
+
+def build_benchmarks() -> Dict[str, BenchmarkFactory]:
+    benchmarks: Dict[str, BenchmarkFactory] = {
+        name: _projection_benchmark(initial_assets, params)
+        for name, (initial_assets, params) in projection_cases().items()
+    }
+    benchmarks["cost_comparison.target"] = _cost_comparison_benchmark("target")
+    benchmarks["cost_comparison.asset"] = _cost_comparison_benchmark("asset")
+    benchmarks["tax.local_health_insurance"] = _tax_benchmark(_health_insurance)
+    benchmarks["tax.monthly_health_insurance"] = _tax_benchmark(_monthly_health_insurance)
+    benchmarks["tax.progressive_income_tax"] = _tax_benchmark(_progressive_income_tax)
+    benchmarks["tax.us_dividend_tax"] = _tax_benchmark(_dividend_tax)
+    benchmarks["tax.us_capital_gains_tax"] = _tax_benchmark(_capital_gains_tax)
+    benchmarks["tax.corp_tax"] = _tax_benchmark(_corp_tax)
+    return benchmarks
+
+
+def measure(run: Callable[[], Any], repeat: int, warmup: int = 1) -> Dict[str, Any]:
+    for _ in range(max(0, warmup)):
+        run()
+    timings: List[float] = []
+    for _ in range(max(1, repeat)):
+        started = perf_counter()
+        run()
+        timings.append(perf_counter() - started)
+    return {
+        "best_seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "repeat": len(timings),
+    }
+
+
+def run_benchmarks(
+    names: Optional[Iterable[str]] = None, repeat: int = 7, warmup: int = 1
+) -> Dict[str, Any]:
+    benchmarks = build_benchmarks()
+    selected = list(names) if names else list(benchmarks)
+    unknown = [name for name in selected if name not in benchmarks]
+    if unknown:
+        raise ValueError(f"알 수 없는 벤치마크입니다: {', '.join(unknown)}")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "benchmarks": {
+            name: measure(benchmarks[name](), repeat=repeat, warmup=warmup) for name in selected
+        },
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """기준선 대비 best 시간이 (1 + threshold)배를 넘은 벤치마크 목록을 반환한다."""
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if not reference or reference["best_seconds"] <= 0:
+            continue
+        ratio = result["best_seconds"] / reference["best_seconds"]
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                {
+                    "name": name,
+                    "baseline_seconds": reference["best_seconds"],
+                    "current_seconds": result["best_seconds"],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="고정 fixture 성능 벤치마크")
+    parser.add_argument("--save", metavar="PATH", help="결과를 기준선 JSON으로 저장")
+    parser.add_argument("--compare", metavar="PATH", help="기준선 JSON과 비교")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--only", nargs="*", help="실행할 벤치마크 이름")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.only, repeat=args.repeat)
+    for name, result in results["benchmarks"].items():
+        print(
+            f"{name:40s} best {result['best_seconds'] * 1000:9.2f} ms"
+            f"  median {result['median_seconds'] * 1000:9.2f} ms"
+        )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"기준선 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, results, args.threshold)
+        for regression in regressions:
+            print(
+                f"[REGRESSION] {regression['name']}: "
+                f"{regression['baseline_seconds'] * 1000:.2f} ms -> "
+                f"{regression['current_seconds'] * 1000:.2f} ms "
+                f"(x{regression['ratio']:.2f})"
+            )
+        if regressions:
+            return 1
+        print(f"회귀 없음 (threshold {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,8 +6,9 @@ from typing import Any, Dict, List, Optional, cast
 
 from src.backend.data_provider import StockDataProvider
 from src.backend.storage import StorageManager
+from src.core.inverse_solver import DEFAULT_SEARCH_LIMIT, linear_breakpoints, solve_monotone_inverse
 from src.core.projection_engine import ProjectionEngine
-from src.core.tax_engine import TaxEngine
+from src.core.tax_engine import INCOME_TAX_BRACKETS, TaxEngine, shared_tax_engine
 
 DEFAULT_APPRECIATION_RATES = {
     "cash_sgov": 0.1,
@@ -1443,6 +1444,9 @@ class DividendBackend:
             "pension_bond_floor_months": pension_rules.get("bond_floor_months", 12),
             "pension_bond_target_months": pension_rules.get("bond_target_months", 18),
             "pension_bond_upper_months": pension_rules.get("bond_upper_months", 24),
+            # 연도별 매도 합계만 쓰므로 월간 행·세금 감사표·거래별 이벤트는 만들지 않는다.
+            "run_mode": "lean",
+            "trade_events_mode": "yearly",
         }
         initial_assets = {
             "corp": initial_balance if account == "corp" else 0.0,
@@ -1452,17 +1456,15 @@ class DividendBackend:
         projection = ProjectionEngine(tax_engine).run_30yr_simulation(initial_assets, params)
         engine_account = account
         schedule: Dict[int, Dict[str, float]] = {}
-        for event in projection.get("trade_events", []):
-            if event.get("account") != engine_account:
+        for annual_trades in projection.get("trade_events_by_year") or []:
+            if annual_trades.get("account") != engine_account:
                 continue
-            year_index = int(event["year"]) - int(assumptions.get("base_year", 2026)) + 1
-            annual = schedule.setdefault(
-                year_index,
-                {"sale_proceeds": 0.0, "cost_basis_sold": 0.0, "realized_gain": 0.0},
-            )
-            annual["sale_proceeds"] += float(event["sale_proceeds"])
-            annual["cost_basis_sold"] += float(event["cost_basis_sold"])
-            annual["realized_gain"] += float(event["realized_gain"])
+            year_index = int(annual_trades["year"]) - int(assumptions.get("base_year", 2026)) + 1
+            schedule[year_index] = {
+                "sale_proceeds": float(annual_trades["sale_proceeds"]),
+                "cost_basis_sold": float(annual_trades["cost_basis_sold"]),
+                "realized_gain": float(annual_trades["realized_gain"]),
+            }
         return schedule
 
     def _calculate_rebalance_income(
@@ -1573,32 +1575,36 @@ class DividendBackend:
         property_value: float,
         assumptions: Dict[str, Any],
     ) -> Dict[str, Any]:
-        low = 0.0
-        dy = max(float(assumptions["dy"]), 0.001)
-        high = max(annual_target_cash / dy * 2, 1000000.0)
-        result = self._calculate_personal_investment_year(
-            tax_engine, high, high, property_value, assumptions
-        )
-        while result["net_cash"] < annual_target_cash and high < 1e15:
-            high *= 2
-            result = self._calculate_personal_investment_year(
-                tax_engine, high, high, property_value, assumptions
-            )
-        if result["net_cash"] < annual_target_cash:
-            return {"required_assets": float("inf"), "result": result}
-        for _ in range(80):
-            mid = (low + high) / 2
-            result = self._calculate_personal_investment_year(
-                tax_engine, mid, mid, property_value, assumptions
+        def net_cash(asset_value: float) -> float:
+            return float(
+                self._calculate_personal_investment_year(
+                    tax_engine, asset_value, asset_value, property_value, assumptions
+                )["net_cash"]
             )
-            if result["net_cash"] >= annual_target_cash:
-                high = mid
-            else:
-                low = mid
+
+        # 배당소득이 종합과세 기준금액·누진구간 경계를 지나는 자산 규모에서 기울기가 바뀐다.
+        # 건강보험료 10원 절사와 금융소득 비율 배분은 선형이 아니므로 그 구간은 Brent로 푼다.
+        other_financial = float(assumptions.get("personal_external_financial_income", 0.0))
+        other_base = max(0.0, float(assumptions.get("personal_other_comprehensive_tax_base", 0.0)))
+        threshold = tax_engine.financial_income_comprehensive_threshold
+        dividend_offsets = [threshold - other_financial] + [
+            upper - other_base + threshold - other_financial
+            for upper, _ in INCOME_TAX_BRACKETS[:-1]
+        ]
+        solution = solve_monotone_inverse(
+            net_cash,
+            annual_target_cash,
+            linear_breakpoints(dividend_offsets, max(0.0, float(assumptions["dy"]))),
+        )
+        required_assets = solution.value
         return {
-            "required_assets": high,
+            "required_assets": required_assets,
             "result": self._calculate_personal_investment_year(
-                tax_engine, high, high, property_value, assumptions
+                tax_engine,
+                min(required_assets, DEFAULT_SEARCH_LIMIT),
+                min(required_assets, DEFAULT_SEARCH_LIMIT),
+                property_value,
+                assumptions,
             ),
         }
 
@@ -1650,23 +1656,13 @@ class DividendBackend:
     def _solve_corporate_required_tax_base(
         self, tax_engine: TaxEngine, required_post_tax_profit: float
     ) -> float:
-        low = 0.0
-        high = max(required_post_tax_profit * 2, 1000000.0)
-
         def post_tax_profit(tax_base: float) -> float:
             return tax_base - tax_engine.calculate_corp_tax(tax_base)
 
-        while post_tax_profit(high) < required_post_tax_profit:
-            high *= 2
-
-        for _ in range(80):
-            mid = (low + high) / 2
-            if post_tax_profit(mid) >= required_post_tax_profit:
-                high = mid
-            else:
-                low = mid
-
-        return high
+        # 법인세는 과세표준 구간 경계에서만 세율이 바뀌는 구간 선형 함수다.
+        return solve_monotone_inverse(
+            post_tax_profit, required_post_tax_profit, [tax_engine.corp_tax_threshold]
+        ).value
 
     def _build_sustainability_summary(self, series: List[Dict[str, Any]]) -> Dict[str, Any]:
         years_fully_funded = 0
@@ -2146,46 +2142,39 @@ class DividendBackend:
         company_insurance_total = gross_salary_annual * (
             tax_engine.pension_rate + tax_engine.health_rate + tax_engine.employment_rate
         )
-        low = 0.0
-        dy = max(float(assumptions["dy"]), 0.001)
-        high = max(annual_target_cash / dy * 2, 1000000.0)
+
+        def household_cash(asset_value: float) -> float:
+            return net_salary_annual + float(
+                self._calculate_corporate_investment_year(
+                    tax_engine,
+                    asset_value,
+                    asset_value,
+                    assumptions,
+                    gross_salary_annual,
+                    fixed_cost_annual,
+                    company_insurance_total,
+                )["net_cash"]
+            )
+
+        # 배당이 고정비를 넘는 지점(과세표준 0)과 법인세 구간 경계에서만 기울기가 바뀐다.
+        annual_costs = gross_salary_annual + fixed_cost_annual + company_insurance_total
+        required_assets = solve_monotone_inverse(
+            household_cash,
+            annual_target_cash,
+            linear_breakpoints(
+                [annual_costs, annual_costs + tax_engine.corp_tax_threshold],
+                max(0.0, float(assumptions["dy"])),
+            ),
+        ).value
         required_result = self._calculate_corporate_investment_year(
             tax_engine,
-            high,
-            high,
+            min(required_assets, DEFAULT_SEARCH_LIMIT),
+            min(required_assets, DEFAULT_SEARCH_LIMIT),
             assumptions,
             gross_salary_annual,
             fixed_cost_annual,
             company_insurance_total,
         )
-        while net_salary_annual + required_result["net_cash"] < annual_target_cash:
-            high *= 2
-            required_result = self._calculate_corporate_investment_year(
-                tax_engine,
-                high,
-                high,
-                assumptions,
-                gross_salary_annual,
-                fixed_cost_annual,
-                company_insurance_total,
-            )
-        for _ in range(80):
-            mid = (low + high) / 2
-            candidate = self._calculate_corporate_investment_year(
-                tax_engine,
-                mid,
-                mid,
-                assumptions,
-                gross_salary_annual,
-                fixed_cost_annual,
-                company_insurance_total,
-            )
-            if net_salary_annual + candidate["net_cash"] >= annual_target_cash:
-                high = mid
-                required_result = candidate
-            else:
-                low = mid
-        required_assets = high
         annual_revenue = required_assets * tr
         required_tax_base = float(required_result["tax_base"])
         corp_tax = float(required_result["corp_tax"])
@@ -2368,7 +2357,7 @@ class DividendBackend:
         corporate_config = cast(Dict[str, Any], effective_config.get("corporate", {}))
         if corporate_config.get("corp_tax_nominal_rate") is not None:
             tax_config["corp_tax_nominal_rate"] = corporate_config["corp_tax_nominal_rate"]
-        tax_engine = TaxEngine(config=tax_config)
+        tax_engine = shared_tax_engine(tax_config)
 
         simulation_mode = effective_config.get("simulation_mode", "target")
 
@@ -3152,6 +3141,35 @@ class DividendBackend:
         self._ensure_seeded_defaults_if_enabled()
         return next((m for m in self.master_portfolios if m.get("is_active")), None)
 
+    def get_master_portfolio_holdings(self) -> Dict[str, List[Dict[str, Any]]]:
+        """활성 마스터 전략(없으면 계좌 타입별 첫 포트폴리오)의 계좌별 보유 종목을 반환합니다."""
+        active_m = self.get_active_master_portfolio()
+        holdings: Dict[str, List[Dict[str, Any]]] = {}
+        for account_key, id_key, account_type in (
+            ("corp", "corp_id", "Corporate"),
+            ("pension", "pension_id", "Pension"),
+            ("personal", "personal_id", "Personal"),
+        ):
+            if active_m:
+                portfolio = self.get_portfolio_by_id(active_m.get(id_key))
+            else:
+                fallback = next(
+                    (p for p in self.get_portfolios() if p.get("account_type") == account_type),
+                    None,
+                )
+                portfolio = self.get_portfolio_by_id(fallback["id"]) if fallback else None
+            if not portfolio:
+                continue
+            holdings[account_key] = [
+                {
+                    "symbol": item.get("symbol"),
+                    "category": item.get("category"),
+                    "weight": item.get("weight", 0.0),
+                }
+                for item in portfolio.get("items") or []
+            ]
+        return holdings
+
     def update_portfolio(self, p_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """특정 포트폴리오의 정보를 업데이트합니다. [REQ-PRT-04.2]"""
         for p in self.portfolios:
@@ -1,6 +1,8 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from pathlib import Path
+from threading import Lock
 from typing import Any, Dict, List, Optional
 
 from fastapi import FastAPI, HTTPException
@@ -8,9 +10,15 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from src.backend.api import DividendBackend
+from src.core.backtest_engine import HistoricalBacktestEngine
+from src.core.historical_series import HistoricalSeries, resolve_series_file
+from src.core.mc_state import WORST_PATH_SAMPLES
+from src.core.monte_carlo_engine import MonteCarloEngine
 from src.core.projection_engine import ProjectionEngine
+from src.core.projection_output import OUTPUT_FORMATS, OUTPUT_RESOLUTIONS
+from src.core.spending_solver import SustainableSpendingSolver
 from src.core.stress_engine import StressTestEngine
-from src.core.tax_engine import TaxEngine
+from src.core.tax_engine import TaxEngine, shared_tax_engine
 
 
 def _apply_profile_return_override(
@@ -74,6 +82,9 @@ def _get_default_data_dir() -> str:
 BACKEND_ROOT = Path(__file__).resolve().parents[2]
 DEFAULTS_DIR = str(BACKEND_ROOT / "defaults")
 DATA_DIR = os.getenv("APP_DATA_DIR", _get_default_data_dir())
+# 백테스트용 월간 수익률 시계열(CSV/Parquet) 폴더. 요청은 이 폴더 안의 파일 이름만 지정할 수 있다.
+HISTORY_DIR = os.getenv("APP_HISTORY_DIR", str(Path(DATA_DIR) / "history"))
+HISTORY_SERIES_ERROR = "시계열을 읽을 수 없습니다. 데이터 폴더의 파일 이름과 형식을 확인해주세요."
 app = FastAPI(title="Dividend Portfolio Manager API")
 backend = DividendBackend(
     data_dir=DATA_DIR,
@@ -84,6 +95,24 @@ backend = DividendBackend(
 tax_engine = TaxEngine()
 projection_engine = ProjectionEngine(tax_engine=tax_engine)
 stress_engine = StressTestEngine()
+MONTE_CARLO_MAX_PATHS = 20000
+# 스트리밍 집계(경로 수와 무관한 메모리)일 때의 경로 수 상한. 요청 하나가 워커 스레드를
+# 수십 초씩 붙잡지 않도록 대화형 응답 시간 안에 끝나는 크기로 둔다.
+MONTE_CARLO_STREAMING_MAX_PATHS = 50000
+# 스트레스 배치 등 배치 실행이 함께 쓰는 프로세스 풀 크기. 요청마다 풀을 새로 띄우지 않는다.
+SIMULATION_WORKERS = max(1, int(os.getenv("APP_SIMULATION_WORKERS", min(4, os.cpu_count() or 1))))
+_simulation_pool: Optional[ProcessPoolExecutor] = None
+_simulation_pool_lock = Lock()
+
+
+def _shared_simulation_pool() -> ProcessPoolExecutor:
+    """처음 필요할 때 한 번 만든 공유 프로세스 풀 (동시 요청이 같은 워커 수 상한을 나눠 쓴다)"""
+    global _simulation_pool
+    with _simulation_pool_lock:
+        if _simulation_pool is None:
+            _simulation_pool = ProcessPoolExecutor(max_workers=SIMULATION_WORKERS)
+        return _simulation_pool
+
 
 app.add_middleware(
     CORSMiddleware,
@@ -155,6 +184,38 @@ class MasterPortfolioRequest(BaseModel):
     personal_id: Optional[str] = None
 
 
+class StressBatchRequest(BaseModel):
+    scenario: Optional[str] = None
+    pa_scenario: Optional[str] = None
+    # 시나리오 ID 문자열 또는 {"scenario": "BEAR+DIVIDEND_CUT", "shocks": {...}, "label": ...}
+    stress_scenarios: Optional[List[Any]] = None
+    shocks: Optional[Dict[str, float]] = None
+
+
+class BacktestRequest(BaseModel):
+    # HISTORY_DIR 안의 시계열 파일 이름 또는 확장자 없는 데이터셋 ID
+    series: str
+    scenario: Optional[str] = None
+    pa_scenario: Optional[str] = None
+    start_from: Optional[str] = None
+    start_until: Optional[str] = None
+    step_months: int = 1
+    detail_starts: Optional[List[str]] = None
+
+
+class BootstrapRequest(BaseModel):
+    # HISTORY_DIR 안의 시계열 파일 이름 또는 확장자 없는 데이터셋 ID
+    series: str
+    scenario: Optional[str] = None
+    stress_scenario: Optional[str] = None
+    pa_scenario: Optional[str] = None
+    paths: int = 1000
+    block_months: int = 12
+    seed: Optional[int] = None
+    replay_worst: int = 0
+    streaming: bool = False
+
+
 class TestStateRequest(BaseModel):
     data: Dict[str, Any]
 
@@ -300,12 +361,12 @@ async def run_cost_comparison(req: Optional[CostComparisonConfigRequest] = None)
     return backend.run_cost_comparison(config_override)
 
 
-@app.get("/api/retirement/simulate")
-async def run_retirement_simulation(
-    scenario: Optional[str] = None,
-    stress_scenario: Optional[str] = None,
-    pa_scenario: Optional[str] = None,
-):
+def _prepare_retirement_simulation(
+    scenario: Optional[str],
+    stress_scenario: Optional[str],
+    pa_scenario: Optional[str],
+) -> Dict[str, Any]:
+    """설정 검증부터 스트레스 시나리오 적용까지 은퇴 시뮬레이션 입력을 조립한다."""
     config = backend.get_retirement_config()
     if not config:
         return {"success": False, "message": "설정 데이터가 없습니다."}
@@ -602,29 +663,46 @@ async def run_retirement_simulation(
 
     # 5. 세무 엔진 최신화
     tax_config = config["tax_and_insurance"]
-    current_tax_engine = TaxEngine(config=tax_config)
-    projection_engine.tax_engine = current_tax_engine
+    current_tax_engine = shared_tax_engine(tax_config)
 
     # 6. 스트레스 테스트 시나리오 적용 (필요 시)
+    # BEAR+DIVIDEND_CUT처럼 '+'로 합성한 시나리오도 허용한다.
     final_params = base_params
     normalized_stress_scenario = None
-    valid_stress_scenarios = {"BEAR", "STAGFLATION", "DIVIDEND_CUT"}
     if stress_scenario:
-        normalized_stress_scenario = stress_scenario.upper()
-        if normalized_stress_scenario not in valid_stress_scenarios:
+        try:
+            components = stress_engine.parse_scenario(stress_scenario)
+        except ValueError:
             return {
                 "success": False,
                 "message": (
                     "지원하지 않는 stress scenario입니다. "
-                    "BEAR, STAGFLATION, DIVIDEND_CUT 중 하나를 사용해주세요."
+                    "BEAR, STAGFLATION, DIVIDEND_CUT 중 하나 또는 '+' 조합을 사용해주세요."
                 ),
             }
-        final_params = stress_engine.apply_scenario(base_params, normalized_stress_scenario)
+        if components:
+            normalized_stress_scenario = "+".join(components)
+            final_params = stress_engine.apply_scenario(base_params, normalized_stress_scenario)
+
+    return {
+        "success": True,
+        "initial_assets": initial_assets,
+        "params": final_params,
+        "tax_engine": current_tax_engine,
+        "stress_scenario": normalized_stress_scenario,
+        "portfolio_stats": base_params["portfolio_stats"],
+        "strategy_rules": strategy_rules,
+    }
 
-    # 7. 엔진 실행
-    result = projection_engine.run_30yr_simulation(initial_assets, final_params)
 
-    # [REQ-UI-05] 사용된 마스터 전략 및 포트폴리오 정보 메타데이터 추가
+def _build_retirement_meta(prepared: Dict[str, Any], pa_scenario: Optional[str]) -> Dict[str, Any]:
+    """[REQ-UI-05] 사용된 마스터 전략 및 포트폴리오 정보 메타데이터를 구성한다."""
+    corp_stats = prepared["portfolio_stats"]["corp"]
+    pension_stats = prepared["portfolio_stats"]["pension"]
+    personal_stats = prepared["portfolio_stats"]["personal"]
+    strategy_rules = prepared["strategy_rules"]
+    corporate_rules = strategy_rules.get("corporate", {})
+    pension_rules = strategy_rules.get("pension", {})
     active_m = backend.get_active_master_portfolio()
     if active_m:
         corp_p = backend.get_portfolio_by_id(active_m.get("corp_id"))
@@ -674,7 +752,7 @@ async def run_retirement_simulation(
             combined_dy = personal_stats.get("dividend_yield", 0.0)
             combined_tr = personal_stats.get("expected_return", 0.0)
 
-    result["meta"] = {
+    return {
         "master_name": active_m["name"] if active_m else "None (Manual)",
         "master_yield": combined_dy,  # DY 표시용
         "master_tr": combined_tr,  # TR 표시용
@@ -682,7 +760,7 @@ async def run_retirement_simulation(
         "combined_tr": combined_tr,
         "pa_rate": combined_tr - combined_dy if (combined_tr and combined_dy) else 0.0,
         "pa_scenario": backend._normalize_pa_scenario(pa_scenario),
-        "stress_scenario": normalized_stress_scenario,
+        "stress_scenario": prepared["stress_scenario"],
         "strategy_rules_summary": {
             "rebalance_month": strategy_rules.get("rebalance_month", 5),
             "corporate_sgov_target_months": corporate_rules.get("sgov_target_months", 30),
@@ -709,6 +787,220 @@ async def run_retirement_simulation(
         },
     }
 
+
+@app.get("/api/retirement/simulate")
+def run_retirement_simulation(
+    scenario: Optional[str] = None,
+    stress_scenario: Optional[str] = None,
+    pa_scenario: Optional[str] = None,
+    output_resolution: str = "monthly",
+    output_format: str = "rows",
+    debug: bool = False,
+):
+    if output_resolution not in OUTPUT_RESOLUTIONS:
+        return {
+            "success": False,
+            "message": f"output_resolution은 {', '.join(OUTPUT_RESOLUTIONS)} 중 하나여야 합니다.",
+        }
+    if output_format not in OUTPUT_FORMATS:
+        return {
+            "success": False,
+            "message": f"output_format은 {', '.join(OUTPUT_FORMATS)} 중 하나여야 합니다.",
+        }
+    prepared = _prepare_retirement_simulation(scenario, stress_scenario, pa_scenario)
+    if not prepared["success"]:
+        return prepared
+
+    prepared["params"]["output_resolution"] = output_resolution
+    prepared["params"]["output_format"] = output_format
+    # 현금흐름 일정만 바꿔 다시 조회하면 바뀐 달 이전 구간은 캐시된 체크포인트를 재사용한다.
+    # debug 조회는 전 구간 단계별 계측(`profile`)을 위해 처음부터 실행한다.
+    prepared["params"]["reuse_cached_prefix"] = not debug
+    prepared["params"]["profile"] = debug
+    with projection_engine.using_tax_engine(prepared["tax_engine"]):
+        result = projection_engine.run_30yr_simulation(
+            prepared["initial_assets"], prepared["params"]
+        )
+    result["meta"] = _build_retirement_meta(prepared, pa_scenario)
+    return {"success": True, "data": result}
+
+
+def _validate_monte_carlo_paths(paths: int, streaming: bool) -> Optional[Dict[str, Any]]:
+    limit = MONTE_CARLO_STREAMING_MAX_PATHS if streaming else MONTE_CARLO_MAX_PATHS
+    if 1 <= paths <= limit:
+        return None
+    return {"success": False, "message": f"paths는 1 이상 {limit} 이하로 지정해주세요."}
+
+
+@app.get("/api/retirement/monte-carlo")
+def run_retirement_monte_carlo(
+    scenario: Optional[str] = None,
+    stress_scenario: Optional[str] = None,
+    pa_scenario: Optional[str] = None,
+    paths: int = 1000,
+    seed: Optional[int] = None,
+    streaming: bool = False,
+):
+    """벡터화 몬테카를로 생존확률 및 자산/SGOV 커버 개월/가계현금 백분위 밴드"""
+    invalid = _validate_monte_carlo_paths(paths, streaming)
+    if invalid is not None:
+        return invalid
+    prepared = _prepare_retirement_simulation(scenario, stress_scenario, pa_scenario)
+    if not prepared["success"]:
+        return prepared
+
+    with projection_engine.using_tax_engine(prepared["tax_engine"]):
+        result = MonteCarloEngine(projection_engine).run(
+            prepared["initial_assets"],
+            prepared["params"],
+            paths=paths,
+            seed=seed,
+            streaming=streaming,
+        )
+    result["meta"] = {**_build_retirement_meta(prepared, pa_scenario), **result["meta"]}
+    return {"success": True, "data": result}
+
+
+@app.get("/api/retirement/monte-carlo/path")
+def replay_retirement_monte_carlo_path(
+    seed: int,
+    path: int,
+    scenario: Optional[str] = None,
+    stress_scenario: Optional[str] = None,
+    pa_scenario: Optional[str] = None,
+):
+    """몬테카를로 결과 meta의 seed와 경로 번호로 그 경로 하나의 월별 값을 다시 계산"""
+    prepared = _prepare_retirement_simulation(scenario, stress_scenario, pa_scenario)
+    if not prepared["success"]:
+        return prepared
+
+    try:
+        with projection_engine.using_tax_engine(prepared["tax_engine"]):
+            result = MonteCarloEngine(projection_engine).replay_path(
+                prepared["initial_assets"], prepared["params"], seed=seed, path=path
+            )
+    except ValueError as exc:
+        return {"success": False, "message": str(exc)}
+    result["meta"] = _build_retirement_meta(prepared, pa_scenario)
+    return {"success": True, "data": result}
+
+
+def _load_history_series(name: str) -> Optional[HistoricalSeries]:
+    """HISTORY_DIR 안의 시계열만 읽는다. 실패 이유(파일 내용 포함)는 응답에 싣지 않는다."""
+    try:
+        return HistoricalSeries.load(resolve_series_file(HISTORY_DIR, name))
+    except (OSError, ImportError, ValueError):
+        return None
+
+
+@app.post("/api/retirement/monte-carlo/bootstrap")
+def run_retirement_bootstrap(req: BootstrapRequest):
+    """HISTORY_DIR 시계열 카테고리 수익률 블록 부트스트랩 생존확률·최초 미충족 분포·최악 10% 경로"""
+    invalid = _validate_monte_carlo_paths(req.paths, req.streaming)
+    if invalid is not None:
+        return invalid
+    prepared = _prepare_retirement_simulation(req.scenario, req.stress_scenario, req.pa_scenario)
+    if not prepared["success"]:
+        return prepared
+    series = _load_history_series(req.series)
+    if series is None:
+        return {"success": False, "message": HISTORY_SERIES_ERROR}
+
+    try:
+        with projection_engine.using_tax_engine(prepared["tax_engine"]):
+            result = MonteCarloEngine(projection_engine).run_bootstrap(
+                prepared["initial_assets"],
+                prepared["params"],
+                series,
+                backend.get_master_portfolio_holdings(),
+                paths=req.paths,
+                block_months=req.block_months,
+                seed=req.seed,
+                replay_worst=max(0, min(req.replay_worst, WORST_PATH_SAMPLES)),
+                streaming=req.streaming,
+            )
+    except ValueError as exc:
+        return {"success": False, "message": f"부트스트랩을 실행할 수 없습니다: {exc}"}
+    result["meta"] = {**_build_retirement_meta(prepared, req.pa_scenario), **result["meta"]}
+    return {"success": True, "data": result}
+
+
+@app.get("/api/retirement/max-sustainable-need")
+def solve_max_sustainable_need(
+    scenario: Optional[str] = None,
+    stress_scenario: Optional[str] = None,
+    pa_scenario: Optional[str] = None,
+    target_ending_real_assets: Optional[float] = None,
+    tolerance: float = 10000.0,
+):
+    """전 기간 가계 부족 없이 생존(또는 목표 기말 실질자산 도달)하는 최대 월 생활비 탐색"""
+    if tolerance <= 0:
+        return {"success": False, "message": "tolerance는 0보다 커야 합니다."}
+    prepared = _prepare_retirement_simulation(scenario, stress_scenario, pa_scenario)
+    if not prepared["success"]:
+        return prepared
+
+    with projection_engine.using_tax_engine(prepared["tax_engine"]):
+        result = SustainableSpendingSolver(projection_engine).solve(
+            prepared["initial_assets"],
+            prepared["params"],
+            target_ending_real_assets=target_ending_real_assets,
+            tolerance=tolerance,
+        )
+    result["meta"] = _build_retirement_meta(prepared, pa_scenario)
+    return {"success": True, "data": result}
+
+
+@app.post("/api/retirement/stress-batch")
+def run_retirement_stress_batch(req: Optional[StressBatchRequest] = None):
+    """기준선·스트레스(합성·사용자 충격 크기 포함) 시나리오를 한 번에 실행해 요약을 나란히 비교"""
+    req = req or StressBatchRequest()
+    prepared = _prepare_retirement_simulation(req.scenario, None, req.pa_scenario)
+    if not prepared["success"]:
+        return prepared
+
+    try:
+        with projection_engine.using_tax_engine(prepared["tax_engine"]):
+            result = stress_engine.run_batch(
+                projection_engine,
+                prepared["initial_assets"],
+                prepared["params"],
+                req.stress_scenarios,
+                shocks=req.shocks,
+                executor=_shared_simulation_pool(),
+            )
+    except ValueError as exc:
+        return {"success": False, "message": str(exc)}
+    result["meta"] = _build_retirement_meta(prepared, req.pa_scenario)
+    return {"success": True, "data": result}
+
+
+@app.post("/api/retirement/backtest")
+def run_retirement_backtest(req: BacktestRequest):
+    """HISTORY_DIR의 CSV/Parquet 월간 수익률 시계열로 시작 월별 롤링 백테스트를 실행"""
+    prepared = _prepare_retirement_simulation(req.scenario, None, req.pa_scenario)
+    if not prepared["success"]:
+        return prepared
+    series = _load_history_series(req.series)
+    if series is None:
+        return {"success": False, "message": HISTORY_SERIES_ERROR}
+
+    try:
+        with projection_engine.using_tax_engine(prepared["tax_engine"]):
+            result = HistoricalBacktestEngine(projection_engine).run(
+                prepared["initial_assets"],
+                prepared["params"],
+                series,
+                backend.get_master_portfolio_holdings(),
+                start_from=req.start_from,
+                start_until=req.start_until,
+                step_months=req.step_months,
+                detail_starts=req.detail_starts or (),
+                executor=_shared_simulation_pool(),
+            )
+    except ValueError as exc:
+        return {"success": False, "message": f"백테스트를 실행할 수 없습니다: {exc}"}
+    result["meta"] = _build_retirement_meta(prepared, req.pa_scenario)
     return {"success": True, "data": result}
 
 
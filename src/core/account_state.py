@@ -0,0 +1,103 @@
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+CATEGORY_ORDER = (
+    "SGOV Buffer",
+    "Bond Buffer",
+    "High Income",
+    "Dividend Growth",
+    "Growth Engine",
+)
+CATEGORY_INDEX = {category: index for index, category in enumerate(CATEGORY_ORDER)}
+SGOV_INDEX = CATEGORY_INDEX["SGOV Buffer"]
+EQUITY_INDEXES = (
+    CATEGORY_INDEX["High Income"],
+    CATEGORY_INDEX["Dividend Growth"],
+    CATEGORY_INDEX["Growth Engine"],
+)
+
+
+class CategoryArray(MutableMapping):
+    """
+    [Domain Layer] 카테고리 고정 인덱스 float 배열
+    CATEGORY_ORDER 순서의 리스트(`data`)에 값을 보관하고, 기존 호출부를 위해
+    `Dict[str, float]`과 같은 카테고리 키 조회/대입 뷰를 제공한다.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, values: Optional[Mapping[str, float]] = None) -> None:
+        self.data: List[float] = [0.0] * len(CATEGORY_ORDER)
+        if values:
+            for category, value in values.items():
+                self.data[CATEGORY_INDEX[category]] = value
+
+    def __getitem__(self, category: str) -> float:
+        return self.data[CATEGORY_INDEX[category]]
+
+    def __setitem__(self, category: str, value: float) -> None:
+        self.data[CATEGORY_INDEX[category]] = value
+
+    def __delitem__(self, category: str) -> None:
+        raise TypeError("CategoryArray는 고정 카테고리 배열이므로 키를 삭제할 수 없습니다.")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(CATEGORY_ORDER)
+
+    def __len__(self) -> int:
+        return len(CATEGORY_ORDER)
+
+    def __contains__(self, category: object) -> bool:
+        return category in CATEGORY_INDEX
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CategoryArray):
+            return self.data == other.data
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CategoryArray({self.to_dict()!r})"
+
+    def get(self, category: str, default: Any = None) -> Any:
+        index = CATEGORY_INDEX.get(category)
+        return default if index is None else self.data[index]
+
+    def keys(self) -> Tuple[str, ...]:  # type: ignore[override]
+        return CATEGORY_ORDER
+
+    def values(self) -> List[float]:  # type: ignore[override]
+        return list(self.data)
+
+    def items(self) -> List[Tuple[str, float]]:  # type: ignore[override]
+        return list(zip(CATEGORY_ORDER, self.data))
+
+    def copy(self) -> "CategoryArray":
+        clone = CategoryArray()
+        clone.data = list(self.data)
+        return clone
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(zip(CATEGORY_ORDER, self.data))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "CategoryArray":
+        return self.copy()
+
+
+class AccountState:
+    """계좌 하나의 잔액·취득원가·분배금 run-rate를 같은 인덱스의 병렬 배열로 보관한다."""
+
+    __slots__ = ("key", "balances", "cost_basis", "run_rates")
+
+    def __init__(
+        self,
+        key: str,
+        balances: Mapping[str, float],
+        cost_basis: Optional[Mapping[str, float]] = None,
+        run_rates: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        self.key = key
+        self.balances = CategoryArray(balances)
+        self.cost_basis = CategoryArray(balances if cost_basis is None else cost_basis)
+        self.run_rates = CategoryArray(run_rates)
@@ -0,0 +1,143 @@
+from concurrent.futures import Executor
+from copy import deepcopy
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import numpy as np
+
+from src.core.historical_series import HistoricalSeries, build_return_overrides, month_key
+from src.core.projection_engine import ProjectionEngine
+from src.core.projection_output import SUMMARY_COMPARISON_FIELDS
+
+
+class HistoricalBacktestEngine:
+    """
+    [Domain Layer] 역사적 수익률 백테스트 엔진
+    과거 월별 수익률 시계열을 `monthly_return_overrides`로 주입해, 같은 운용 규칙(5월 점검·
+    11월 리밸런싱·Crash20 등)이 시작 시점별 과거 수익률 순서를 어떻게 견뎠는지 재현한다.
+    시뮬레이션 달력은 그대로 두고 시작 월부터의 과거 수익률을 차례로 대입하며, 과거 데이터가
+    끝난 이후 달은 기존 수익률 가정으로 계산한다. 위험자산 분배금은 엔진의 run-rate 규칙을
+    그대로 따르므로, 과거 분배수익률은 SGOV 현금 수익에만 직접 쓰인다.
+    """
+
+    def __init__(self, projection_engine: ProjectionEngine) -> None:
+        self.projection_engine = projection_engine
+
+    def run(
+        self,
+        initial_assets: Dict[str, float],
+        params: Dict[str, Any],
+        series: HistoricalSeries,
+        holdings: Mapping[str, Iterable[Mapping[str, Any]]],
+        *,
+        start_from: Optional[str] = None,
+        start_until: Optional[str] = None,
+        step_months: int = 1,
+        detail_starts: Iterable[str] = (),
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Dict[str, Any]:
+        """`start_from`~`start_until` 사이 시작 월마다 롤링 백테스트를 (병렬로) 실행한다."""
+        if step_months < 1:
+            raise ValueError("step_months는 1 이상이어야 합니다.")
+        category_returns, unmapped = series.category_returns(holdings)
+        if not category_returns:
+            raise ValueError("시계열과 매칭되는 보유 종목이 없습니다.")
+
+        month_index = {month: index for index, month in enumerate(series.months)}
+        first = month_index.get(month_key(start_from), -1) if start_from else 0
+        last = (
+            month_index.get(month_key(start_until), -1) if start_until else len(series.months) - 1
+        )
+        if first < 0 or last < 0:
+            raise ValueError(
+                f"시작 월은 {series.months[0]}~{series.months[-1]} 범위 안이어야 합니다."
+            )
+        start_indexes = list(range(first, last + 1, step_months))
+        detail_months = {month_key(start) for start in detail_starts}
+        for start in detail_months:
+            if start not in month_index:
+                raise ValueError(f"상세 시작 월이 시계열 범위 밖입니다: {start}")
+            if month_index[start] not in start_indexes:
+                start_indexes.append(month_index[start])
+        start_indexes.sort()
+        if not start_indexes:
+            raise ValueError("실행할 시작 월이 없습니다.")
+
+        months = int(params.get("simulation_years", 30)) * 12
+        start_year = int(params.get("simulation_start_year", 2026))
+        start_month = int(params.get("simulation_start_month", 1))
+        calendar = [
+            (start_year + (start_month + offset - 1) // 12, (start_month + offset - 1) % 12 + 1)
+            for offset in range(months)
+        ]
+
+        params_list = []
+        historical_months_by_start = []
+        for start_index in start_indexes:
+            historical, historical_months = build_return_overrides(
+                category_returns, start_index, calendar
+            )
+            overrides = deepcopy(params.get("monthly_return_overrides") or {})
+            for account_key, account_overrides in historical.items():
+                for category, monthly in account_overrides.items():
+                    overrides.setdefault(account_key, {}).setdefault(category, {}).update(monthly)
+            detail = series.months[start_index] in detail_months
+            params_list.append(
+                {
+                    **params,
+                    "monthly_return_overrides": overrides,
+                    "run_mode": "full" if detail else "lean",
+                    "output_resolution": "yearly" if detail else "monthly",
+                    "trade_events_mode": "yearly" if detail else "none",
+                    "reuse_cached_prefix": False,
+                    "checkpoint_interval_months": 0,
+                    "profile": False,
+                }
+            )
+            historical_months_by_start.append(historical_months)
+
+        results = self.projection_engine.run_batch(
+            initial_assets, params_list, max_workers=max_workers, executor=executor
+        )
+
+        starts = []
+        details = {}
+        for start_index, historical_months, result in zip(
+            start_indexes, historical_months_by_start, results
+        ):
+            start = series.months[start_index]
+            summary = result["summary"]
+            starts.append(
+                {
+                    "start": start,
+                    "historical_months": historical_months,
+                    "sustained": bool(summary["is_permanent"])
+                    and not summary["cumulative_household_shortfall"],
+                    **{field: summary.get(field) for field in SUMMARY_COMPARISON_FIELDS},
+                }
+            )
+            if start in detail_months:
+                details[start] = {
+                    "summary": summary,
+                    "yearly_data": result["monthly_data"],
+                    "trade_events_by_year": result["trade_events_by_year"],
+                }
+
+        ending_values = np.array([row["ending_total_net_worth"] for row in starts], dtype=float)
+        worst = starts[int(np.argmin(ending_values))]
+        sustained_runs = sum(1 for row in starts if row["sustained"])
+        return {
+            "history_start": series.months[0],
+            "history_end": series.months[-1],
+            "aggregate": {
+                "runs": len(starts),
+                "sustained_runs": sustained_runs,
+                "success_rate": sustained_runs / len(starts),
+                "median_ending_total_net_worth": float(np.median(ending_values)),
+                "worst_start": worst["start"],
+                "worst_ending_total_net_worth": worst["ending_total_net_worth"],
+            },
+            "starts": starts,
+            "details": details,
+            "unmapped_holdings": unmapped,
+        }
@@ -0,0 +1,205 @@
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.core.account_state import CATEGORY_INDEX, CATEGORY_ORDER
+
+_MONTH_PATTERN = re.compile(r"^(\d{4})-(\d{2})")
+# 입력 파일 열 이름 별칭 (앞쪽이 우선)
+_TICKER_COLUMNS = ("ticker", "symbol")
+_DATE_COLUMNS = ("date", "month")
+# 읽을 수 있는 시계열 파일 확장자 (데이터셋 ID로 찾을 때도 이 순서로 찾는다)
+SERIES_FILE_SUFFIXES = (".csv", ".parquet", ".pq")
+
+# 계좌 -> (카테고리별 월 총수익률, 카테고리별 월 분배수익률), 각 배열은 (월, CATEGORY_ORDER) 모양
+CategoryReturns = Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+
+def month_key(value: Any) -> str:
+    match = _MONTH_PATTERN.match(str(value).strip())
+    if not match or not 1 <= int(match.group(2)) <= 12:
+        raise ValueError(f"월 형식(YYYY-MM[-DD])이 아닌 날짜입니다: {value}")
+    return f"{match.group(1)}-{match.group(2)}"
+
+
+def resolve_series_file(directory: Union[str, Path], name: str) -> Path:
+    """
+    데이터 폴더 안의 시계열 파일 경로를 찾는다. `name`은 파일 이름(`history.csv`)이나 확장자 없는
+    데이터셋 ID(`history`)만 받으며, 경로 구분자·`..`·절대 경로가 들어 있으면 거부한다.
+    """
+    name = str(name or "").strip()
+    if not name or name in (".", "..") or "/" in name or "\\" in name or Path(name).is_absolute():
+        raise ValueError("시계열은 데이터 폴더 안의 파일 이름이나 데이터셋 ID로 지정해주세요.")
+    root = Path(directory).resolve()
+    suffix = Path(name).suffix.lower()
+    if suffix:
+        if suffix not in SERIES_FILE_SUFFIXES:
+            raise ValueError(f"지원하지 않는 시계열 파일 형식입니다: {suffix}")
+        candidates = [root / name]
+    else:
+        candidates = [root / f"{name}{suffix}" for suffix in SERIES_FILE_SUFFIXES]
+    for candidate in candidates:
+        # 심볼릭 링크로 폴더 밖을 가리키는 파일도 받지 않는다.
+        resolved = candidate.resolve()
+        if resolved.parent == root and resolved.is_file():
+            return resolved
+    raise FileNotFoundError(f"데이터 폴더에 시계열이 없습니다: {name}")
+
+
+def _pick_column(frame: pd.DataFrame, candidates: Sequence[str]) -> str:
+    for name in candidates:
+        if name in frame.columns:
+            return name
+    raise ValueError(f"시계열 파일에 {' 또는 '.join(candidates)} 열이 없습니다.")
+
+
+class HistoricalSeries:
+    """
+    [Domain Layer] 티커별 월간 총수익률·분배수익률 시계열
+    연속된 공통 월 축 위의 (티커, 월) 배열로 보관하며, 값이 없는 달은 NaN이다.
+    수익률은 모두 월 단위 소수(0.01 = 1%)이고, 가격 수익률은 총수익률 - 분배수익률이다.
+    """
+
+    __slots__ = ("months", "tickers", "total_returns", "distribution_yields")
+
+    def __init__(
+        self,
+        months: List[str],
+        tickers: List[str],
+        total_returns: np.ndarray,
+        distribution_yields: np.ndarray,
+    ) -> None:
+        self.months = months
+        self.tickers = tickers
+        self.total_returns = total_returns
+        self.distribution_yields = distribution_yields
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "HistoricalSeries":
+        """
+        CSV 또는 Parquet 파일을 읽는다. 열은 `ticker`(또는 `symbol`), `date`(또는 `month`,
+        YYYY-MM[-DD]), `total_return`, 선택 열 `distribution_yield`이다.
+        """
+        path = Path(path)
+        suffix = path.suffix.lower()
+        if suffix == ".csv":
+            frame = pd.read_csv(path)
+        elif suffix in (".parquet", ".pq"):
+            frame = pd.read_parquet(path)
+        else:
+            raise ValueError(f"지원하지 않는 시계열 파일 형식입니다: {path.suffix}")
+        return cls.from_frame(frame)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "HistoricalSeries":
+        ticker_column = _pick_column(frame, _TICKER_COLUMNS)
+        date_column = _pick_column(frame, _DATE_COLUMNS)
+        if "total_return" not in frame.columns:
+            raise ValueError("시계열 파일에 total_return 열이 없습니다.")
+        if frame.empty:
+            raise ValueError("시계열 파일에 데이터가 없습니다.")
+
+        month_keys = [month_key(value) for value in frame[date_column]]
+        month_numbers = np.array(
+            [int(key[:4]) * 12 + int(key[5:]) - 1 for key in month_keys], dtype=np.int64
+        )
+        first_month = int(month_numbers.min())
+        month_count = int(month_numbers.max()) - first_month + 1
+        months = [
+            f"{(first_month + offset) // 12}-{(first_month + offset) % 12 + 1:02d}"
+            for offset in range(month_count)
+        ]
+
+        ticker_labels = frame[ticker_column].astype(str).str.strip().str.upper()
+        tickers = sorted(set(ticker_labels))
+        ticker_index = {ticker: index for index, ticker in enumerate(tickers)}
+        rows = np.array([ticker_index[ticker] for ticker in ticker_labels], dtype=np.int64)
+        columns = month_numbers - first_month
+
+        total_returns = np.full((len(tickers), month_count), np.nan)
+        distribution_yields = np.full((len(tickers), month_count), np.nan)
+        total_returns[rows, columns] = frame["total_return"].astype(float).to_numpy()
+        if "distribution_yield" in frame.columns:
+            distributions = frame["distribution_yield"].astype(float).fillna(0.0).to_numpy()
+        else:
+            distributions = np.zeros(len(frame))
+        distribution_yields[rows, columns] = distributions
+        return cls(months, tickers, total_returns, distribution_yields)
+
+    def category_returns(
+        self, holdings: Mapping[str, Iterable[Mapping[str, Any]]]
+    ) -> Tuple[CategoryReturns, List[Dict[str, Any]]]:
+        """
+        계좌별 보유 종목(`symbol`/`ticker`, `category`, `weight`)을 카테고리 가중평균으로 묶는다.
+        그 달 시계열이 있는 종목끼리 비중을 다시 정규화하고, 한 종목도 없으면 NaN으로 둔다.
+        시계열이 없거나 카테고리를 알 수 없는 종목은 두 번째 반환값으로 알려준다.
+        """
+        ticker_index = {ticker: index for index, ticker in enumerate(self.tickers)}
+        available = ~np.isnan(self.total_returns)
+        total_returns = np.where(available, self.total_returns, 0.0)
+        distribution_yields = np.where(available, self.distribution_yields, 0.0)
+
+        returns: CategoryReturns = {}
+        unmapped: List[Dict[str, Any]] = []
+        for account_key, items in holdings.items():
+            weights = np.zeros((len(CATEGORY_ORDER), len(self.tickers)))
+            for item in items:
+                symbol = str(item.get("symbol") or item.get("ticker") or "").strip().upper()
+                category = item.get("category")
+                weight = float(item.get("weight") or 0.0)
+                if weight <= 0:
+                    continue
+                if category not in CATEGORY_INDEX or symbol not in ticker_index:
+                    unmapped.append(
+                        {"account": account_key, "symbol": symbol, "category": category}
+                    )
+                    continue
+                weights[CATEGORY_INDEX[category], ticker_index[symbol]] += weight
+            if not weights.any():
+                continue
+            covered = weights @ available
+            with np.errstate(invalid="ignore", divide="ignore"):
+                category_total = np.where(covered > 0, (weights @ total_returns) / covered, np.nan)
+                category_distribution = np.where(
+                    covered > 0, (weights @ distribution_yields) / covered, np.nan
+                )
+            returns[account_key] = (category_total.T, category_distribution.T)
+        return returns, unmapped
+
+
+def build_return_overrides(
+    category_returns: CategoryReturns,
+    start_index: int,
+    calendar: Sequence[Tuple[int, int]],
+) -> Tuple[Dict[str, Dict[str, Dict[str, Dict[str, float]]]], int]:
+    """
+    역사 시계열 `start_index`번째 달부터의 수익률을 시뮬레이션 달력 순서대로
+    `monthly_return_overrides` 형식(연 환산 dy/pa)으로 만든다.
+    엔진은 월 dy = dy / 12, 월 pa = (1 + pa) ** (1/12) - 1로 되돌린다.
+    두 번째 반환값은 역사 데이터로 채운 시뮬레이션 개월 수다.
+    """
+    month_keys = [f"{sim_year}-{sim_month:02d}" for sim_year, sim_month in calendar]
+    overrides: Dict[str, Dict[str, Dict[str, Dict[str, float]]]] = {}
+    historical_months = 0
+    for account_key, (total_returns, distribution_yields) in category_returns.items():
+        window_total = total_returns[start_index : start_index + len(month_keys)]
+        window_distribution = distribution_yields[start_index : start_index + len(month_keys)]
+        annual_dy = window_distribution * 12.0
+        annual_pa = np.maximum(0.0, 1.0 + window_total - window_distribution) ** 12 - 1.0
+        covered = ~np.isnan(window_total)
+        historical_months = max(historical_months, int(covered.any(axis=1).sum()))
+        account_overrides = overrides.setdefault(account_key, {})
+        for category_index, category in enumerate(CATEGORY_ORDER):
+            rows = np.flatnonzero(covered[:, category_index])
+            if rows.size == 0:
+                continue
+            dy_values = annual_dy[rows, category_index].tolist()
+            pa_values = annual_pa[rows, category_index].tolist()
+            account_overrides[category] = {
+                month_keys[row]: {"dy": dy, "pa": pa}
+                for row, dy, pa in zip(rows.tolist(), dy_values, pa_values)
+            }
+    return overrides, historical_months
@@ -0,0 +1,190 @@
+import math
+import sys
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List
+
+# 목표를 못 맞추면 이 값까지만 찾고 도달 불가로 본다.
+DEFAULT_SEARCH_LIMIT = 1.0e15
+# 해의 허용오차 xtol + rtol·|x| (SciPy brentq 기본값과 같은 수준: 부동소수점 몇 ULP)
+DEFAULT_XTOL = 2.0e-12
+DEFAULT_RTOL = 4.0 * sys.float_info.epsilon
+# 선형 구간 역산점이 반올림으로 목표에 살짝 못 미칠 때 올려 보는 ULP 배수
+ROUNDING_NUDGES = (1.0, 16.0, 256.0)
+BRENT_MAX_ITERATIONS = 200
+
+
+@dataclass(frozen=True)
+class InverseSolution:
+    """f(value) ≥ target을 만족하는 최소 value(허용오차 안)와 평가 횟수·풀이 방식."""
+
+    value: float
+    evaluations: int
+    method: str
+
+
+class _CountingFunction:
+    """같은 점을 다시 평가하지 않도록 결과를 기억하며 평가 횟수를 센다."""
+
+    def __init__(self, func: Callable[[float], float]) -> None:
+        self._func = func
+        self._values: Dict[float, float] = {}
+
+    def __call__(self, x: float) -> float:
+        value = self._values.get(x)
+        if value is None:
+            value = float(self._func(x))
+            self._values[x] = value
+        return value
+
+    @property
+    def evaluations(self) -> int:
+        return len(self._values)
+
+
+def solve_monotone_inverse(
+    func: Callable[[float], float],
+    target: float,
+    breakpoints: Iterable[float] = (),
+    *,
+    lower: float = 0.0,
+    upper: float = DEFAULT_SEARCH_LIMIT,
+    xtol: float = DEFAULT_XTOL,
+    rtol: float = DEFAULT_RTOL,
+) -> InverseSolution:
+    """
+    비감소 함수 f에서 f(x) ≥ target인 최소 x를 [lower, upper] 안에서 찾는다.
+    f가 구간점(breakpoints) 사이·마지막 구간점 뒤에서 선형이면 목표를 감싸는 구간을 찾아 두 끝점의
+    직선으로 바로 역산하고, x - tol에서 목표 미달임을 확인해 끝낸다(평가 몇 번). 10원 절사 같은
+    계단이나 비율 배분처럼 선형이 아닌 구간이면 그 구간 안에서 Brent 방법으로 허용오차까지 좁힌다.
+    목표에 도달하지 못하면 value는 무한대다.
+    """
+    f = _CountingFunction(func)
+    if f(lower) >= target:
+        return InverseSolution(lower, f.evaluations, "lower_bound")
+
+    low, f_low = lower, f(lower)
+    high = None
+    for point in sorted({float(p) for p in breakpoints if lower < p < upper}):
+        value = f(point)
+        if value >= target:
+            high = point
+            break
+        low, f_low = point, value
+
+    if high is None:
+        # 마지막 구간점 뒤 무한 구간: 기울기를 재서 외삽하고, 모자라면 두 배씩 넓힌다.
+        probe = min(upper, max(low * 2.0, low + 1.0e6))
+        while f(probe) < target:
+            slope = (f(probe) - f_low) / (probe - low)
+            low, f_low = probe, f(probe)
+            if low >= upper:
+                return InverseSolution(math.inf, f.evaluations, "unreachable")
+            if slope > 0:
+                # 외삽점을 조금 넘겨 잡아 선형이면 다음 단계에서 목표를 감싼다.
+                step = (target - f_low) / slope
+                probe = min(upper, low + step * 1.01 + _tolerance(low, xtol, rtol))
+            else:
+                probe = min(upper, low * 2.0)
+        high = probe
+
+    # 선형 구간이라면 목표값을 지나는 점
+    f_high = f(high)
+    guess = low + (target - f_low) * (high - low) / (f_high - f_low)
+    guess = min(high, max(low, guess))
+    tol = _tolerance(guess, xtol, rtol)
+    if f(guess) >= target:
+        below = max(low, guess - tol)
+        if below == low or f(below) < target:
+            return InverseSolution(guess, f.evaluations, "linear")
+        high = below
+    else:
+        low = guess
+        for nudge in ROUNDING_NUDGES:
+            above = min(high, guess + max(tol, math.ulp(guess) * nudge))
+            if f(above) >= target:
+                return InverseSolution(above, f.evaluations, "linear")
+            low = above
+
+    value = brent_threshold(f, target, low, high, xtol=xtol, rtol=rtol)
+    return InverseSolution(value, f.evaluations, "brent")
+
+
+def brent_threshold(
+    func: Callable[[float], float],
+    target: float,
+    low: float,
+    high: float,
+    *,
+    xtol: float = DEFAULT_XTOL,
+    rtol: float = DEFAULT_RTOL,
+    max_iterations: int = BRENT_MAX_ITERATIONS,
+) -> float:
+    """
+    f(low) < target ≤ f(high)인 구간에서 Brent 방법(역이차 보간 + 이분법 보장)으로 경계를 좁혀
+    f(x) ≥ target인 쪽 끝점을 돌려준다. 불연속 계단에서도 구간이 부호 변화를 유지하므로
+    허용오차 안의 계단 위치로 수렴한다.
+    """
+
+    def g(x: float) -> float:
+        return func(x) - target
+
+    x_prev, x_cur = low, high
+    g_prev, g_cur = g(low), g(high)
+    if g_prev >= 0:
+        return low
+    if g_cur < 0:
+        raise ValueError("목표값을 감싸는 구간이 아닙니다.")
+    x_block, g_block = x_prev, g_prev
+    s_prev = s_cur = 0.0
+    for _ in range(max_iterations):
+        if g_prev * g_cur < 0:
+            x_block, g_block = x_prev, g_prev
+            s_prev = s_cur = x_cur - x_prev
+        if abs(g_block) < abs(g_cur):
+            x_prev, x_cur, x_block = x_cur, x_block, x_cur
+            g_prev, g_cur, g_block = g_cur, g_block, g_cur
+
+        delta = (xtol + rtol * abs(x_cur)) / 2.0
+        s_bisect = (x_block - x_cur) / 2.0
+        if g_cur == 0 or abs(s_bisect) < delta:
+            break
+
+        if abs(s_prev) > delta and abs(g_cur) < abs(g_prev):
+            if x_prev == x_block:
+                # 할선 보간
+                s_try = -g_cur * (x_cur - x_prev) / (g_cur - g_prev)
+            else:
+                # 역이차 보간
+                d_prev = (g_prev - g_cur) / (x_prev - x_cur)
+                d_block = (g_block - g_cur) / (x_block - x_cur)
+                s_try = (
+                    -g_cur
+                    * (g_block * d_block - g_prev * d_prev)
+                    / (d_block * d_prev * (g_block - g_prev))
+                )
+            if 2.0 * abs(s_try) < min(abs(s_prev), 3.0 * abs(s_bisect) - delta):
+                s_prev, s_cur = s_cur, s_try
+            else:
+                s_prev = s_cur = s_bisect
+        else:
+            s_prev = s_cur = s_bisect
+
+        x_prev, g_prev = x_cur, g_cur
+        if abs(s_cur) > delta:
+            x_cur += s_cur
+        else:
+            x_cur += delta if s_bisect > 0 else -delta
+        g_cur = g(x_cur)
+
+    return x_cur if g_cur >= 0 else x_block
+
+
+def _tolerance(x: float, xtol: float, rtol: float) -> float:
+    return xtol + rtol * abs(x)
+
+
+def linear_breakpoints(offsets: Iterable[float], slope: float) -> List[float]:
+    """입력 x에 대해 slope·x가 offsets 값을 지나는 x들 (slope ≤ 0이면 없음)."""
+    if slope <= 0:
+        return []
+    return [offset / slope for offset in offsets if offset > 0]
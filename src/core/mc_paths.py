@@ -0,0 +1,252 @@
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.core.mc_state import (
+    ACCOUNT_KEYS,
+    BOND,
+    HIGH_INCOME,
+    SGOV,
+    AccountBook,
+    GrowthFn,
+    MonteCarloSetup,
+    TaxLedger,
+    YieldFn,
+)
+from src.core.mc_tax import (
+    corporate_need,
+    corporate_payout,
+    corporate_tax_payment,
+    health_premium,
+    personal_annual_tax,
+    review_cash_need,
+)
+from src.core.mc_trading import (
+    apply_returns,
+    can_fill,
+    pay_personal_obligation,
+    rebalance,
+    sole_risk_sleeves,
+    transfer,
+)
+
+
+def simulate_chunk(
+    setup: MonteCarloSetup,
+    paths: int,
+    monthly_growth: GrowthFn,
+    sgov_yield: Optional[YieldFn] = None,
+) -> Dict[str, np.ndarray]:
+    """경로 `paths`개의 월간 운용을 한 번에 계산해 경로별 월 지표와 생존·최초 미충족 시점을 낸다."""
+    s = setup.scalars
+    months = setup.months
+    books = {
+        a: AccountBook(
+            np.tile(setup.initial_balances[a], (paths, 1)),
+            np.tile(setup.initial_run_rates[a], (paths, 1)),
+            np.tile(setup.initial_cost_basis[a], (paths, 1)),
+        )
+        for a in ACCOUNT_KEYS
+    }
+    bal = {a: books[a].balances for a in ACCOUNT_KEYS}
+    rr = {a: books[a].run_rates for a in ACCOUNT_KEYS}
+    ledger = TaxLedger()
+    op = setup.operating_key
+    corp_rules, pension_rules = s["corporate_rules"], s["pension_rules"]
+    pension_target = s["pension_withdrawal_target"]
+    inflation = s["inflation_rate"]
+
+    approved_need = np.full(paths, s["household_monthly_need"])
+    loan = np.full(paths, s["loan_balance"])
+    shock = np.zeros(paths, dtype=bool)
+    stress = np.zeros(paths, dtype=bool)
+    boost = np.zeros(paths)
+    boost_months = np.zeros(paths, dtype=int)
+    previous_review_total = np.full(paths, np.nan)
+    crash_base = equity_total(bal, ACCOUNT_KEYS)
+    alive = np.ones(paths, dtype=bool)
+    survival = np.zeros(paths, dtype=int)
+    first_shortfall = np.full(paths, -1)
+    total_assets = np.zeros((paths, months))
+    household_cash = np.zeros((paths, months))
+    sgov_months = np.zeros((paths, months))
+
+    for t, (sim_year, sim_month, phase) in enumerate(setup.calendar):
+        if t > 0 and sim_month == 1:
+            for book in books.values():
+                book.close_year(sim_year - 1)
+        for account, inflow, amount in setup.cashflows_by_month.get(t, []):
+            sgov = bal[account][:, SGOV]
+            bal[account][:, SGOV] = sgov + amount if inflow else np.maximum(0.0, sgov - amount)
+        for a, account in enumerate(ACCOUNT_KEYS):
+            realized_income = apply_returns(
+                setup,
+                account,
+                bal[account],
+                rr[account],
+                t,
+                monthly_growth(a, t, sole_risk_sleeves(bal[account])),
+                sgov_yield(a, t) if sgov_yield is not None else None,
+            )
+            if account == "corp":
+                ledger.corp_income[sim_year] = (
+                    ledger.corp_income.get(sim_year, 0.0) + realized_income
+                )
+            elif account == "personal":
+                if s["personal_withholding_rate"] > 0:
+                    pay_personal_obligation(
+                        setup, books[account], realized_income * s["personal_withholding_rate"]
+                    )
+                ledger.personal_dividend[sim_year] = (
+                    ledger.personal_dividend.get(sim_year, 0.0) + realized_income
+                )
+
+        need = approved_need
+        pension_base = pension_target if phase in {"Phase 2", "Phase 3"} else 0.0
+        pension_income = (
+            pension_base + np.where(boost_months > 0, boost, 0.0) * s["pension_enabled"]
+            if phase in {"Phase 2", "Phase 3"}
+            else np.zeros(paths)
+        )
+        national = s["national_pension_amount"] if phase == "Phase 3" else 0.0
+        personal_need = (
+            np.maximum(0.0, need - pension_income - national)
+            if s["personal_operating"]
+            else np.zeros(paths)
+        )
+        tax_adjustment_fee = s["annual_corp_tax_adjustment_fee"] if sim_month == 3 else 0.0
+        corp_tax = corporate_tax_payment(setup, ledger, books["corp"], sim_year, sim_month)
+        corp_operating_cost = s["monthly_bookkeeping_fee"] + tax_adjustment_fee + corp_tax
+        corp_need = corporate_need(s, need, pension_base, national, loan, corp_operating_cost)
+        op_need = personal_need if op == "personal" else corp_need
+
+        if s["personal_enabled"]:
+            if sim_month == setup.tax_engine.personal_tax_payment_month:
+                pay_personal_obligation(
+                    setup,
+                    books["personal"],
+                    personal_annual_tax(setup, ledger, books["personal"], sim_year - 1),
+                )
+            pay_personal_obligation(
+                setup,
+                books["personal"],
+                health_premium(setup, ledger, sim_year, sim_month, paths),
+            )
+
+        pension_draw = np.minimum(pension_income, bal["pension"][:, SGOV])
+        bal["pension"][:, SGOV] -= pension_draw
+        personal_draw = np.minimum(personal_need, np.maximum(bal["personal"][:, SGOV], 0.0))
+        bal["personal"][:, SGOV] -= personal_draw
+        corp_draw = np.minimum(corp_need, bal["corp"][:, SGOV])
+        bal["corp"][:, SGOV] -= corp_draw
+        salary_and_distribution, loan = corporate_payout(
+            s,
+            ledger,
+            sim_year,
+            sim_month,
+            corp_draw,
+            need,
+            pension_income,
+            national,
+            loan,
+            tax_adjustment_fee,
+            corp_tax,
+        )
+        shortfall = np.maximum(
+            0.0, need - pension_draw - national - salary_and_distribution - personal_draw
+        )
+        shortfall[shortfall < 1e-6] = 0.0
+        first_shortfall[(shortfall > 0) & (first_shortfall < 0) & alive] = t
+
+        next_need = need
+        boost_base = crash_base
+        pre_review_equity = equity_total(bal, (op, "pension") if s["pension_enabled"] else (op,))
+        if sim_month == s["main_review_month"]:
+            candidate = need * (1.0 + inflation)
+            candidate_op_need = review_cash_need(
+                s, candidate, pension_base, national, loan, corp_operating_cost
+            )
+            guard = np.ones(paths, dtype=bool)
+            review_total = bal[op].sum(axis=1) + bal["pension"].sum(axis=1)
+            has_previous = ~np.isnan(previous_review_total)
+            guard[has_previous] = review_total[has_previous] >= previous_review_total[
+                has_previous
+            ] * (1.0 + inflation)
+            stress = ~(can_fill(bal[op], candidate_op_need, corp_rules) & guard)
+            next_need = np.where(shock | stress, need, candidate)
+            review_need = review_cash_need(s, next_need, pension_base, national, loan)
+            rebalance(setup, op, books[op], review_need, corp_rules["may_sgov"], corp_rules)
+            rebalance(
+                setup,
+                "pension",
+                books["pension"],
+                np.full(paths, pension_target),
+                pension_rules["sgov_target"],
+                {
+                    "bond_floor": pension_rules["bond_floor"],
+                    "bond_target": pension_rules["bond_target"],
+                    "bond_upper": pension_rules["bond_upper"],
+                },
+            )
+            crash_base = equity_total(bal, ACCOUNT_KEYS)
+            previous_review_total = sum(bal[a].sum(axis=1) for a in ACCOUNT_KEYS)
+            shock = np.zeros(paths, dtype=bool)
+        elif sim_month == (s["main_review_month"] + 2) % 12 + 1:
+            gap = np.where(op_need > 0, np.maximum(0.0, op_need - bal[op][:, SGOV]), 0.0)
+            transfer(setup, op, books[op], BOND, SGOV, gap)
+        elif sim_month == (s["main_review_month"] + 5) % 12 + 1:
+            rebalance(setup, op, books[op], op_need, corp_rules["november_sgov"], corp_rules)
+
+        if pension_target > 0:
+            floor_gap = pension_target * pension_rules["sgov_floor"] - bal["pension"][:, SGOV]
+            transfer(setup, "pension", books["pension"], BOND, SGOV, floor_gap)
+
+        total = sum(bal[a].sum(axis=1) for a in ACCOUNT_KEYS)
+        alive &= total > 0
+        survival += alive
+        equity = equity_total(bal, ACCOUNT_KEYS)
+        crashed = (crash_base > 0) & (equity <= crash_base * 0.8) & ~shock
+        shock |= crashed
+        review_stress = (
+            ~crashed & stress if sim_month == s["main_review_month"] else np.zeros(paths, bool)
+        )
+        cut_paths = crashed | review_stress
+        if cut_paths.any():
+            drawdown_equity = np.where(crashed, equity, pre_review_equity)
+            new_boost = drawdown_boost(drawdown_equity, boost_base) * s["pension_enabled"]
+            boost = np.where(cut_paths, new_boost, boost)
+            boost_months = np.where(cut_paths, np.where(new_boost > 0, 6, 0), boost_months)
+            for account in (op, "pension") if s["pension_enabled"] else (op,):
+                rr[account][cut_paths] *= 1.0 - setup.stress_cut_rates[account]
+
+        total_assets[:, t] = np.where(alive, total, 0.0)
+        household_cash[:, t] = np.where(alive, need - shortfall, 0.0)
+        cover = np.divide(bal[op][:, SGOV], op_need, out=np.zeros(paths), where=op_need > 0)
+        sgov_months[:, t] = np.where(alive, cover, 0.0)
+        boost_months = np.maximum(0, boost_months - 1)
+        boost = np.where(boost_months > 0, boost, 0.0)
+        if sim_month == s["main_review_month"]:
+            approved_need = next_need
+
+    return {
+        "total_assets": total_assets,
+        "household_cash": household_cash,
+        "sgov_months": sgov_months,
+        "survival_months": survival,
+        "first_shortfall_index": first_shortfall,
+    }
+
+
+def equity_total(balances: Dict[str, np.ndarray], accounts) -> np.ndarray:
+    return sum(balances[account][:, HIGH_INCOME:].sum(axis=1) for account in accounts)
+
+
+def drawdown_boost(equity: np.ndarray, base: np.ndarray) -> np.ndarray:
+    drawdown = np.where(
+        base > 0, 1.0 - np.divide(equity, base, out=np.ones_like(equity), where=base > 0), 0.0
+    )
+    return np.select(
+        [drawdown > 0.30, drawdown >= 0.20, drawdown >= 0.15],
+        [3000000.0, 2000000.0, 1000000.0],
+        default=0.0,
+    )
@@ -0,0 +1,243 @@
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+import numpy as np
+
+from src.core.historical_series import HistoricalSeries, build_return_overrides
+from src.core.mc_state import ACCOUNT_KEYS, SGOV, GrowthFn, MonteCarloSetup, YieldFn
+from src.core.projection_engine import ProjectionEngine
+from src.core.rng_streams import PathRandomStreams
+
+# 카테고리별 연 변동성 기본값 (params["category_volatility"]로 덮어쓸 수 있음)
+DEFAULT_ANNUAL_VOLATILITY = {
+    "SGOV Buffer": 0.005,
+    "Bond Buffer": 0.06,
+    "High Income": 0.12,
+    "Dividend Growth": 0.15,
+    "Growth Engine": 0.20,
+}
+# CATEGORY_ORDER 순서의 카테고리 간 상관계수 기본값
+DEFAULT_CORRELATION = (
+    (1.0, 0.1, 0.0, 0.0, 0.0),
+    (0.1, 1.0, 0.2, 0.1, 0.0),
+    (0.0, 0.2, 1.0, 0.7, 0.6),
+    (0.0, 0.1, 0.7, 1.0, 0.8),
+    (0.0, 0.0, 0.6, 0.8, 1.0),
+)
+
+
+@dataclass
+class BootstrapHistory:
+    """
+    블록 부트스트랩 표본. 모든 계좌의 관측 카테고리에 값이 있는 달만 모아 같은 행 순서로 둔다.
+    `growth`는 `monthly_return_overrides` 변환과 같은 월 가격 성장배수 max(0, 1 + TR - 분배),
+    `distribution`은 월 분배수익률이며, `covered`는 시계열이 있는 카테고리 마스크다.
+    """
+
+    months: List[str]
+    category_returns: Dict[str, tuple]
+    growth: Dict[str, np.ndarray]
+    distribution: Dict[str, np.ndarray]
+    covered: Dict[str, np.ndarray]
+
+
+def shock_model(params: Dict[str, Any]) -> tuple[np.ndarray, np.ndarray]:
+    overrides = params.get("category_volatility") or {}
+    volatility = np.array(
+        [
+            float(overrides.get(category, DEFAULT_ANNUAL_VOLATILITY[category]))
+            for category in ProjectionEngine.CATEGORY_ORDER
+        ]
+    ) / np.sqrt(12.0)
+    correlation = np.array(params.get("category_correlation") or DEFAULT_CORRELATION)
+    return volatility, np.linalg.cholesky(correlation)
+
+
+def parametric_returns(
+    setup: MonteCarloSetup, shocks: np.ndarray, volatility: np.ndarray
+) -> GrowthFn:
+    """
+    로그정규 월 가격 성장배수(1 + 수익률)를 돌려준다.
+    shocks는 (months, paths, categories) 표준정규 충격이며, 기대값은 결정론 엔진의 월 PA와 같다.
+    """
+    shocks *= volatility
+    np.exp(shocks, out=shocks)
+
+    def lognormal_drift(monthly_pa: np.ndarray) -> np.ndarray:
+        return np.exp(np.log1p(np.maximum(monthly_pa, -0.999999)) - 0.5 * volatility**2)
+
+    drift = {account: lognormal_drift(setup.monthly_pa[account]) for account in ACCOUNT_KEYS}
+    sole_drift = {account: lognormal_drift(setup.sole_pa[account]) for account in ACCOUNT_KEYS}
+
+    def monthly_growth(account_index: int, t: int, sole: np.ndarray) -> np.ndarray:
+        account = ACCOUNT_KEYS[account_index]
+        growth = shocks[t] * drift[account][t]
+        if sole.any():
+            growth = np.where(sole, shocks[t] * sole_drift[account][t], growth)
+        return growth
+
+    return monthly_growth
+
+
+def bootstrap_sampler(
+    setup: MonteCarloSetup,
+    series: HistoricalSeries,
+    holdings: Mapping[str, Iterable[Mapping[str, Any]]],
+    block_months: int,
+) -> tuple["BootstrapSampler", List[Dict[str, Any]]]:
+    block_months = int(block_months)
+    if block_months < 1:
+        raise ValueError("block_months는 1 이상이어야 합니다.")
+    category_returns, unmapped = series.category_returns(holdings)
+    if not category_returns:
+        raise ValueError("시계열과 매칭되는 보유 종목이 없습니다.")
+    history = bootstrap_history(series, category_returns)
+    return (
+        BootstrapSampler(history, block_months, -(-setup.months // block_months)),
+        unmapped,
+    )
+
+
+def bootstrap_history(
+    series: HistoricalSeries, category_returns: Dict[str, tuple]
+) -> BootstrapHistory:
+    covered = {
+        account: ~np.isnan(total).all(axis=0) for account, (total, _) in category_returns.items()
+    }
+    complete = np.ones(len(series.months), dtype=bool)
+    for account, (total, _) in category_returns.items():
+        complete &= ~np.isnan(total[:, covered[account]]).any(axis=1)
+    rows = np.flatnonzero(complete)
+    if rows.size == 0:
+        raise ValueError("모든 보유 카테고리 수익률이 함께 있는 달이 없습니다.")
+    growth, distribution = {}, {}
+    for account, (total, dist) in category_returns.items():
+        sample_total = np.nan_to_num(total[rows])
+        sample_dist = np.nan_to_num(dist[rows])
+        growth[account] = np.maximum(0.0, 1.0 + sample_total - sample_dist)
+        distribution[account] = sample_dist
+    return BootstrapHistory(
+        months=[series.months[row] for row in rows.tolist()],
+        category_returns={
+            account: (total[rows], dist[rows])
+            for account, (total, dist) in category_returns.items()
+        },
+        growth=growth,
+        distribution=distribution,
+        covered=covered,
+    )
+
+
+def block_rows(
+    block_starts: np.ndarray, block_months: int, months: int, sample_count: int
+) -> np.ndarray:
+    """(paths, blocks) 블록 시작 행을 (months, paths) 표본 행 인덱스로 편다 (순환 블록)."""
+    offsets = np.arange(block_months)
+    rows = (block_starts[:, :, None] + offsets) % sample_count
+    return np.ascontiguousarray(rows.reshape(block_starts.shape[0], -1)[:, :months].T)
+
+
+def bootstrap_returns(
+    setup: MonteCarloSetup, history: BootstrapHistory, rows: np.ndarray
+) -> tuple[GrowthFn, YieldFn]:
+    """표본 행 인덱스를 경로별 월 가격 성장배수와 SGOV 분배수익률 함수로 바꾼다."""
+    paths = rows.shape[1]
+
+    def monthly_growth(account_index: int, t: int, sole: np.ndarray) -> np.ndarray:
+        account = ACCOUNT_KEYS[account_index]
+        assumed = 1.0 + np.where(sole, setup.sole_pa[account][t], setup.monthly_pa[account][t])
+        table = history.growth.get(account)
+        if table is None:
+            return assumed
+        growth = table[rows[t]]
+        uncovered = ~history.covered[account]
+        growth[:, uncovered] = assumed[:, uncovered]
+        return growth
+
+    def sgov_yield(account_index: int, t: int) -> np.ndarray:
+        account = ACCOUNT_KEYS[account_index]
+        assumed = setup.monthly_dy[account][t, SGOV]
+        if account not in history.distribution or not history.covered[account][SGOV]:
+            return np.full(paths, assumed)
+        return history.distribution[account][rows[t], SGOV]
+
+    return monthly_growth, sgov_yield
+
+
+def bootstrap_replay_params(
+    params: Dict[str, Any],
+    setup: MonteCarloSetup,
+    history: BootstrapHistory,
+    block_starts: np.ndarray,
+    block_months: int,
+) -> Dict[str, Any]:
+    """부트스트랩 경로 하나를 `monthly_return_overrides`로 바꾼 결정론 엔진 재계산용 params."""
+    rows = block_rows(block_starts[None, :], block_months, setup.months, len(history.months))[:, 0]
+    sampled = {
+        account: (total[rows], dist[rows])
+        for account, (total, dist) in history.category_returns.items()
+    }
+    sampled_overrides, _ = build_return_overrides(
+        sampled, 0, [(year, month) for year, month, _ in setup.calendar]
+    )
+    overrides = deepcopy(params.get("monthly_return_overrides") or {})
+    for account_key, account_overrides in sampled_overrides.items():
+        for category, monthly in account_overrides.items():
+            overrides.setdefault(account_key, {}).setdefault(category, {}).update(monthly)
+    return {
+        **deepcopy(params),
+        "monthly_return_overrides": overrides,
+        "run_mode": "lean",
+        "trade_events_mode": "none",
+        "reuse_cached_prefix": False,
+        "checkpoint_interval_months": 0,
+        "profile": False,
+    }
+
+
+@dataclass
+class ParametricSampler:
+    """경로별 표준정규 충격을 카테고리 상관(Cholesky)으로 묶은 로그정규 월 수익률."""
+
+    volatility: np.ndarray
+    cholesky: np.ndarray
+    mode: str = "parametric"
+
+    def draw(
+        self,
+        setup: MonteCarloSetup,
+        streams: PathRandomStreams,
+        start: int,
+        count: int,
+    ) -> tuple[GrowthFn, Optional[YieldFn], np.ndarray]:
+        shocks = streams.standard_normal(start, count, (setup.months, len(self.volatility)))
+        shocks = np.ascontiguousarray((shocks @ self.cholesky.T).transpose(1, 0, 2))
+        growth_fn = parametric_returns(setup, shocks, self.volatility)
+        return growth_fn, None, np.zeros((count, 0), dtype=np.int64)
+
+
+@dataclass
+class BootstrapSampler:
+    """경로별로 블록 시작 행을 뽑아 과거 표본을 순환 블록으로 이어 붙인 월 수익률."""
+
+    history: BootstrapHistory
+    block_months: int
+    block_count: int
+    mode: str = "block_bootstrap"
+
+    def draw(
+        self,
+        setup: MonteCarloSetup,
+        streams: PathRandomStreams,
+        start: int,
+        count: int,
+    ) -> tuple[GrowthFn, Optional[YieldFn], np.ndarray]:
+        sample_count = len(self.history.months)
+        starts = streams.integers(start, count, sample_count, self.block_count)
+        rows = block_rows(starts, self.block_months, setup.months, sample_count)
+        growth_fn, yield_fn = bootstrap_returns(setup, self.history, rows)
+        return growth_fn, yield_fn, starts
+
+
+PathSampler = Union[ParametricSampler, BootstrapSampler]
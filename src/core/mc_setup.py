@@ -0,0 +1,243 @@
+from typing import Any, Dict
+
+import numpy as np
+
+from src.core.mc_state import ACCOUNT_KEYS, SGOV, MonteCarloSetup
+from src.core.operating_account import select_operating_account
+from src.core.projection_engine import ProjectionEngine
+
+
+def prepare_setup(
+    engine: ProjectionEngine, initial_assets: Dict[str, float], params: Dict[str, Any]
+) -> MonteCarloSetup:
+    """결정론 엔진 규칙으로 계좌 초기 상태·월 수익률 표·캘린더를 MonteCarloSetup으로 묶는다."""
+    p = params.get
+    months = int(p("simulation_years", 30)) * 12
+    start_year = int(p("simulation_start_year", 2026))
+    start_month = int(p("simulation_start_month", 1))
+    birth_year = int(p("birth_year", 1972))
+    birth_month = int(p("birth_month", 8))
+    private_age = int(p("private_pension_start_age", 55))
+    national_age = int(p("national_pension_start_age", 65))
+    corp_enabled = bool(p("corp_enabled", True))
+    pension_enabled = bool(p("pension_enabled", True))
+    personal_enabled = bool(p("personal_enabled", True))
+    need = float(p("household_monthly_need", p("target_monthly_cashflow", 11500000)))
+    scalars = {
+        "household_monthly_need": need,
+        "inflation_rate": float(p("inflation_rate", 0.0)),
+        "national_pension_amount": float(p("national_pension_amount", 2000000)),
+        "pension_withdrawal_target": (
+            float(p("pension_withdrawal_target", 2500000)) if pension_enabled else 0.0
+        ),
+        "loan_balance": float(p("initial_shareholder_loan", 0.0)) if corp_enabled else 0.0,
+        "corp_salary": float(p("corp_salary", 0.0)) if corp_enabled else 0.0,
+        "employee_count": int(p("employee_count", 0)) if corp_enabled else 0,
+        "monthly_bookkeeping_fee": (
+            float(p("monthly_bookkeeping_fee", 0.0)) if corp_enabled else 0.0
+        ),
+        "annual_corp_tax_adjustment_fee": (
+            float(p("annual_corp_tax_adjustment_fee", 0.0)) if corp_enabled else 0.0
+        ),
+        "withholding_rate": min(
+            0.999999, max(0.0, float(p("shareholder_distribution_withholding_rate", 0.0)))
+        ),
+        "corp_enabled": corp_enabled,
+        "personal_operating": personal_enabled and not corp_enabled,
+        "personal_enabled": personal_enabled,
+        "personal_withholding_rate": (
+            engine.tax_engine.us_dividend_foreign_withholding_rate if personal_enabled else 0.0
+        ),
+        "personal_owner_weights": engine._personal_owner_weights(
+            2 if str(p("personal_split_mode", "single")).lower() == "couple" else 1,
+            str(p("personal_income_allocation", "split_50_50")).lower(),
+        ),
+        "personal_external_financial_income": float(p("personal_external_financial_income", 0.0)),
+        "personal_other_comprehensive_tax_base": float(
+            p("personal_other_comprehensive_tax_base", 0.0)
+        ),
+        "personal_property_assessed_value": float(p("personal_property_assessed_value", 0.0)),
+        "pension_enabled": pension_enabled,
+        "main_review_month": max(1, min(12, int(p("rebalance_month", 5) or 5))),
+        "corporate_rules": {
+            "may_sgov": float(p("sgov_target_months", 30.0)),
+            "november_sgov": float(
+                p("corp_november_sgov_target_months", p("sgov_warn_months", 27.0))
+            ),
+            "bond_floor": float(p("corp_bond_floor_months", 12.0)),
+            "bond_target": float(p("corp_bond_target_months", 18.0)),
+            "bond_upper": float(p("corp_bond_upper_months", 24.0)),
+        },
+        "pension_rules": {
+            "sgov_target": float(
+                p("pension_sgov_target_months", float(p("sgov_min_years", 2.0)) * 12.0)
+            ),
+            "sgov_floor": float(p("pension_sgov_floor_months", 12.0)),
+            "bond_floor": float(p("pension_bond_floor_months", 12.0)),
+            "bond_target": float(p("pension_bond_target_months", 18.0)),
+            "bond_upper": float(p("pension_bond_upper_months", 24.0)),
+        },
+    }
+    scalars["net_salary"] = engine._net_salary_to_household(
+        scalars["corp_salary"], scalars["employee_count"]
+    )
+    start_age = ((start_year - birth_year) * 12 + (start_month - birth_month)) // 12
+    start_phase = engine._resolve_phase(start_age, private_age, national_age)
+
+    # 호출자의 params를 바꾸지 않도록 계좌별 통계는 읽기만 한다.
+    portfolio_stats = params.get("portfolio_stats") or {}
+    stats = {account: portfolio_stats.get(account) or {} for account in ACCOUNT_KEYS}
+    states: Dict[str, Dict[str, float]] = {}
+    run_rates: Dict[str, Dict[str, float]] = {}
+    for account in ACCOUNT_KEYS:
+        account_stats = stats[account]
+        states[account] = engine._build_account_state(
+            initial_balance=float(initial_assets.get(account, 0.0)),
+            account_type=account,
+            account_stats=account_stats,
+            phase=start_phase,
+            household_monthly_need=need,
+            pension_withdrawal_target=(
+                scalars["pension_withdrawal_target"]
+                if account != "personal"
+                else float(p("personal_withdrawal_target", 0.0)) * personal_enabled
+            ),
+            national_pension_amount=scalars["national_pension_amount"],
+            corp_salary=scalars["corp_salary"],
+            employee_count=scalars["employee_count"],
+            loan_balance=scalars["loan_balance"],
+            monthly_bookkeeping_fee=scalars["monthly_bookkeeping_fee"],
+        )
+        run_rates[account] = engine._build_distribution_run_rates(
+            account, states[account], account_stats, params
+        )
+    operating = select_operating_account(
+        corp_enabled=corp_enabled,
+        personal_enabled=personal_enabled,
+        corp_assets=states["corp"],
+        personal_assets=states["personal"],
+        corp_distribution_run_rates=run_rates["corp"],
+        personal_distribution_run_rates=run_rates["personal"],
+        corp_stats=stats["corp"],
+        personal_stats=stats["personal"],
+    )
+
+    calendar = []
+    for index in range(1, months + 1):
+        sim_month = (start_month + index - 1) % 12 or 12
+        sim_year = start_year + (start_month + index - 2) // 12
+        age = ((sim_year - birth_year) * 12 + (sim_month - birth_month)) // 12
+        calendar.append(
+            (sim_year, sim_month, engine._resolve_phase(age, private_age, national_age))
+        )
+    month_index = {(year, month): t for t, (year, month, _) in enumerate(calendar)}
+    cashflows_by_month: Dict[int, list] = {}
+    for event in params.get("planned_cashflows", []):
+        entity = str(event.get("entity", "CORP")).lower()
+        account = "corp" if entity == "corp" else "pension"
+        if (account == "corp" and not corp_enabled) or (
+            account == "pension" and not pension_enabled
+        ):
+            continue
+        t = month_index.get((int(event["year"]), int(event["month"])))
+        if t is not None:
+            cashflows_by_month.setdefault(t, []).append(
+                (account, event.get("type", "INFLOW") == "INFLOW", float(event["amount"]))
+            )
+
+    order = engine.CATEGORY_ORDER
+    rate_table = engine._compile_rate_table(
+        params,
+        {account: stats[account] for account in ACCOUNT_KEYS},
+        start_year,
+        start_month,
+        months,
+    )
+    monthly_dy: Dict[str, np.ndarray] = {}
+    monthly_pa: Dict[str, np.ndarray] = {}
+    sole_pa: Dict[str, np.ndarray] = {}
+    sole_yields: Dict[str, float] = {}
+    structural, growth, cuts, target_weights = {}, {}, {}, {}
+    for account in ACCOUNT_KEYS:
+        # 단독 리스크 슬리브 수익률(entry[2])은 경로별 잔액으로 simulate_chunk에서 고른다.
+        rows = [[entry[:2] for entry in month_rates] for month_rates in rate_table.rates[account]]
+        rate_array = np.array(rows, dtype=float).reshape(months, len(order), 2)
+        monthly_dy[account] = rate_array[:, :, 0].copy()
+        monthly_pa[account] = rate_array[:, :, 1].copy()
+        sole_pa[account] = np.array(
+            [
+                [entry[1] if entry[2] is None else entry[2][1] for entry in month_rates]
+                for month_rates in rate_table.rates[account]
+            ],
+            dtype=float,
+        ).reshape(months, len(order))
+        # 설정 분배수익률이 없는 카테고리(NaN)는 매수 시점 잔액으로 대체 수익률을 고른다.
+        structural[account] = np.array(
+            [
+                np.nan if configured is None else configured
+                for configured in (
+                    engine._configured_distribution_yield(account, category, stats[account], params)
+                    for category in order
+                )
+            ]
+        )
+        sole_yields[account] = max(0.0, float(stats[account].get("dividend_yield", 0.0)))
+        rules = [engine._distribution_rule(params, account, category) for category in order]
+        annual_growth = np.array([float(rule.get("growth_rate", 0.0)) for rule in rules])
+        growth[account] = np.maximum(
+            0.0,
+            np.where(
+                annual_growth <= -1.0,
+                1.0 + annual_growth / 12.0,
+                np.power(np.maximum(1.0 + annual_growth, 0.0), 1.0 / 12.0),
+            ),
+        )
+        growth[account][SGOV] = 1.0
+        cut = np.array([min(1.0, float(rule.get("stress_cut_rate", 0.0))) for rule in rules])
+        cuts[account] = np.where(cut > 0, cut, 0.0)
+        cuts[account][SGOV] = 0.0
+        weights = engine._normalized_strategy_weights(stats[account])
+        target_weights[account] = (
+            np.array([weights.get(category, 0.0) for category in order]) if weights else None
+        )
+
+    initial_balances = {
+        account: np.array([states[account][category] for category in order])
+        for account in ACCOUNT_KEYS
+    }
+    # 취득원가는 시작 잔액 (개인 계좌는 personal_initial_cost_basis 비율로 환산)
+    initial_cost_basis = {account: initial_balances[account].copy() for account in ACCOUNT_KEYS}
+    personal_market_value = sum(states["personal"].values())
+    if personal_market_value > 0:
+        personal_basis = float(
+            p("personal_initial_cost_basis", initial_assets.get("personal", 0.0))
+        )
+        initial_cost_basis["personal"] = np.array(
+            [
+                states["personal"][category] * (max(0.0, personal_basis) / personal_market_value)
+                for category in order
+            ]
+        )
+
+    return MonteCarloSetup(
+        months=months,
+        operating_key=operating.key,
+        initial_balances=initial_balances,
+        initial_run_rates={
+            account: np.array([run_rates[account].get(category, 0.0) for category in order])
+            for account in ACCOUNT_KEYS
+        },
+        initial_cost_basis=initial_cost_basis,
+        structural_yields=structural,
+        sole_yields=sole_yields,
+        growth_factors=growth,
+        stress_cut_rates=cuts,
+        target_weights=target_weights,
+        monthly_dy=monthly_dy,
+        monthly_pa=monthly_pa,
+        sole_pa=sole_pa,
+        calendar=calendar,
+        cashflows_by_month=cashflows_by_month,
+        tax_engine=engine.tax_engine,
+        scalars=scalars,
+    )
@@ -0,0 +1,82 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.core.tax_engine import TaxEngine
+
+ACCOUNT_KEYS = ("corp", "pension", "personal")
+SGOV, BOND, HIGH_INCOME, DIVIDEND, GROWTH = range(5)
+RISK_SLEEVES = (HIGH_INCOME, DIVIDEND, GROWTH)
+# 개인 계좌 SGOV가 세금·보험료보다 적을 때 매도하는 순서 (_pay_personal_cash_obligation과 같음)
+PERSONAL_OBLIGATION_DONORS = ((BOND, 0.0), (HIGH_INCOME, 0.0), (DIVIDEND, 0.0), (GROWTH, 0.0))
+BAND_PERCENTILES = (5, 25, 50, 75, 95)
+
+# 월별 백분위 밴드를 내는 경로 지표 (SGOV 커버 개월은 운용 계좌 SGOV / 월 필요액)
+PATH_METRICS = ("total_assets", "sgov_months", "household_cash")
+# 최악 분위 경로 요약에 싣는 대표 경로 수
+WORST_PATH_SAMPLES = 5
+
+# (account_index, month_index, 단독 리스크 슬리브 마스크) -> (paths, categories) 월 가격 성장배수
+GrowthFn = Callable[[int, int, np.ndarray], np.ndarray]
+# (account_index, month_index) -> (paths,) SGOV 월 분배수익률
+YieldFn = Callable[[int, int], np.ndarray]
+
+
+@dataclass
+class MonteCarloSetup:
+    """
+    경로 수와 무관한 월별 입력값(계좌 초기 상태, 평균 수익률, 캘린더)을 한 번만 계산해 둔다.
+    `sole_pa`·`sole_yields`는 경로의 리스크 슬리브가 하나만 남았을 때 쓰는 PA와 대체 분배수익률이고,
+    `structural_yields`의 NaN은 설정 분배수익률이 없어 대체 수익률을 따르는 카테고리다.
+    """
+
+    months: int
+    operating_key: str
+    initial_balances: Dict[str, np.ndarray]
+    initial_run_rates: Dict[str, np.ndarray]
+    initial_cost_basis: Dict[str, np.ndarray]
+    structural_yields: Dict[str, np.ndarray]
+    sole_yields: Dict[str, float]
+    growth_factors: Dict[str, np.ndarray]
+    stress_cut_rates: Dict[str, np.ndarray]
+    target_weights: Dict[str, Optional[np.ndarray]]
+    monthly_dy: Dict[str, np.ndarray]
+    monthly_pa: Dict[str, np.ndarray]
+    sole_pa: Dict[str, np.ndarray]
+    calendar: List[tuple]
+    cashflows_by_month: Dict[int, list]
+    tax_engine: TaxEngine
+    scalars: Dict[str, Any] = field(default_factory=dict)
+
+
+class AccountBook:
+    """
+    한 계좌의 경로별 (paths, categories) 잔액·run-rate·취득원가와 연도별 실현손익.
+    ProjectionEngine의 AccountState와 매매 원장(TradeLog) 중 세금 계산에 필요한 부분이다.
+    """
+
+    __slots__ = ("balances", "run_rates", "cost_basis", "realized_gain", "realized_gain_by_year")
+
+    def __init__(self, balances: np.ndarray, run_rates: np.ndarray, cost_basis: np.ndarray):
+        self.balances = balances
+        self.run_rates = run_rates
+        self.cost_basis = cost_basis
+        self.realized_gain = np.zeros(balances.shape[0])
+        self.realized_gain_by_year: Dict[int, np.ndarray] = {}
+
+    def close_year(self, year: int) -> None:
+        self.realized_gain_by_year[year] = self.realized_gain
+        self.realized_gain = np.zeros_like(self.realized_gain)
+
+
+@dataclass
+class TaxLedger:
+    """법인세 정산·개인 종합과세·건강보험료 산정에 쓰는 경로별 연도 원장 (연도 -> (paths,) 배열)."""
+
+    corp_income: Dict[int, np.ndarray] = field(default_factory=dict)
+    corp_expenses: Dict[int, np.ndarray] = field(default_factory=dict)
+    corp_assessed_tax: Dict[int, np.ndarray] = field(default_factory=dict)
+    corp_prepaid_tax: Dict[int, np.ndarray] = field(default_factory=dict)
+    personal_dividend: Dict[int, np.ndarray] = field(default_factory=dict)
+    health_premium: Dict[int, np.ndarray] = field(default_factory=dict)
@@ -0,0 +1,161 @@
+from typing import Any, Dict, List, Union
+
+import numpy as np
+
+from src.core.mc_state import (
+    BAND_PERCENTILES,
+    PATH_METRICS,
+    WORST_PATH_SAMPLES,
+    MonteCarloSetup,
+)
+from src.core.path_quantiles import PathQuantileAggregator, histogram_percentiles
+
+
+def summarize(
+    setup: MonteCarloSetup,
+    results: Union[Dict[str, np.ndarray], PathQuantileAggregator],
+    meta: Dict[str, Any],
+) -> Dict[str, Any]:
+    """전 경로 배열(exact) 또는 스트리밍 집계기(sketch)에서 같은 모양의 요약을 만든다."""
+    months = setup.months
+    labels = [f"{year}-{month:02d}" for year, month, _ in setup.calendar]
+
+    if isinstance(results, PathQuantileAggregator):
+        paths = results.paths
+        survival_probability = results.survival_counts[months] / paths
+        full_funding_probability = results.first_shortfall_counts[0] / paths
+        survival_table = histogram_percentiles(results.survival_counts, BAND_PERCENTILES)
+        bands = results.bands(BAND_PERCENTILES)
+    else:
+        survival_months = results["survival_months"]
+        paths = survival_months.size
+        survival_probability = np.mean(survival_months >= months)
+        full_funding_probability = np.mean(results["first_shortfall_index"] < 0)
+        survival_table = np.percentile(survival_months, BAND_PERCENTILES)
+        bands = {}
+        for metric in PATH_METRICS:
+            table = np.percentile(results[metric], BAND_PERCENTILES, axis=0)
+            bands[metric] = {f"p{pct}": table[i].tolist() for i, pct in enumerate(BAND_PERCENTILES)}
+    return {
+        "summary": {
+            "paths": int(paths),
+            "months": months,
+            "survival_probability": float(survival_probability),
+            "full_funding_probability": float(full_funding_probability),
+            "survival_months_percentiles": {
+                f"p{pct}": float(survival_table[i]) for i, pct in enumerate(BAND_PERCENTILES)
+            },
+        },
+        "months": labels,
+        "bands": bands,
+        "meta": meta,
+    }
+
+
+def first_shortfall_distribution(
+    setup: MonteCarloSetup, first_shortfall_counts: np.ndarray
+) -> Dict[str, Any]:
+    """
+    가계 최초 미충족 시점 분포: 연도별 발생 비율과 미충족 경로의 시점 백분위.
+    `first_shortfall_counts[0]`은 미충족 없는 경로 수, `[t + 1]`은 t번째 달 최초 미충족 수다.
+    """
+    paths = int(first_shortfall_counts.sum())
+    monthly = first_shortfall_counts[1:]
+    shortfall_paths = int(monthly.sum())
+    by_year: Dict[str, float] = {}
+    for t in np.flatnonzero(monthly).tolist():
+        year = str(setup.calendar[t][0])
+        by_year[year] = by_year.get(year, 0.0) + float(monthly[t] / paths)
+    percentiles = {}
+    if shortfall_paths:
+        table = histogram_percentiles(monthly, BAND_PERCENTILES, method="lower")
+        percentiles = {
+            f"p{pct}": "{}-{:02d}".format(*setup.calendar[int(table[i])][:2])
+            for i, pct in enumerate(BAND_PERCENTILES)
+        }
+    return {
+        "probability": float(shortfall_paths / paths),
+        "by_year": by_year,
+        "month_percentiles": percentiles,
+    }
+
+
+def worst_decile(
+    setup: MonteCarloSetup,
+    results: Union[Dict[str, np.ndarray], PathQuantileAggregator],
+    paths: int,
+    samples: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """기말 자산 하위 10% 경로 요약 (스트리밍 집계면 경계 추정값만 싣는다)."""
+    decile_count = max(1, -(-paths // 10))
+    if isinstance(results, PathQuantileAggregator):
+        ending_p10 = results.sketches["total_assets"].quantiles([10])[0, -1]
+        return {
+            "paths": decile_count,
+            "ending_total_assets_max": float(ending_p10),
+            "samples": samples,
+        }
+
+    total_assets = results["total_assets"]
+    worst = np.argsort(total_assets[:, -1], kind="stable")[:decile_count]
+    return {
+        "paths": int(worst.size),
+        "survival_probability": float(np.mean(results["survival_months"][worst] >= setup.months)),
+        "ending_total_assets_max": float(total_assets[worst, -1].max()),
+        "total_assets": {
+            "mean": total_assets[worst].mean(axis=0).tolist(),
+            "p50": np.percentile(total_assets[worst], 50, axis=0).tolist(),
+        },
+        "samples": samples,
+    }
+
+
+class ChunkCollector:
+    """
+    청크 결과를 모두 이어 붙이거나(exact), 스트리밍 집계기에 더하고 버린다(sketch).
+    기말 자산 하위 `WORST_PATH_SAMPLES`개 경로와 그 난수 표본은 두 방식 모두 따로 추적한다.
+    """
+
+    def __init__(self, months: int, streaming: bool) -> None:
+        self.aggregation = "sketch" if streaming else "exact"
+        self.aggregator = PathQuantileAggregator(months, PATH_METRICS) if streaming else None
+        self.chunks: List[Dict[str, np.ndarray]] = []
+        self.worst: Dict[str, np.ndarray] = {}
+
+    def add(self, chunk: Dict[str, np.ndarray], offset: int, draws: np.ndarray) -> None:
+        if self.aggregator is not None:
+            self.aggregator.add(chunk)
+        else:
+            self.chunks.append(chunk)
+        self._keep_worst(
+            {
+                "ending": chunk["total_assets"][:, -1],
+                "path": offset + np.arange(draws.shape[0]),
+                "survival": chunk["survival_months"],
+                "block_starts": draws,
+            }
+        )
+
+    def merge(self, other: "ChunkCollector") -> "ChunkCollector":
+        """다른 청크 범위의 수집 결과를 뒤에 합친다 (경로 번호 순서를 유지해야 한다)."""
+        if self.aggregator is not None and other.aggregator is not None:
+            self.aggregator.merge(other.aggregator)
+        self.chunks.extend(other.chunks)
+        if other.worst:
+            self._keep_worst(other.worst)
+        return self
+
+    def _keep_worst(self, candidates: Dict[str, np.ndarray]) -> None:
+        if self.worst:
+            candidates = {
+                key: np.concatenate([self.worst[key], values]) for key, values in candidates.items()
+            }
+        order = np.argsort(candidates["ending"], kind="stable")[:WORST_PATH_SAMPLES]
+        self.worst = {key: values[order] for key, values in candidates.items()}
+
+    def result(self) -> Union[Dict[str, np.ndarray], PathQuantileAggregator]:
+        if self.aggregator is not None:
+            return self.aggregator
+        return {
+            key: np.concatenate([chunk[key] for chunk in self.chunks]) for key in self.chunks[0]
+        }
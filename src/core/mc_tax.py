@@ -0,0 +1,176 @@
+from typing import Any, Dict
+
+import numpy as np
+
+from src.core.mc_state import AccountBook, MonteCarloSetup, TaxLedger
+
+
+def review_cash_need(
+    s: Dict[str, Any],
+    household_need: np.ndarray,
+    pension_base: float,
+    national: float,
+    loan: np.ndarray,
+    monthly_operating_cost: Any = None,
+) -> np.ndarray:
+    if s["personal_operating"]:
+        return np.maximum(0.0, household_need - pension_base - national)
+    return corporate_need(s, household_need, pension_base, national, loan, monthly_operating_cost)
+
+
+def corporate_need(
+    s: Dict[str, Any],
+    household_need: np.ndarray,
+    pension_base: float,
+    national: float,
+    loan: np.ndarray,
+    monthly_operating_cost: Any = None,
+) -> np.ndarray:
+    """
+    ProjectionEngine._corporate_cash_need의 경로 배열 버전.
+    `monthly_operating_cost`는 기장료 + 세무조정료 + 법인세 납부액이며 없으면 기장료만 쓴다.
+    """
+    if not s["corp_enabled"]:
+        return np.zeros_like(household_need)
+    if monthly_operating_cost is None:
+        monthly_operating_cost = s["monthly_bookkeeping_fee"]
+    baseline_gap = np.maximum(0.0, household_need - pension_base - national)
+    loan_payment = np.minimum(loan, np.maximum(0.0, baseline_gap - s["net_salary"]))
+    distribution_net = np.maximum(0.0, baseline_gap - s["net_salary"] - loan_payment)
+    effective_count = s["employee_count"] or (1 if s["corp_salary"] > 0 else 0)
+    operating_cost = s["corp_salary"] * effective_count + monthly_operating_cost
+    return operating_cost + loan_payment + distribution_net / (1.0 - s["withholding_rate"])
+
+
+def corporate_payout(
+    s: Dict[str, Any],
+    ledger: TaxLedger,
+    sim_year: int,
+    sim_month: int,
+    corp_draw: np.ndarray,
+    need: np.ndarray,
+    pension_income: np.ndarray,
+    national: float,
+    loan: np.ndarray,
+    tax_adjustment_fee: float,
+    corp_tax: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    법인 인출액을 급여 → 기장료 → 세무조정료 → 법인세 → 주주대여금 → 배당 순서로 배분하고,
+    실제 지급한 손금(급여·기장료·세무조정료)과 8월 중간예납액을 원장에 남긴다.
+    """
+    effective_count = s["employee_count"] or (1 if s["corp_salary"] > 0 else 0)
+    gross_salary = max(0.0, s["corp_salary"] * effective_count)
+    paid_salary = np.minimum(gross_salary, corp_draw)
+    remaining = corp_draw - paid_salary
+    salary_ratio = paid_salary / gross_salary if gross_salary > 0 else np.ones_like(corp_draw)
+    net_salary = s["net_salary"] * salary_ratio
+    paid_bookkeeping = np.minimum(s["monthly_bookkeeping_fee"], remaining)
+    remaining -= paid_bookkeeping
+    paid_fee = np.minimum(tax_adjustment_fee, remaining)
+    remaining -= paid_fee
+    paid_tax = np.minimum(corp_tax, remaining)
+    remaining -= paid_tax
+    ledger.corp_expenses[sim_year] = (
+        ledger.corp_expenses.get(sim_year, 0.0) + paid_salary + paid_bookkeeping + paid_fee
+    )
+    if sim_month == 8:
+        ledger.corp_prepaid_tax[sim_year] = ledger.corp_prepaid_tax.get(sim_year, 0.0) + paid_tax
+    gap = np.maximum(0.0, need - pension_income - national - s["net_salary"])
+    loan_payment = np.minimum(np.minimum(loan, gap), remaining)
+    remaining -= loan_payment
+    distribution_gross = np.minimum(
+        np.maximum(0.0, gap - np.minimum(loan, gap)) / (1.0 - s["withholding_rate"]),
+        remaining,
+    )
+    delivered = net_salary + loan_payment + distribution_gross * (1.0 - s["withholding_rate"])
+    return delivered, loan - loan_payment
+
+
+def corporate_tax_payment(
+    setup: MonteCarloSetup,
+    ledger: TaxLedger,
+    corp: AccountBook,
+    sim_year: int,
+    sim_month: int,
+) -> np.ndarray:
+    """
+    ProjectionEngine._corporate_tax_payment_plan의 경로 배열 버전.
+    3월에 전년도 법인세에서 중간예납액을 뺀 잔액을, 8월에 전년도 법인세의 절반을 낸다.
+    """
+    tax_year = sim_year - 1
+    if sim_month not in (3, 8) or (
+        tax_year not in ledger.corp_income and tax_year not in ledger.corp_assessed_tax
+    ):
+        return np.zeros_like(corp.realized_gain)
+    assessed = ledger.corp_assessed_tax.get(tax_year)
+    if assessed is None:
+        income = ledger.corp_income.get(tax_year, 0.0) + corp.realized_gain_by_year.get(
+            tax_year, 0.0
+        )
+        tax_base = np.maximum(0.0, income - ledger.corp_expenses.get(tax_year, 0.0))
+        assessed = setup.tax_engine.calculate_corp_tax_array(tax_base)
+        ledger.corp_assessed_tax[tax_year] = assessed
+    if sim_month == 8:
+        return assessed * 0.5
+    return np.maximum(0.0, assessed - ledger.corp_prepaid_tax.get(tax_year, 0.0))
+
+
+def personal_annual_tax(
+    setup: MonteCarloSetup,
+    ledger: TaxLedger,
+    personal: AccountBook,
+    tax_year: int,
+) -> np.ndarray:
+    """전년도 배당 국내 추가세액(소유자별 종합과세 비교)과 양도소득세 합계."""
+    s = setup.scalars
+    tax_engine = setup.tax_engine
+    dividend = ledger.personal_dividend.get(tax_year, np.zeros_like(personal.realized_gain))
+    additional_tax = 0.0
+    for owner, weight in s["personal_owner_weights"].items():
+        detail = tax_engine.calculate_us_dividend_tax_array(
+            dividend * weight,
+            other_financial_income=s["personal_external_financial_income"] * weight,
+            other_comprehensive_tax_base=(
+                s["personal_other_comprehensive_tax_base"] if owner == "self" else 0.0
+            ),
+        )
+        additional_tax = additional_tax + detail["domestic_additional_tax"]
+    realized_gain = personal.realized_gain_by_year.get(tax_year, 0.0)
+    capital_gains = tax_engine.calculate_us_capital_gains_tax_array(realized_gain)
+    return additional_tax + capital_gains["capital_gains_tax"]
+
+
+def health_premium(
+    setup: MonteCarloSetup,
+    ledger: TaxLedger,
+    sim_year: int,
+    sim_month: int,
+    paths: int,
+) -> np.ndarray:
+    """반영 연도 금융소득(소유자별 기준금액 초과분)과 재산으로 계산한 가계 월 건강보험료."""
+    tax_engine = setup.tax_engine
+    lag = tax_engine.health_income_reflection_lag_years
+    reflected_year = (
+        sim_year - lag
+        if sim_month >= tax_engine.health_income_reflection_month
+        else sim_year - lag - 1
+    )
+    premium = ledger.health_premium.get(reflected_year)
+    if premium is not None:
+        return premium
+    s = setup.scalars
+    dividend = ledger.personal_dividend.get(reflected_year, np.zeros(paths))
+    health_income = 0.0
+    for weight in s["personal_owner_weights"].values():
+        income = dividend * weight + s["personal_external_financial_income"] * weight
+        health_income = health_income + np.where(
+            income > tax_engine.health_financial_income_threshold, income, 0.0
+        )
+    premium = tax_engine.calculate_local_health_insurance_array(
+        s["personal_property_assessed_value"], health_income
+    )["total_premium"]
+    # 끝난 해의 소득만 더 바뀌지 않으므로 그때만 기억한다.
+    if reflected_year < sim_year:
+        ledger.health_premium[reflected_year] = premium
+    return premium
@@ -0,0 +1,210 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from src.core.mc_state import (
+    BOND,
+    PERSONAL_OBLIGATION_DONORS,
+    RISK_SLEEVES,
+    SGOV,
+    AccountBook,
+    MonteCarloSetup,
+)
+
+
+def apply_returns(
+    setup: MonteCarloSetup,
+    account: str,
+    balances: np.ndarray,
+    run_rates: np.ndarray,
+    t: int,
+    price_growth: np.ndarray,
+    sgov_dy: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """SGOV는 DY+PA, 나머지 카테고리는 PA 성장 후 run-rate/12를 SGOV로 입금한다."""
+    positive = balances > 0
+    if sgov_dy is None:
+        sgov_dy = setup.monthly_dy[account][t, SGOV]
+    sgov_income = np.where(positive[:, SGOV], balances[:, SGOV] * sgov_dy, 0.0)
+    price_growth[:, SGOV] += sgov_dy
+    income = (run_rates * positive).sum(axis=1) / 12.0
+    balances *= np.where(positive, price_growth, 1.0)
+    balances[:, SGOV] += income
+    run_rates *= np.where(positive, setup.growth_factors[account], 1.0)
+    return sgov_income + income
+
+
+def pay_personal_obligation(
+    setup: MonteCarloSetup, personal: AccountBook, amount: np.ndarray
+) -> np.ndarray:
+    """
+    ProjectionEngine._pay_personal_cash_obligation의 경로 배열 버전.
+    SGOV가 모자란 경로는 Bond → High Income → Dividend Growth → Growth Engine 순서로 매도한다.
+    """
+    due = np.maximum(0.0, amount)
+    sgov = personal.balances[:, SGOV]
+    shortfall = np.where((due > 0) & (sgov < due), due - sgov, 0.0)
+    if shortfall.any():
+        fill_from_sequence(setup, "personal", personal, SGOV, shortfall, PERSONAL_OBLIGATION_DONORS)
+    paid = np.minimum(due, np.maximum(0.0, personal.balances[:, SGOV]))
+    personal.balances[:, SGOV] -= paid
+    return paid
+
+
+def can_fill(balances: np.ndarray, monthly_need: np.ndarray, rules: Dict[str, float]) -> np.ndarray:
+    bond_floor = monthly_need * rules["bond_floor"]
+    sgov_gap = monthly_need * rules["may_sgov"] - balances[:, SGOV]
+    bond_spare = np.maximum(0.0, balances[:, BOND] - bond_floor)
+    risk_total = balances[:, list(RISK_SLEEVES)].sum(axis=1)
+    can_fill_sgov = sgov_gap <= bond_spare + risk_total
+    can_keep_bond = bond_floor - balances[:, BOND] <= risk_total
+    return can_fill_sgov & can_keep_bond
+
+
+def rebalance(
+    setup: MonteCarloSetup,
+    account: str,
+    book: AccountBook,
+    monthly_need: np.ndarray,
+    sgov_months: float,
+    rules: Dict[str, float],
+) -> None:
+    """SGOV 목표 충전 → Bond 목표 충전 → 버퍼 상한 초과분 위험자산 재투자 순서."""
+    balances = book.balances
+    active = monthly_need * sgov_months > 0
+    sgov_target = np.where(active, monthly_need * sgov_months, 0.0)
+    bond_upper = monthly_need * rules["bond_upper"]
+    bond_floor = monthly_need * rules["bond_floor"]
+
+    def move(source: int, target: int, amount: np.ndarray) -> np.ndarray:
+        return transfer(setup, account, book, source, target, amount)
+
+    move(BOND, SGOV, np.where(active, balances[:, BOND] - bond_upper, 0.0))
+    fill_from_sequence(
+        setup,
+        account,
+        book,
+        SGOV,
+        np.maximum(0.0, sgov_target - balances[:, SGOV]),
+        tuple((donor, 0.0) for donor in RISK_SLEEVES) + ((BOND, bond_floor),),
+    )
+    fill_from_sequence(
+        setup,
+        account,
+        book,
+        BOND,
+        np.maximum(0.0, monthly_need * rules["bond_target"] - balances[:, BOND]),
+        tuple((donor, 0.0) for donor in RISK_SLEEVES),
+    )
+    for source, cap in ((SGOV, sgov_target), (BOND, bond_upper)):
+        surplus = np.where(cap > 0, balances[:, source] - cap, 0.0)
+        deploy(setup, account, book, source, np.maximum(0.0, surplus))
+
+
+def fill_from_sequence(
+    setup: MonteCarloSetup,
+    account: str,
+    book: AccountBook,
+    target: int,
+    needed: np.ndarray,
+    donor_sequence: tuple,
+) -> None:
+    """
+    ProjectionEngine._transfer_from_sequence의 경로 배열 버전.
+    전략 비중이 있으면 비중 초과분이 큰 위험자산부터 먼저 매도한 뒤 순서대로 부족분을 채운다.
+    """
+    balances = book.balances
+    remaining = needed.copy()
+    weights = setup.target_weights[account]
+    if weights is not None:
+        total_assets = balances.sum(axis=1)
+
+        def overweight(donor: int, floor: Any) -> np.ndarray:
+            return np.maximum(
+                0.0,
+                np.minimum(
+                    balances[:, donor] - floor,
+                    balances[:, donor] - total_assets * weights[donor],
+                ),
+            )
+
+        candidates = [(donor, floor) for donor, floor in donor_sequence if donor != BOND]
+        available = np.column_stack([overweight(donor, floor) for donor, floor in candidates])
+        ranking = np.argsort(-available, axis=1, kind="stable")
+        for rank in range(len(candidates)):
+            for column, (donor, _) in enumerate(candidates):
+                selected = (ranking[:, rank] == column) & (available[:, column] > 0)
+                amount = np.where(selected, np.minimum(available[:, column], remaining), 0.0)
+                remaining -= transfer(setup, account, book, donor, target, amount)
+    for donor, floor in donor_sequence:
+        if weights is not None:
+            amount = np.minimum(overweight(donor, floor), remaining)
+            remaining -= transfer(setup, account, book, donor, target, amount)
+        amount = np.minimum(np.maximum(0.0, balances[:, donor] - floor), remaining)
+        remaining -= transfer(setup, account, book, donor, target, amount)
+
+
+def deploy(
+    setup: MonteCarloSetup,
+    account: str,
+    book: AccountBook,
+    source: int,
+    amount: np.ndarray,
+) -> None:
+    sleeves = list(RISK_SLEEVES)
+    weights = np.maximum(0.0, book.balances[:, sleeves])
+    existing = weights.sum(axis=1)
+    shares = np.where(
+        existing[:, None] > 0,
+        np.divide(
+            weights, existing[:, None], out=np.zeros_like(weights), where=existing[:, None] > 0
+        ),
+        np.array([0.0, 0.0, 1.0]),
+    )
+    allocations = amount[:, None] * shares
+    for column, sleeve in enumerate(sleeves):
+        transfer(setup, account, book, source, sleeve, allocations[:, column])
+
+
+def transfer(
+    setup: MonteCarloSetup,
+    account: str,
+    book: AccountBook,
+    source: int,
+    target: int,
+    amount: np.ndarray,
+) -> np.ndarray:
+    """
+    ProjectionEngine._transfer의 잔액/run-rate/취득원가 이동 규칙을 경로 배열에 적용한다.
+    SGOV가 아닌 카테고리에서 매도하면 평균 취득원가 기준 실현손익을 올해 손익에 더한다.
+    """
+    balances, run_rates, cost_basis = book.balances, book.run_rates, book.cost_basis
+    before = balances[:, source].copy()
+    moved = np.minimum(np.maximum(amount, 0.0), np.maximum(before, 0.0))
+    if source != SGOV:
+        ratio = np.divide(moved, before, out=np.zeros_like(moved), where=before > 0)
+        run_rates[:, source] = np.maximum(
+            0.0, run_rates[:, source] - run_rates[:, source] * np.minimum(1.0, ratio)
+        )
+        basis = np.maximum(0.0, cost_basis[:, source])
+        basis_sold = np.divide(basis * moved, before, out=np.zeros_like(moved), where=before > 0)
+        cost_basis[:, source] = np.maximum(0.0, basis - basis_sold)
+        book.realized_gain += moved - basis_sold
+    cost_basis[:, target] = np.maximum(0.0, cost_basis[:, target]) + moved
+    balances[:, source] = before - moved
+    balances[:, target] += moved
+    if target != SGOV:
+        structural_yield = setup.structural_yields[account][target]
+        if np.isnan(structural_yield):
+            structural_yield = np.where(
+                sole_risk_sleeves(balances)[:, target], setup.sole_yields[account], 0.0
+            )
+        run_rates[:, target] += moved * structural_yield
+    return moved
+
+
+def sole_risk_sleeves(balances: np.ndarray) -> np.ndarray:
+    """경로별로 SGOV 외 잔액이 있는 카테고리가 하나뿐이면 그 칸만 True인 마스크."""
+    risk = balances > 0
+    risk[:, SGOV] = False
+    return risk & (risk.sum(axis=1) == 1)[:, None]
@@ -0,0 +1,265 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import numpy as np
+
+from src.core.historical_series import HistoricalSeries
+from src.core.mc_paths import simulate_chunk
+from src.core.mc_sampler import (
+    BootstrapSampler,
+    ParametricSampler,
+    PathSampler,
+    bootstrap_replay_params,
+    bootstrap_sampler,
+    shock_model,
+)
+from src.core.mc_setup import prepare_setup
+from src.core.mc_state import PATH_METRICS, MonteCarloSetup
+from src.core.mc_summary import (
+    ChunkCollector,
+    first_shortfall_distribution,
+    summarize,
+    worst_decile,
+)
+from src.core.path_quantiles import PathQuantileAggregator
+from src.core.projection_engine import ProjectionEngine
+from src.core.rng_streams import RNG_STREAM_MODEL, PathRandomStreams
+
+
+class MonteCarloEngine:
+    """
+    [Domain Layer] 벡터화 몬테카를로 은퇴 시뮬레이션 엔진
+    결정론 엔진(ProjectionEngine)의 계좌 초기화/수익률 규칙을 재사용하되, 계좌 잔액을
+    (paths, categories) 배열로 보관하여 수천 개 경로의 월간 운용을 한 번에 계산한다.
+    법인세 정산(3월·8월 중간예납), 개인 해외 원천징수·배당 종합과세·양도소득세, 지역 건강보험료도
+    TaxEngine 배열 API로 경로별로 계산해 결정론 엔진과 같은 달에 같은 순서로 납부한다.
+    """
+
+    def __init__(self, projection_engine: ProjectionEngine) -> None:
+        self.projection_engine = projection_engine
+
+    def run(
+        self,
+        initial_assets: Dict[str, float],
+        params: Dict[str, Any],
+        *,
+        paths: int = 1000,
+        seed: Optional[int] = None,
+        chunk_size: int = 2000,
+        streaming: bool = False,
+        max_workers: Optional[int] = 1,
+    ) -> Dict[str, Any]:
+        """
+        `streaming=True`이면 청크 결과를 `PathQuantileAggregator`에 더한 뒤 버려, 경로 수와
+        무관한 메모리로 월별 백분위 밴드(상대오차 0.5% 이내 추정)를 만든다.
+        경로마다 master seed에서 파생한 독립 난수 스트림을 쓰므로 결과는 청크 크기·워커 수와
+        무관하고, 실제 사용한 seed는 meta에 남는다(`replay_path`로 경로 하나만 재계산 가능).
+        """
+        paths = max(1, int(paths))
+        setup = self.prepare(initial_assets, params)
+        streams = PathRandomStreams(seed)
+        collected = self._simulate_paths(
+            setup,
+            ParametricSampler(*shock_model(params)),
+            streams,
+            paths,
+            chunk_size=chunk_size,
+            streaming=streaming,
+            max_workers=max_workers,
+        )
+
+        return summarize(
+            setup,
+            collected.result(),
+            meta={
+                "paths": paths,
+                "seed": streams.seed,
+                "rng": RNG_STREAM_MODEL,
+                "mode": "parametric",
+                "aggregation": collected.aggregation,
+            },
+        )
+
+    def run_bootstrap(
+        self,
+        initial_assets: Dict[str, float],
+        params: Dict[str, Any],
+        series: HistoricalSeries,
+        holdings: Mapping[str, Iterable[Mapping[str, Any]]],
+        *,
+        paths: int = 1000,
+        block_months: int = 12,
+        seed: Optional[int] = None,
+        chunk_size: int = 2000,
+        replay_worst: int = 0,
+        streaming: bool = False,
+        max_workers: Optional[int] = 1,
+    ) -> Dict[str, Any]:
+        """
+        과거 카테고리 월수익률을 `block_months` 길이 블록으로 (순환) 재표집해 경로를 만든다.
+        블록 시작 월은 경로마다 한 번 뽑아 모든 계좌·카테고리에 같이 적용하므로 카테고리 간
+        상관과 월 순서가 블록 안에서 유지된다. 수익률 변환은 `monthly_return_overrides`와 같고,
+        시계열이 없는 카테고리는 기존 월 수익률 가정을 쓴다. `replay_worst`개 최악 경로는
+        같은 표본을 `monthly_return_overrides`로 만들어 결정론 엔진으로 다시 계산한다.
+        `streaming=True`이면 최악 10% 경로의 궤적 대신 기말 자산 경계 추정값만 싣는다.
+        """
+        paths = max(1, int(paths))
+        setup = self.prepare(initial_assets, params)
+        sampler, unmapped = bootstrap_sampler(setup, series, holdings, block_months)
+        history = sampler.history
+        streams = PathRandomStreams(seed)
+        collected = self._simulate_paths(
+            setup,
+            sampler,
+            streams,
+            paths,
+            chunk_size=chunk_size,
+            streaming=streaming,
+            max_workers=max_workers,
+        )
+        worst_samples = collected.worst
+
+        results = collected.result()
+        result = summarize(
+            setup,
+            results,
+            meta={
+                "paths": paths,
+                "seed": streams.seed,
+                "rng": RNG_STREAM_MODEL,
+                "mode": "block_bootstrap",
+                "aggregation": collected.aggregation,
+                "block_months": sampler.block_months,
+                "history_start": history.months[0],
+                "history_end": history.months[-1],
+                "history_months": len(history.months),
+                "unmapped_holdings": unmapped,
+            },
+        )
+        shortfall_counts = (
+            results.first_shortfall_counts
+            if isinstance(results, PathQuantileAggregator)
+            else np.bincount(results["first_shortfall_index"] + 1, minlength=setup.months + 1)
+        )
+        result["first_shortfall"] = first_shortfall_distribution(setup, shortfall_counts)
+
+        samples = []
+        for rank, path in enumerate(worst_samples["path"].tolist()):
+            sample = {
+                "path": path,
+                "ending_total_assets": float(worst_samples["ending"][rank]),
+                "survival_months": int(worst_samples["survival"][rank]),
+                "block_starts": [
+                    history.months[row] for row in worst_samples["block_starts"][rank].tolist()
+                ],
+            }
+            if rank < replay_worst:
+                replay_params = bootstrap_replay_params(
+                    params,
+                    setup,
+                    history,
+                    worst_samples["block_starts"][rank],
+                    sampler.block_months,
+                )
+                sample["replay_summary"] = self.projection_engine.run_30yr_simulation(
+                    initial_assets, replay_params
+                )["summary"]
+            samples.append(sample)
+        result["worst_decile"] = worst_decile(setup, results, paths, samples)
+        return result
+
+    def replay_path(
+        self,
+        initial_assets: Dict[str, float],
+        params: Dict[str, Any],
+        *,
+        seed: int,
+        path: int,
+        series: Optional[HistoricalSeries] = None,
+        holdings: Optional[Mapping[str, Iterable[Mapping[str, Any]]]] = None,
+        block_months: int = 12,
+    ) -> Dict[str, Any]:
+        """
+        배치 실행의 meta `seed`와 경로 번호로 그 경로 하나만 다시 계산해 월별 값을 돌려준다.
+        `series`·`holdings`를 주면 같은 설정의 `run_bootstrap` 경로를, 아니면 `run` 경로를 재현한다.
+        """
+        path = int(path)
+        if path < 0:
+            raise ValueError("path는 0 이상이어야 합니다.")
+        setup = self.prepare(initial_assets, params)
+        if series is not None:
+            sampler, _ = bootstrap_sampler(setup, series, holdings or {}, block_months)
+        else:
+            sampler = ParametricSampler(*shock_model(params))
+        streams = PathRandomStreams(seed)
+        growth_fn, yield_fn, draws = sampler.draw(setup, streams, path, 1)
+        chunk = simulate_chunk(setup, 1, growth_fn, yield_fn)
+        first_shortfall = int(chunk["first_shortfall_index"][0])
+        result = {
+            "path": path,
+            "seed": streams.seed,
+            "mode": sampler.mode,
+            "months": [f"{year}-{month:02d}" for year, month, _ in setup.calendar],
+            **{metric: chunk[metric][0].tolist() for metric in PATH_METRICS},
+            "survival_months": int(chunk["survival_months"][0]),
+            "first_shortfall": (
+                "{}-{:02d}".format(*setup.calendar[first_shortfall][:2])
+                if first_shortfall >= 0
+                else None
+            ),
+        }
+        if isinstance(sampler, BootstrapSampler):
+            result["block_starts"] = [sampler.history.months[row] for row in draws[0].tolist()]
+        return result
+
+    def prepare(self, initial_assets: Dict[str, float], params: Dict[str, Any]) -> MonteCarloSetup:
+        return prepare_setup(self.projection_engine, initial_assets, params)
+
+    def _simulate_paths(
+        self,
+        setup: MonteCarloSetup,
+        sampler: PathSampler,
+        streams: PathRandomStreams,
+        paths: int,
+        *,
+        chunk_size: int,
+        streaming: bool,
+        max_workers: Optional[int],
+    ) -> ChunkCollector:
+        """
+        경로를 청크로 나눠 (가능하면 프로세스 풀에서) 계산하고 청크 순서대로 합친다.
+        경로별 난수 스트림을 쓰므로 청크 분할·워커 수가 달라도 경로별 결과는 같다.
+        """
+        chunk_size = max(1, int(chunk_size))
+        jobs = [(start, min(chunk_size, paths - start)) for start in range(0, paths, chunk_size)]
+        collected = ChunkCollector(setup.months, streaming)
+        if max_workers == 1 or len(jobs) <= 1:
+            for start, count in jobs:
+                collected.merge(
+                    _simulate_paths_job(setup, sampler, streams, start, count, streaming)
+                )
+            return collected
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(_simulate_paths_job, setup, sampler, streams, start, count, streaming)
+                for start, count in jobs
+            ]
+            for future in futures:
+                collected.merge(future.result())
+        return collected
+
+
+def _simulate_paths_job(
+    setup: MonteCarloSetup,
+    sampler: PathSampler,
+    streams: PathRandomStreams,
+    start: int,
+    count: int,
+    streaming: bool,
+) -> ChunkCollector:
+    """경로 start..start+count-1을 계산한다. 프로세스 풀 워커에서도 호출된다."""
+    growth_fn, yield_fn, draws = sampler.draw(setup, streams, start, count)
+    collected = ChunkCollector(setup.months, streaming)
+    collected.add(simulate_chunk(setup, count, growth_fn, yield_fn), start, draws)
+    return collected
@@ -0,0 +1,187 @@
+import math
+from typing import Any, Dict, List, Mapping, Sequence
+
+import numpy as np
+
+# 경로 지표 -> 로그 구간 범위. 범위 밖 값은 양 끝 구간에 모이고, 월별 최소/최대로 잘라낸다.
+METRIC_RANGES = {
+    "total_assets": (1.0e4, 1.0e14),
+    "sgov_months": (1.0e-3, 1.0e4),
+    "household_cash": (1.0e3, 1.0e11),
+}
+DEFAULT_RELATIVE_ACCURACY = 0.005
+
+
+def histogram_percentiles(
+    counts: np.ndarray, percentiles: Sequence[float], method: str = "linear"
+) -> np.ndarray:
+    """
+    정수 값 0..len(counts)-1의 도수(counts)에서 `np.percentile`과 같은 백분위를 구한다.
+    `linear`는 이웃 순위 사이를 보간하고, `lower`는 아래 순위 값을 돌려준다.
+    """
+    total = int(counts.sum())
+    if total == 0:
+        raise ValueError("백분위를 계산할 표본이 없습니다.")
+    cumulative = np.cumsum(counts)
+    ranks = np.asarray(percentiles, dtype=float) / 100.0 * (total - 1)
+    below = np.floor(ranks)
+    low = np.searchsorted(cumulative, below, side="right").astype(float)
+    if method == "lower":
+        return low
+    high = np.searchsorted(cumulative, np.ceil(ranks), side="right").astype(float)
+    return low + (high - low) * (ranks - below)
+
+
+class QuantileSketch:
+    """
+    [Domain Layer] 월별 고정 로그 구간 히스토그램 (병합 가능한 분위수 스케치)
+    값 v ≥ min_value는 구간 floor(log(v / min_value) / log(gamma))에 세고, 그보다 작은 값
+    (0·음수 포함)은 0으로 추정하는 0번 구간에 센다. gamma = (1 + a) / (1 - a)이므로 구간
+    대표값의 상대오차는 `relative_accuracy`(a) 이하다. 메모리는 (개월 수 × 구간 수)로 경로 수와
+    무관하며, 같은 설정의 스케치끼리 도수를 더하면(`merge`) 전체 표본을 한 번에 넣은 것과 같다.
+    """
+
+    def __init__(
+        self,
+        months: int,
+        *,
+        min_value: float,
+        max_value: float,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy는 0과 1 사이여야 합니다.")
+        if not 0.0 < min_value < max_value:
+            raise ValueError("0 < min_value < max_value 범위가 필요합니다.")
+        self.months = int(months)
+        self.min_value = float(min_value)
+        self.max_value = float(max_value)
+        self.relative_accuracy = float(relative_accuracy)
+        self.gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bin_count = int(math.ceil(math.log(max_value / min_value) / self._log_gamma)) + 1
+        self.counts = np.zeros((self.months, self.bin_count), dtype=np.int64)
+        self.minimum = np.full(self.months, np.inf)
+        self.maximum = np.full(self.months, -np.inf)
+        self.count = 0
+
+    def add(self, values: np.ndarray) -> None:
+        """(paths, months) 값 배열의 경로들을 월별 히스토그램에 더한다."""
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 2 or values.shape[1] != self.months:
+            raise ValueError(f"(paths, {self.months}) 모양의 배열이 필요합니다.")
+        if values.shape[0] == 0:
+            return
+        bins = np.zeros(values.shape, dtype=np.int64)
+        above = values >= self.min_value
+        bins[above] = 1 + np.minimum(
+            self.bin_count - 2,
+            np.floor(np.log(values[above] / self.min_value) / self._log_gamma).astype(np.int64),
+        )
+        bins += np.arange(self.months, dtype=np.int64) * self.bin_count
+        self.counts += np.bincount(bins.ravel(), minlength=self.counts.size).reshape(
+            self.counts.shape
+        )
+        np.minimum(self.minimum, values.min(axis=0), out=self.minimum)
+        np.maximum(self.maximum, values.max(axis=0), out=self.maximum)
+        self.count += values.shape[0]
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        if (
+            other.months != self.months
+            or other.bin_count != self.bin_count
+            or other.min_value != self.min_value
+            or other.relative_accuracy != self.relative_accuracy
+        ):
+            raise ValueError("구간 설정이 다른 스케치는 병합할 수 없습니다.")
+        self.counts += other.counts
+        np.minimum(self.minimum, other.minimum, out=self.minimum)
+        np.maximum(self.maximum, other.maximum, out=self.maximum)
+        self.count += other.count
+        return self
+
+    def quantiles(self, percentiles: Sequence[float]) -> np.ndarray:
+        """
+        (len(percentiles), months) 월별 분위수 추정값. `np.percentile`(linear)처럼 이웃 두 순위의
+        구간 대표값 사이를 보간하므로, 추정값의 상대오차도 `relative_accuracy` 이하다.
+        """
+        if self.count == 0:
+            raise ValueError("분위수를 계산할 표본이 없습니다.")
+        cumulative = np.cumsum(self.counts, axis=1)
+        ranks = np.asarray(percentiles, dtype=float) / 100.0 * (self.count - 1)
+        below = np.floor(ranks)
+        low = np.clip(self._rank_values(cumulative, below), self.minimum, self.maximum)
+        high = np.clip(self._rank_values(cumulative, np.ceil(ranks)), self.minimum, self.maximum)
+        return low + (high - low) * (ranks - below)[:, None]
+
+    def _rank_values(self, cumulative: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+        # 월마다 누적도수가 순위를 처음 넘는 구간
+        bins = (cumulative[None, :, :] <= ranks[:, None, None]).sum(axis=2)
+        # 구간 [m·g^j, m·g^(j+1))의 대표값 2·m·g^(j+1)/(g+1): 상대오차가 a 이하다.
+        return np.where(
+            bins > 0,
+            self.min_value * self.gamma ** bins.astype(float) * 2.0 / (self.gamma + 1.0),
+            0.0,
+        )
+
+
+class PathQuantileAggregator:
+    """
+    [Domain Layer] 경로 결과 스트리밍 집계기
+    청크마다 나오는 (paths, months) 지표를 월별 `QuantileSketch`에 더하고, 생존 개월·최초 미충족
+    월은 정수 도수로 센 뒤 버린다. 워커 프로세스별 집계기는 `merge`로 합칠 수 있다.
+    """
+
+    def __init__(
+        self,
+        months: int,
+        metrics: Sequence[str] = tuple(METRIC_RANGES),
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ) -> None:
+        self.months = int(months)
+        self.sketches = {
+            metric: QuantileSketch(
+                months,
+                min_value=METRIC_RANGES[metric][0],
+                max_value=METRIC_RANGES[metric][1],
+                relative_accuracy=relative_accuracy,
+            )
+            for metric in metrics
+        }
+        self.survival_counts = np.zeros(self.months + 1, dtype=np.int64)
+        # 0번은 미충족 없음, t + 1번은 t번째 달 최초 미충족
+        self.first_shortfall_counts = np.zeros(self.months + 1, dtype=np.int64)
+
+    @property
+    def paths(self) -> int:
+        return int(self.survival_counts.sum())
+
+    def add(self, chunk: Mapping[str, np.ndarray]) -> None:
+        for metric, sketch in self.sketches.items():
+            sketch.add(chunk[metric])
+        self.survival_counts += np.bincount(chunk["survival_months"], minlength=self.months + 1)
+        self.first_shortfall_counts += np.bincount(
+            chunk["first_shortfall_index"] + 1, minlength=self.months + 1
+        )
+
+    def merge(self, other: "PathQuantileAggregator") -> "PathQuantileAggregator":
+        if set(other.sketches) != set(self.sketches) or other.months != self.months:
+            raise ValueError("지표 구성이 다른 집계기는 병합할 수 없습니다.")
+        for metric, sketch in self.sketches.items():
+            sketch.merge(other.sketches[metric])
+        self.survival_counts += other.survival_counts
+        self.first_shortfall_counts += other.first_shortfall_counts
+        return self
+
+    def bands(self, percentiles: Sequence[float]) -> Dict[str, Dict[str, List[float]]]:
+        result: Dict[str, Dict[str, List[float]]] = {}
+        for metric, sketch in self.sketches.items():
+            table = sketch.quantiles(percentiles)
+            result[metric] = {f"p{pct}": table[i].tolist() for i, pct in enumerate(percentiles)}
+        return result
+
+    def memory_bytes(self) -> int:
+        arrays: List[Any] = [self.survival_counts, self.first_shortfall_counts]
+        for sketch in self.sketches.values():
+            arrays.extend([sketch.counts, sketch.minimum, sketch.maximum])
+        return int(sum(array.nbytes for array in arrays))
@@ -1,40 +1,366 @@
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from copy import deepcopy
-from typing import Any, Dict
-
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.core.account_state import (
+    CATEGORY_INDEX,
+    CATEGORY_ORDER,
+    EQUITY_INDEXES,
+    SGOV_INDEX,
+    AccountState,
+    CategoryArray,
+)
 from src.core.operating_account import (
     OperatingAccountContext,
     operating_policy_key,
     select_operating_account,
 )
+from src.core.projection_output import (
+    OUTPUT_FORMATS,
+    OUTPUT_RESOLUTIONS,
+    RUN_MODES,
+    format_monthly_output,
+)
+from src.core.rate_table import MonthlyRateTable, RateEntry
+from src.core.run_context import (
+    ACTIVE_RUN,
+    SCOPED_TAX_ENGINE,
+    DistributionRuleCache,
+    ProjectionRunContext,
+)
+from src.core.stage_profiler import StageProfiler
 from src.core.tax_engine import TaxEngine
+from src.core.trade_log import TRADE_EVENTS_MODES, TradeLog, realized_gain_for
+
+
+def _run_simulation_job(
+    tax_engine: TaxEngine, initial_assets: Dict[str, float], params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """프로세스 풀 워커: 독립 엔진 인스턴스로 한 개의 파라미터 세트를 실행한다."""
+    return ProjectionEngine(tax_engine=tax_engine).run_30yr_simulation(initial_assets, params)
+
+
+CHECKPOINT_VERSION = 1
+# 접두 구간 캐시 키에서 제외하는 파라미터(결과 형식·캐시 제어용이거나 현금흐름 자체).
+PREFIX_CACHE_EXCLUDED_PARAMS = frozenset(
+    {
+        "planned_cashflows",
+        "reuse_cached_prefix",
+        "checkpoint_interval_months",
+        "output_resolution",
+        "output_format",
+        "profile",
+        "trade_events_mode",
+    }
+)
+
+
+def _copy_monthly_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """월간 행 사본. 계약자별 값 같은 한 단계 중첩 dict까지 복사해 원본과 상태를 공유하지 않는다."""
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in row.items()}
+
+
+def _year_keyed(values: Dict[Any, Any]) -> Dict[int, Any]:
+    """JSON 왕복으로 문자열이 된 연도 키를 int로 되돌린다."""
+    return {int(year): value for year, value in values.items()}
 
 
 class ProjectionEngine:
     """OS v11.1 기준 월간 은퇴 운용 시뮬레이션 엔진."""
 
-    CATEGORY_ORDER = (
-        "SGOV Buffer",
-        "Bond Buffer",
-        "High Income",
-        "Dividend Growth",
-        "Growth Engine",
-    )
+    CATEGORY_ORDER = CATEGORY_ORDER
+    RATE_TABLE_CACHE_SIZE = 16
+    PREFIX_CACHE_SIZE = 8
+    PREFIX_CHECKPOINT_MONTHS = 12
 
     def __init__(
         self,
         tax_engine: TaxEngine,
     ):
         self.tax_engine = tax_engine
+        self._rate_table_cache: Dict[str, MonthlyRateTable] = {}
+        self._rate_table_lock = Lock()
+        # 캐시 키 -> (해당 실행의 planned_cashflows, 체크포인트 목록)
+        self._prefix_cache: (
+            "OrderedDict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]"
+        ) = OrderedDict()
+        self._prefix_cache_lock = Lock()
+
+    @property
+    def tax_engine(self) -> TaxEngine:
+        """실행 중이면 그 실행의 세금 엔진, 아니면 범위 오버라이드나 기본 세금 엔진을 반환한다."""
+        run_context = self._active_run()
+        if run_context is not None:
+            return run_context.tax_engine
+        return self._scoped_tax_engine() or self._tax_engine
+
+    @tax_engine.setter
+    def tax_engine(self, tax_engine: TaxEngine) -> None:
+        self._tax_engine = tax_engine
+
+    @contextmanager
+    def using_tax_engine(self, tax_engine: TaxEngine) -> Iterator["ProjectionEngine"]:
+        """
+        블록 안의 실행에만 `tax_engine`을 적용한다.
+        공유 엔진의 기본 세금 엔진을 바꾸지 않으므로 동시 요청 간에 설정이 섞이지 않는다.
+        """
+        token = SCOPED_TAX_ENGINE.set((id(self), tax_engine))
+        try:
+            yield self
+        finally:
+            SCOPED_TAX_ENGINE.reset(token)
+
+    def _scoped_tax_engine(self) -> Optional[TaxEngine]:
+        scoped = SCOPED_TAX_ENGINE.get()
+        if scoped is not None and scoped[0] == id(self):
+            return scoped[1]
+        return None
+
+    # 실행 밖에서 헬퍼를 직접 호출할 때만 쓰는 상태. 실행 중에는 실행 컨텍스트 값이 우선한다.
+    @property
+    def _active_cost_basis_by_account(self) -> Dict[str, Any]:
+        run_context = self._active_run()
+        if run_context is not None:
+            return run_context.cost_basis_by_account
+        return getattr(self, "_detached_cost_basis_by_account", {})
+
+    @_active_cost_basis_by_account.setter
+    def _active_cost_basis_by_account(self, cost_basis_by_account: Dict[str, Any]) -> None:
+        run_context = self._active_run()
+        if run_context is not None:
+            run_context.cost_basis_by_account = cost_basis_by_account
+        else:
+            self._detached_cost_basis_by_account = cost_basis_by_account
+
+    @property
+    def _active_trade_events(self) -> Optional[Any]:
+        run_context = self._active_run()
+        if run_context is not None:
+            return run_context.trade_events
+        return getattr(self, "_detached_trade_events", None)
+
+    @_active_trade_events.setter
+    def _active_trade_events(self, trade_events: Any) -> None:
+        run_context = self._active_run()
+        if run_context is not None:
+            run_context.trade_events = trade_events
+        else:
+            self._detached_trade_events = trade_events
+
+    def _active_run(self) -> Optional[ProjectionRunContext]:
+        run_context = ACTIVE_RUN.get()
+        if run_context is not None and run_context.engine_id == id(self):
+            return run_context
+        return None
 
     def run_30yr_simulation(
-        self, initial_assets: Dict[str, float], params: Dict[str, Any]
+        self,
+        initial_assets: Dict[str, float],
+        params: Dict[str, Any],
+        *,
+        tax_engine: Optional[TaxEngine] = None,
     ) -> Dict[str, Any]:
+        """
+        30년(또는 `simulation_years`) 월간 시뮬레이션을 실행한다.
+        `tax_engine`을 주면 이 실행에만 적용되며 공유 엔진의 기본 세금 엔진은 바뀌지 않는다.
+        `reuse_cached_prefix`가 켜져 있으면 `planned_cashflows`만 다른 최근 실행의 체크포인트를
+        재사용해 바뀐 현금흐름이 처음 영향을 주는 달부터만 다시 계산한다.
+        """
         sim_years = int(params.get("simulation_years", 30))
-        return self._execute_loop(initial_assets, params, months=sim_years * 12)
+        if params.get("reuse_cached_prefix"):
+            return self._run_with_cached_prefix(
+                initial_assets, params, sim_years * 12, tax_engine or self.tax_engine
+            )
+        return self._execute_loop(
+            initial_assets, params, months=sim_years * 12, tax_engine=tax_engine
+        )
+
+    def _run_with_cached_prefix(
+        self,
+        initial_assets: Dict[str, float],
+        params: Dict[str, Any],
+        months: int,
+        tax_engine: TaxEngine,
+    ) -> Dict[str, Any]:
+        planned_cashflows = deepcopy(list(params.get("planned_cashflows") or []))
+        cache_key = self._prefix_cache_key(initial_assets, params, months, tax_engine)
+        with self._prefix_cache_lock:
+            cached = self._prefix_cache.get(cache_key)
+            if cached is not None:
+                self._prefix_cache.move_to_end(cache_key)
+
+        checkpoint = None
+        reused_checkpoints: List[Dict[str, Any]] = []
+        if cached is not None:
+            cached_cashflows, cached_checkpoints = cached
+            first_index = self._first_changed_cashflow_index(
+                cached_cashflows, planned_cashflows, params
+            )
+            reused_checkpoints = [cp for cp in cached_checkpoints if cp["index"] < first_index]
+            checkpoint = reused_checkpoints[-1] if reused_checkpoints else None
+
+        run_params = {**params, "checkpoint_interval_months": self.PREFIX_CHECKPOINT_MONTHS}
+        result = self._execute_loop(
+            initial_assets, run_params, months=months, tax_engine=tax_engine, checkpoint=checkpoint
+        )
+        # 캐시용 체크포인트는 응답에 싣지 않는다.
+        checkpoints = reused_checkpoints + result["checkpoints"]
+        result["checkpoints"] = []
+        result["resumed_from_month"] = 0 if checkpoint is None else checkpoint["index"]
+
+        with self._prefix_cache_lock:
+            self._prefix_cache[cache_key] = (planned_cashflows, checkpoints)
+            self._prefix_cache.move_to_end(cache_key)
+            while len(self._prefix_cache) > self.PREFIX_CACHE_SIZE:
+                self._prefix_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _prefix_cache_key(
+        initial_assets: Dict[str, float],
+        params: Dict[str, Any],
+        months: int,
+        tax_engine: TaxEngine,
+    ) -> str:
+        # 같은 설정의 세금 엔진도 다른 인스턴스일 수 있으므로 객체가 아닌 설정값으로 비교한다.
+        tax_settings = {
+            key: value for key, value in vars(tax_engine).items() if not key.startswith("_")
+        }
+        cached_params = {
+            key: value for key, value in params.items() if key not in PREFIX_CACHE_EXCLUDED_PARAMS
+        }
+        return repr((months, sorted(initial_assets.items()), cached_params, tax_settings))
+
+    @staticmethod
+    def _first_changed_cashflow_index(
+        previous: List[Dict[str, Any]], current: List[Dict[str, Any]], params: Dict[str, Any]
+    ) -> float:
+        """추가·삭제·수정된 현금흐름 중 가장 이른 달의 루프 인덱스(1부터). 변경이 없으면 무한대."""
+        remaining = [repr(sorted(event.items())) for event in previous]
+        changed = []
+        for event in current:
+            event_key = repr(sorted(event.items()))
+            if event_key in remaining:
+                remaining.remove(event_key)
+            else:
+                changed.append(event)
+        removed_keys = set(remaining)
+        changed.extend(event for event in previous if repr(sorted(event.items())) in removed_keys)
+        if not changed:
+            return float("inf")
+        start_year = int(params.get("simulation_start_year", 2026))
+        start_month = int(params.get("simulation_start_month", 1))
+        try:
+            return min(
+                (int(event["year"]) - start_year) * 12 + int(event["month"]) - start_month + 1
+                for event in changed
+            )
+        except (KeyError, TypeError, ValueError):
+            return 1
+
+    def run_batch(
+        self,
+        initial_assets: Dict[str, float],
+        params_list: Iterable[Dict[str, Any]],
+        *,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[Dict[str, Any]]:
+        """파라미터 세트 목록을 병렬 실행하고 입력 순서대로 결과를 반환한다."""
+        params_list = list(params_list)
+        results: List[Dict[str, Any]] = [{} for _ in params_list]
+        for index, result in self.iter_batch(
+            initial_assets, params_list, max_workers=max_workers, executor=executor
+        ):
+            results[index] = result
+        return results
+
+    def iter_batch(
+        self,
+        initial_assets: Dict[str, float],
+        params_list: Iterable[Dict[str, Any]],
+        *,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """완료되는 순서대로 (입력 인덱스, 결과)를 스트리밍한다. 각 세트는 독립된 360개월 루프다."""
+        params_list = list(params_list)
+        if executor is None and (max_workers == 1 or len(params_list) <= 1):
+            for index, params in enumerate(params_list):
+                yield index, _run_simulation_job(self.tax_engine, initial_assets, deepcopy(params))
+            return
+
+        owned_executor = executor is None
+        pool = executor or ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                pool.submit(
+                    _run_simulation_job, self.tax_engine, initial_assets, deepcopy(params)
+                ): index
+                for index, params in enumerate(params_list)
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            if owned_executor:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def resume_from(
+        self,
+        checkpoint: Dict[str, Any],
+        params: Dict[str, Any],
+        months: Optional[int] = None,
+        *,
+        tax_engine: Optional[TaxEngine] = None,
+    ) -> Dict[str, Any]:
+        """
+        `checkpoint_interval_months`로 만든 체크포인트 다음 달부터 남은 구간만 다시 계산한다.
+        체크포인트 시점까지의 결과는 그대로 이어 붙이므로, `params` 변경은 체크포인트 이후
+        달에만 영향을 주는 값이어야 한다. `months`를 생략하면 `simulation_years` 전체 구간이다.
+        """
+        if int(checkpoint.get("version", 0)) != CHECKPOINT_VERSION:
+            raise ValueError("지원하지 않는 체크포인트 버전입니다.")
+        if months is None:
+            months = int(params.get("simulation_years", 30)) * 12
+        return self._execute_loop(
+            {}, params, months=months, tax_engine=tax_engine, checkpoint=checkpoint
+        )
 
     def _execute_loop(
-        self, initial_assets: Dict[str, float], params: Dict[str, Any], months: int
+        self,
+        initial_assets: Dict[str, float],
+        params: Dict[str, Any],
+        months: int,
+        *,
+        tax_engine: Optional[TaxEngine] = None,
+        checkpoint: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
+        # 실행 상태(취득원가·거래 이벤트·세금 엔진)는 인스턴스가 아닌 실행 컨텍스트에 둔다.
+        run_context = ProjectionRunContext(
+            engine_id=id(self),
+            tax_engine=tax_engine or self._scoped_tax_engine() or self._tax_engine,
+        )
+        token = ACTIVE_RUN.set(run_context)
+        try:
+            return self._run_loop(initial_assets, params, months, run_context, checkpoint)
+        finally:
+            ACTIVE_RUN.reset(token)
+
+    def _run_loop(
+        self,
+        initial_assets: Dict[str, float],
+        params: Dict[str, Any],
+        months: int,
+        run_context: ProjectionRunContext,
+        checkpoint: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        tax_engine = run_context.tax_engine
+        run_context.distribution_rules = DistributionRuleCache(params)
+
         def p(key: str, default: Any) -> Any:
             return params.get(key, default)
 
@@ -102,6 +428,9 @@ class ProjectionEngine:
             owner: personal_external_financial_income * weight
             for owner, weight in personal_owner_weights.items()
         }
+        # (재산 공시가격, 반영 소득) -> 건강보험료 상세. 반영 소득은 반영 월에만 바뀌므로
+        # 나머지 달은 다시 계산하지 않는다. 보험료를 캐시하는 곳은 이 실행 단위 캐시 하나뿐이다.
+        health_detail_cache: Dict[Tuple[float, float], Dict[str, Any]] = {}
         if not corp_enabled:
             loan_balance = 0.0
             corp_salary = 0.0
@@ -131,6 +460,29 @@ class ProjectionEngine:
             "bond_upper_months": float(p("pension_bond_upper_months", 24.0)),
         }
         planned_cashflows = params.get("planned_cashflows", [])
+        checkpoint_interval = max(0, int(p("checkpoint_interval_months", 0) or 0))
+        run_mode = str(p("run_mode", "full"))
+        if run_mode not in RUN_MODES:
+            raise ValueError(f"지원하지 않는 run_mode입니다: {run_mode}")
+        trade_events_mode = str(p("trade_events_mode", "full"))
+        if trade_events_mode not in TRADE_EVENTS_MODES:
+            raise ValueError(f"지원하지 않는 trade_events_mode입니다: {trade_events_mode}")
+        # lean 모드는 월간 행·연도별 세금 감사표를 만들지 않는다(요약·거래 이벤트만 필요한 호출용).
+        lean_run = run_mode == "lean"
+        stop_on_first_shortfall = bool(p("stop_on_first_shortfall", False))
+        stopped_early = False
+        # 단계별 계측은 `profile`을 켠 실행에서만 만든다. 꺼져 있으면 단계마다 None 비교만 남는다.
+        profiler = StageProfiler() if p("profile", False) else None
+        stage_at = 0.0
+        checkpoints: List[Dict[str, Any]] = []
+        # 체크포인트가 나눠 쓰는 월간 행 사본. 결과 행을 나중에 바꿔도 체크포인트는 그대로다.
+        checkpoint_rows: List[Dict[str, Any]] = []
+        output_resolution = str(p("output_resolution", "monthly"))
+        output_format = str(p("output_format", "rows"))
+        if output_resolution not in OUTPUT_RESOLUTIONS:
+            raise ValueError(f"지원하지 않는 output_resolution입니다: {output_resolution}")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"지원하지 않는 output_format입니다: {output_format}")
         start_year = int(p("simulation_start_year", 2026))
         start_month = int(p("simulation_start_month", 1))
         main_review_month = normalize_month(p("rebalance_month", 5), 5)
@@ -141,6 +493,14 @@ class ProjectionEngine:
             start_age, private_pension_start_age, national_pension_start_age
         )
 
+        rate_table = self._compile_rate_table(
+            params,
+            {"corp": corp_stats, "pension": pension_stats, "personal": personal_stats},
+            start_year,
+            start_month,
+            months,
+        )
+
         corp_assets = self._build_account_state(
             initial_balance=float(initial_assets.get("corp", 0.0)),
             account_type="corp",
@@ -189,6 +549,27 @@ class ProjectionEngine:
         personal_distribution_run_rates = self._build_distribution_run_rates(
             "personal", personal_assets, personal_stats, params
         )
+        account_states = {
+            "corp": AccountState("corp", corp_assets, run_rates=corp_distribution_run_rates),
+            "pension": AccountState(
+                "pension", pension_assets, run_rates=pension_distribution_run_rates
+            ),
+            "personal": AccountState(
+                "personal", personal_assets, run_rates=personal_distribution_run_rates
+            ),
+        }
+        personal_market_value = sum(personal_assets.values())
+        if personal_market_value > 0:
+            basis_ratio = max(0.0, personal_initial_cost_basis) / personal_market_value
+            account_states["personal"].cost_basis = CategoryArray(
+                {category: value * basis_ratio for category, value in personal_assets.items()}
+            )
+        corp_assets = account_states["corp"].balances
+        pension_assets = account_states["pension"].balances
+        personal_assets = account_states["personal"].balances
+        corp_distribution_run_rates = account_states["corp"].run_rates
+        pension_distribution_run_rates = account_states["pension"].run_rates
+        personal_distribution_run_rates = account_states["personal"].run_rates
         operating_account = select_operating_account(
             corp_enabled=corp_enabled,
             personal_enabled=personal_enabled,
@@ -199,18 +580,10 @@ class ProjectionEngine:
             corp_stats=corp_stats,
             personal_stats=personal_stats,
         )
-        self._active_cost_basis_by_account = {
-            "corp": dict(corp_assets),
-            "pension": dict(pension_assets),
-            "personal": dict(personal_assets),
-        }
-        personal_market_value = sum(personal_assets.values())
-        if personal_market_value > 0:
-            basis_ratio = max(0.0, personal_initial_cost_basis) / personal_market_value
-            self._active_cost_basis_by_account["personal"] = {
-                category: value * basis_ratio for category, value in personal_assets.items()
-            }
-        self._active_trade_events: list[Dict[str, Any]] = []
+        run_context.cost_basis_by_account.update(
+            {key: state.cost_basis for key, state in account_states.items()}
+        )
+        trade_events = run_context.trade_events
 
         current_stress = False
         shock_flag = False
@@ -235,18 +608,83 @@ class ProjectionEngine:
         }
         personal_foreign_withholding_by_year: Dict[int, float] = {}
         personal_tax_ledger_by_year: Dict[int, Dict[str, Any]] = {}
+        personal_health_insurance_by_year: Dict[int, float] = {}
+        personal_ending_cost_basis_by_year: Dict[int, float] = {}
         monthly_data = []
         cumulative_household_need = 0.0
         cumulative_household_paid = 0.0
         cumulative_household_shortfall = 0.0
         first_household_shortfall_date = None
-
-        for index in range(1, months + 1):
+        start_index = 1
+
+        if checkpoint is not None:
+            # 체크포인트 상태를 복원한다. 계좌 배열은 제자리 갱신해 기존 참조를 유지한다.
+            # 지난 행은 사본으로 이어 붙여 결과를 고쳐도 체크포인트(접두 캐시)가 바뀌지 않게 한다.
+            start_index = int(checkpoint["index"]) + 1
+            resume_month = (start_month + start_index - 2) % 12 or 12
+            resume_year = start_year + (start_month + start_index - 3) // 12
+            if (int(checkpoint["year"]), int(checkpoint["month"])) != (resume_year, resume_month):
+                raise ValueError("체크포인트 시점이 시뮬레이션 시작 연월과 맞지 않습니다.")
+            for key, state in account_states.items():
+                saved = checkpoint["accounts"][key]
+                for category in self.CATEGORY_ORDER:
+                    state.balances[category] = float(saved["balances"][category])
+                    state.cost_basis[category] = float(saved["cost_basis"][category])
+                    state.run_rates[category] = float(saved["run_rates"][category])
+            operating_state = account_states[checkpoint["operating_account"]]
+            operating_account = OperatingAccountContext(
+                key=operating_state.key,
+                assets=operating_state.balances,
+                distribution_run_rates=operating_state.run_rates,
+                stats=personal_stats if operating_state.key == "personal" else corp_stats,
+            )
+            trade_events.extend(checkpoint["trade_events"])
+            monthly_data.extend(_copy_monthly_row(row) for row in checkpoint["monthly_data"])
+            loan_balance = float(checkpoint["loan_balance"])
+            approved_total_need = float(checkpoint["approved_total_need"])
+            current_stress = bool(checkpoint["current_stress"])
+            shock_flag = bool(checkpoint["shock_flag"])
+            boost_amount = float(checkpoint["boost_amount"])
+            boost_months_remaining = int(checkpoint["boost_months_remaining"])
+            growth_sell_date = checkpoint["growth_sell_date"]
+            sgov_exhaustion_date = checkpoint["sgov_exhaustion_date"]
+            survival_m = int(checkpoint["index"])
+            crash20_base = float(checkpoint["crash20_base"])
+            previous_may_total_assets = checkpoint["previous_may_total_assets"]
+            cumulative_household_need = float(checkpoint["cumulative_household_need"])
+            cumulative_household_paid = float(checkpoint["cumulative_household_paid"])
+            cumulative_household_shortfall = float(checkpoint["cumulative_household_shortfall"])
+            first_household_shortfall_date = checkpoint["first_household_shortfall_date"]
+            ledgers = deepcopy(checkpoint["ledgers"])
+            corp_realized_income_by_year = _year_keyed(ledgers["corp_realized_income"])
+            corp_deductible_expenses_by_year = _year_keyed(ledgers["corp_deductible_expenses"])
+            corp_tax_assessed_by_year = _year_keyed(ledgers["corp_tax_assessed"])
+            corp_tax_prepay_by_year = _year_keyed(ledgers["corp_tax_prepay"])
+            personal_dividend_income_by_year = _year_keyed(ledgers["personal_dividend_income"])
+            personal_dividend_income_by_owner_year = {
+                owner: _year_keyed(yearly)
+                for owner, yearly in ledgers["personal_dividend_income_by_owner"].items()
+            }
+            personal_foreign_withholding_by_year = _year_keyed(
+                ledgers["personal_foreign_withholding"]
+            )
+            personal_tax_ledger_by_year = _year_keyed(ledgers["personal_tax_ledger"])
+            personal_health_insurance_by_year = _year_keyed(ledgers["personal_health_insurance"])
+            personal_ending_cost_basis_by_year = _year_keyed(ledgers["personal_ending_cost_basis"])
+
+        review_stages = {
+            main_review_month: "may_review",
+            corporate_mini_review_month: "august_review",
+            corporate_semi_review_month: "november_rebalance",
+        }
+        for index in range(start_index, months + 1):
             sim_month = (start_month + index - 1) % 12 or 12
             sim_year = start_year + (start_month + index - 2) // 12
             age = ((sim_year - birth_year) * 12 + (sim_month - birth_month)) // 12
             phase = self._resolve_phase(age, private_pension_start_age, national_pension_start_age)
 
+            if profiler is not None:
+                stage_at = perf_counter()
             self._apply_planned_cashflows(
                 corp_assets,
                 pension_assets,
@@ -256,6 +694,8 @@ class ProjectionEngine:
                 corp_enabled=corp_enabled,
                 pension_enabled=pension_enabled,
             )
+            if profiler is not None:
+                stage_at = profiler.add("planned_cashflows", stage_at)
             corp_realized_income = self._apply_monthly_returns(
                 "corp",
                 corp_assets,
@@ -264,6 +704,7 @@ class ProjectionEngine:
                 params,
                 sim_year,
                 sim_month,
+                rate_table=rate_table,
             )
             self._apply_monthly_returns(
                 "pension",
@@ -273,6 +714,7 @@ class ProjectionEngine:
                 params,
                 sim_year,
                 sim_month,
+                rate_table=rate_table,
             )
             personal_gross_dividend = self._apply_monthly_returns(
                 "personal",
@@ -282,9 +724,10 @@ class ProjectionEngine:
                 params,
                 sim_year,
                 sim_month,
+                rate_table=rate_table,
             )
             personal_foreign_withholding = (
-                personal_gross_dividend * self.tax_engine.us_dividend_foreign_withholding_rate
+                personal_gross_dividend * tax_engine.us_dividend_foreign_withholding_rate
                 if personal_enabled
                 else 0.0
             )
@@ -313,6 +756,8 @@ class ProjectionEngine:
             corp_realized_income_by_year[sim_year] = (
                 corp_realized_income_by_year.get(sim_year, 0.0) + corp_realized_income
             )
+            if profiler is not None:
+                profiler.add("returns", stage_at)
 
             current_total_need = approved_total_need
             current_boost_amount = (
@@ -379,11 +824,13 @@ class ProjectionEngine:
                 personal_monthly_need if operating_account.key == "personal" else corp_monthly_need
             )
 
+            if profiler is not None:
+                stage_at = perf_counter()
             personal_tax_payment = 0.0
             personal_dividend_additional_tax = 0.0
             personal_capital_gains_tax = 0.0
             personal_tax_assessment_year = sim_year - 1
-            if personal_enabled and sim_month == self.tax_engine.personal_tax_payment_month:
+            if personal_enabled and sim_month == tax_engine.personal_tax_payment_month:
                 assessed_dividend = personal_dividend_income_by_year.get(
                     personal_tax_assessment_year, 0.0
                 )
@@ -393,13 +840,8 @@ class ProjectionEngine:
                     personal_other_comprehensive_tax_base,
                     personal_tax_assessment_year,
                 )
-                realized_gain = sum(
-                    float(event.get("realized_gain", 0.0))
-                    for event in self._active_trade_events
-                    if event.get("account") == "personal"
-                    and int(event.get("year") or 0) == personal_tax_assessment_year
-                )
-                capital_tax_detail = self.tax_engine.calculate_us_capital_gains_tax(realized_gain)
+                realized_gain = trade_events.realized_gain("personal", personal_tax_assessment_year)
+                capital_tax_detail = tax_engine.calculate_us_capital_gains_tax(realized_gain)
                 personal_dividend_additional_tax = float(
                     dividend_tax_detail["domestic_additional_tax"]
                 )
@@ -427,8 +869,8 @@ class ProjectionEngine:
                     "tax_payment": personal_tax_payment,
                 }
 
-            reflection_month = self.tax_engine.health_income_reflection_month
-            reflection_lag = self.tax_engine.health_income_reflection_lag_years
+            reflection_month = tax_engine.health_income_reflection_month
+            reflection_lag = tax_engine.health_income_reflection_lag_years
             reflected_income_year = (
                 sim_year - reflection_lag
                 if sim_month >= reflection_month
@@ -445,19 +887,21 @@ class ProjectionEngine:
                 )
                 owner_health_income = (
                     reflected_financial_income
-                    if reflected_financial_income
-                    > self.tax_engine.health_financial_income_threshold
+                    if reflected_financial_income > tax_engine.health_financial_income_threshold
                     else 0.0
                 )
-                owner_health_detail = self.tax_engine.calculate_local_health_insurance_detailed(
-                    0.0, owner_health_income
+                owner_health_detail = self._cached_health_insurance_detail(
+                    health_detail_cache, tax_engine, 0.0, owner_health_income
                 )
                 personal_health_income_by_owner[owner] = owner_health_income
                 personal_health_detail_by_owner[owner] = owner_health_detail
                 personal_health_by_owner[owner] = float(owner_health_detail["total_premium"])
             health_income = sum(personal_health_income_by_owner.values())
-            personal_health_detail = self.tax_engine.calculate_local_health_insurance_detailed(
-                personal_property_assessed_value, health_income
+            personal_health_detail = self._cached_health_insurance_detail(
+                health_detail_cache,
+                tax_engine,
+                personal_property_assessed_value,
+                health_income,
             )
             personal_health_insurance = (
                 self._pay_personal_cash_obligation(
@@ -473,6 +917,8 @@ class ProjectionEngine:
                 if personal_enabled
                 else 0.0
             )
+            if profiler is not None:
+                profiler.add("personal_tax_health", stage_at)
 
             pension_draw = 0.0
             if pension_income > 0:
@@ -566,6 +1012,8 @@ class ProjectionEngine:
             pre_review_equity_value = self._equity_value(operating_account.assets)
             if pension_enabled:
                 pre_review_equity_value += self._equity_value(pension_assets)
+            if profiler is not None:
+                stage_at = perf_counter()
             if sim_month == main_review_month:
                 (
                     current_stress,
@@ -658,6 +1106,9 @@ class ProjectionEngine:
                 )
                 if growth_used > 0 and growth_sell_date == "None":
                     growth_sell_date = f"{sim_year}-{sim_month:02d}"
+            if profiler is not None:
+                review_stage = review_stages.get(sim_month)
+                stage_at = profiler.add(review_stage, stage_at) if review_stage else perf_counter()
 
             self._run_pension_floor_refill(
                 pension_assets,
@@ -669,6 +1120,8 @@ class ProjectionEngine:
                 pension_withdrawal_target,
                 pension_rules,
             )
+            if profiler is not None:
+                stage_at = profiler.add("pension_floor_refill", stage_at)
 
             total_net_worth = (
                 sum(corp_assets.values())
@@ -715,126 +1168,240 @@ class ProjectionEngine:
                     self._apply_distribution_stress_cut(
                         pension_distribution_run_rates, params, "pension"
                     )
-
-            corp_sgov_months = self._months_cover(corp_assets["SGOV Buffer"], corp_monthly_need)
-            corp_bond_months = self._months_cover(corp_assets["Bond Buffer"], corp_monthly_need)
-            pension_sgov_months = self._months_cover(
-                pension_assets["SGOV Buffer"], pension_withdrawal_target
-            )
-            pension_bond_months = self._months_cover(
-                pension_assets["Bond Buffer"], pension_withdrawal_target
-            )
+            if profiler is not None:
+                profiler.add("crash_detection", stage_at)
 
             if operating_account.assets["SGOV Buffer"] <= 0 and sgov_exhaustion_date == "Permanent":
                 sgov_exhaustion_date = f"{sim_year}-{sim_month:02d}"
 
             survival_m = index
-            corp_balance = sum(corp_assets.values())
-            pension_balance = sum(pension_assets.values())
-            personal_balance = sum(personal_assets.values())
-            personal_cost_basis = sum(
-                getattr(self, "_active_cost_basis_by_account", {}).get("personal", {}).values()
-            )
-            monthly_data.append(
-                {
-                    "index": index,
-                    "year": sim_year,
-                    "month": sim_month,
-                    "age": age,
-                    "phase": phase,
-                    "total_net_worth": total_net_worth,
-                    "corp_balance": corp_balance,
-                    "pension_balance": pension_balance,
-                    "personal_balance": personal_balance,
-                    "personal_cost_basis": personal_cost_basis,
-                    "loan_balance": loan_balance,
-                    "target_cashflow": current_total_need,
-                    "next_target_cashflow": next_target_cashflow,
-                    "net_salary": actual_net_salary,
-                    "corp_draw": corp_draw,
-                    "pension_draw": pension_draw,
-                    "personal_draw": personal_draw,
-                    "personal_gross_dividend": personal_gross_dividend,
-                    "personal_foreign_withholding_tax": personal_foreign_withholding_paid,
-                    "personal_dividend_additional_tax": personal_dividend_additional_tax,
-                    "personal_capital_gains_tax": personal_capital_gains_tax,
-                    "personal_tax_payment": personal_tax_payment,
-                    "personal_tax_assessment_year": personal_tax_assessment_year,
-                    "personal_health_insurance": personal_health_insurance,
-                    "personal_health_income_year": reflected_income_year,
-                    "personal_health_income": health_income,
-                    "personal_health_income_by_owner": personal_health_income_by_owner,
-                    "personal_health_insurance_by_owner": personal_health_by_owner,
-                    "personal_health_property_points": personal_health_detail["property_points"],
-                    "corp_bookkeeping_paid": actual_bookkeeping_paid,
-                    "corp_tax_adjustment_fee_paid": actual_tax_adjustment_fee_paid,
-                    "corp_tax_payment": actual_corp_tax_payment,
-                    "corp_tax_assessed_for_year": corp_tax_assessed_for_year,
-                    "corp_realized_income": corp_realized_income,
-                    "shareholder_loan_payment": shareholder_loan_payment,
-                    "shareholder_distribution_gross": shareholder_distribution_gross,
-                    "shareholder_distribution_withholding": shareholder_distribution_withholding,
-                    "shareholder_distribution_net": shareholder_distribution_net,
-                    "household_shortfall": household_shortfall,
-                    "boost_amount": boost_amount if boost_months_remaining > 0 else 0.0,
-                    "corp_monthly_need": corp_monthly_need,
-                    "shock_flag": shock_flag,
-                    "crash20_triggered": crash20_triggered,
-                    "stress": current_stress,
-                    "inflation_action": inflation_action,
-                    "corp_sgov_balance": corp_assets["SGOV Buffer"],
-                    "corp_bond_balance": corp_assets["Bond Buffer"],
-                    "corp_high_income_balance": corp_assets["High Income"],
-                    "corp_dividend_balance": corp_assets["Dividend Growth"],
-                    "corp_growth_balance": corp_assets["Growth Engine"],
-                    "pension_sgov_balance": pension_assets["SGOV Buffer"],
-                    "pension_bond_balance": pension_assets["Bond Buffer"],
-                    "pension_high_income_balance": pension_assets["High Income"],
-                    "pension_dividend_balance": pension_assets["Dividend Growth"],
-                    "pension_growth_balance": pension_assets["Growth Engine"],
-                    "personal_sgov_balance": personal_assets["SGOV Buffer"],
-                    "personal_bond_balance": personal_assets["Bond Buffer"],
-                    "personal_high_income_balance": personal_assets["High Income"],
-                    "personal_dividend_balance": personal_assets["Dividend Growth"],
-                    "personal_growth_balance": personal_assets["Growth Engine"],
-                    "corp_sgov_months": corp_sgov_months,
-                    "corp_bond_months": corp_bond_months,
-                    "pension_sgov_months": pension_sgov_months,
-                    "pension_bond_months": pension_bond_months,
-                    "pre_review_corp_sgov_months": pre_review_corp_sgov_months,
-                    "pre_review_corp_bond_months": pre_review_corp_bond_months,
-                    "pre_review_pension_sgov_months": pre_review_pension_sgov_months,
-                    "pre_review_pension_bond_months": pre_review_pension_bond_months,
-                }
-            )
+            personal_cost_basis = sum(account_states["personal"].cost_basis.data)
+            personal_health_insurance_by_year[sim_year] = personal_health_insurance_by_year.get(
+                sim_year, 0.0
+            ) + float(personal_health_insurance or 0.0)
+            personal_ending_cost_basis_by_year[sim_year] = float(personal_cost_basis or 0.0)
+            if not lean_run:
+                if profiler is not None:
+                    stage_at = perf_counter()
+                corp_sgov_months = self._months_cover(corp_assets["SGOV Buffer"], corp_monthly_need)
+                corp_bond_months = self._months_cover(corp_assets["Bond Buffer"], corp_monthly_need)
+                pension_sgov_months = self._months_cover(
+                    pension_assets["SGOV Buffer"], pension_withdrawal_target
+                )
+                pension_bond_months = self._months_cover(
+                    pension_assets["Bond Buffer"], pension_withdrawal_target
+                )
+                (
+                    corp_sgov,
+                    corp_bond,
+                    corp_high_income,
+                    corp_dividend,
+                    corp_growth,
+                ) = corp_assets.data
+                (
+                    pension_sgov,
+                    pension_bond,
+                    pension_high_income,
+                    pension_dividend,
+                    pension_growth,
+                ) = pension_assets.data
+                (
+                    personal_sgov,
+                    personal_bond,
+                    personal_high_income,
+                    personal_dividend,
+                    personal_growth,
+                ) = personal_assets.data
+                corp_balance = sum(corp_assets.data)
+                pension_balance = sum(pension_assets.data)
+                personal_balance = sum(personal_assets.data)
+                monthly_data.append(
+                    {
+                        "index": index,
+                        "year": sim_year,
+                        "month": sim_month,
+                        "age": age,
+                        "phase": phase,
+                        "total_net_worth": total_net_worth,
+                        "corp_balance": corp_balance,
+                        "pension_balance": pension_balance,
+                        "personal_balance": personal_balance,
+                        "personal_cost_basis": personal_cost_basis,
+                        "loan_balance": loan_balance,
+                        "target_cashflow": current_total_need,
+                        "next_target_cashflow": next_target_cashflow,
+                        "net_salary": actual_net_salary,
+                        "corp_draw": corp_draw,
+                        "pension_draw": pension_draw,
+                        "personal_draw": personal_draw,
+                        "personal_gross_dividend": personal_gross_dividend,
+                        "personal_foreign_withholding_tax": personal_foreign_withholding_paid,
+                        "personal_dividend_additional_tax": personal_dividend_additional_tax,
+                        "personal_capital_gains_tax": personal_capital_gains_tax,
+                        "personal_tax_payment": personal_tax_payment,
+                        "personal_tax_assessment_year": personal_tax_assessment_year,
+                        "personal_health_insurance": personal_health_insurance,
+                        "personal_health_income_year": reflected_income_year,
+                        "personal_health_income": health_income,
+                        "personal_health_income_by_owner": personal_health_income_by_owner,
+                        "personal_health_insurance_by_owner": personal_health_by_owner,
+                        "personal_health_property_points": personal_health_detail[
+                            "property_points"
+                        ],
+                        "corp_bookkeeping_paid": actual_bookkeeping_paid,
+                        "corp_tax_adjustment_fee_paid": actual_tax_adjustment_fee_paid,
+                        "corp_tax_payment": actual_corp_tax_payment,
+                        "corp_tax_assessed_for_year": corp_tax_assessed_for_year,
+                        "corp_realized_income": corp_realized_income,
+                        "shareholder_loan_payment": shareholder_loan_payment,
+                        "shareholder_distribution_gross": shareholder_distribution_gross,
+                        "shareholder_distribution_withholding": (
+                            shareholder_distribution_withholding
+                        ),
+                        "shareholder_distribution_net": shareholder_distribution_net,
+                        "household_shortfall": household_shortfall,
+                        "boost_amount": boost_amount if boost_months_remaining > 0 else 0.0,
+                        "corp_monthly_need": corp_monthly_need,
+                        "shock_flag": shock_flag,
+                        "crash20_triggered": crash20_triggered,
+                        "stress": current_stress,
+                        "inflation_action": inflation_action,
+                        "corp_sgov_balance": corp_sgov,
+                        "corp_bond_balance": corp_bond,
+                        "corp_high_income_balance": corp_high_income,
+                        "corp_dividend_balance": corp_dividend,
+                        "corp_growth_balance": corp_growth,
+                        "pension_sgov_balance": pension_sgov,
+                        "pension_bond_balance": pension_bond,
+                        "pension_high_income_balance": pension_high_income,
+                        "pension_dividend_balance": pension_dividend,
+                        "pension_growth_balance": pension_growth,
+                        "personal_sgov_balance": personal_sgov,
+                        "personal_bond_balance": personal_bond,
+                        "personal_high_income_balance": personal_high_income,
+                        "personal_dividend_balance": personal_dividend,
+                        "personal_growth_balance": personal_growth,
+                        "corp_sgov_months": corp_sgov_months,
+                        "corp_bond_months": corp_bond_months,
+                        "pension_sgov_months": pension_sgov_months,
+                        "pension_bond_months": pension_bond_months,
+                        "pre_review_corp_sgov_months": pre_review_corp_sgov_months,
+                        "pre_review_corp_bond_months": pre_review_corp_bond_months,
+                        "pre_review_pension_sgov_months": pre_review_pension_sgov_months,
+                        "pre_review_pension_bond_months": pre_review_pension_bond_months,
+                    }
+                )
+                if profiler is not None:
+                    profiler.add("output_rows", stage_at)
             if boost_months_remaining > 0:
                 boost_months_remaining -= 1
                 if boost_months_remaining == 0:
                     boost_amount = 0.0
             if sim_month == main_review_month:
                 approved_total_need = next_target_cashflow
+            if checkpoint_interval and index % checkpoint_interval == 0 and index < months:
+                # 월말 상태를 JSON 직렬화 가능한 dict로 남긴다. 행은 직전 체크포인트 뒤만 복사.
+                checkpoint_rows.extend(
+                    _copy_monthly_row(row) for row in monthly_data[len(checkpoint_rows) :]
+                )
+                checkpoints.append(
+                    {
+                        "version": CHECKPOINT_VERSION,
+                        "index": index,
+                        "year": sim_year,
+                        "month": sim_month,
+                        "accounts": {
+                            key: {
+                                "balances": state.balances.to_dict(),
+                                "cost_basis": state.cost_basis.to_dict(),
+                                "run_rates": state.run_rates.to_dict(),
+                            }
+                            for key, state in account_states.items()
+                        },
+                        "operating_account": operating_account.key,
+                        "loan_balance": loan_balance,
+                        "approved_total_need": approved_total_need,
+                        "current_stress": current_stress,
+                        "shock_flag": shock_flag,
+                        "boost_amount": boost_amount,
+                        "boost_months_remaining": boost_months_remaining,
+                        "growth_sell_date": growth_sell_date,
+                        "sgov_exhaustion_date": sgov_exhaustion_date,
+                        "crash20_base": crash20_base,
+                        "previous_may_total_assets": previous_may_total_assets,
+                        "cumulative_household_need": cumulative_household_need,
+                        "cumulative_household_paid": cumulative_household_paid,
+                        "cumulative_household_shortfall": cumulative_household_shortfall,
+                        "first_household_shortfall_date": first_household_shortfall_date,
+                        "ledgers": {
+                            "corp_realized_income": dict(corp_realized_income_by_year),
+                            "corp_deductible_expenses": dict(corp_deductible_expenses_by_year),
+                            "corp_tax_assessed": dict(corp_tax_assessed_by_year),
+                            "corp_tax_prepay": dict(corp_tax_prepay_by_year),
+                            "personal_dividend_income": dict(personal_dividend_income_by_year),
+                            "personal_dividend_income_by_owner": {
+                                owner: dict(yearly)
+                                for owner, yearly in personal_dividend_income_by_owner_year.items()
+                            },
+                            "personal_foreign_withholding": dict(
+                                personal_foreign_withholding_by_year
+                            ),
+                            "personal_tax_ledger": dict(personal_tax_ledger_by_year),
+                            "personal_health_insurance": dict(personal_health_insurance_by_year),
+                            "personal_ending_cost_basis": dict(personal_ending_cost_basis_by_year),
+                        },
+                        "trade_events": trade_events.events(),
+                        "monthly_data": list(checkpoint_rows),
+                    }
+                )
+            if stop_on_first_shortfall and first_household_shortfall_date is not None:
+                # 가계 부족이 한 번이라도 생기면 "전 기간 충당" 여부는 이미 결정된다.
+                stopped_early = index < months
+                break
 
-        personal_trade_events = [
-            event
-            for event in getattr(self, "_active_trade_events", [])
-            if event.get("account") == "personal"
-        ]
+        if profiler is not None:
+            stage_at = perf_counter()
+        personal_trade_events = (
+            trade_events.events("personal") if personal_enabled and not lean_run else []
+        )
         audit_years = (
             sorted(
                 set(personal_dividend_income_by_year)
                 | set(personal_tax_ledger_by_year)
                 | {int(event["year"]) for event in personal_trade_events if event.get("year")}
-                | {int(row["year"]) for row in monthly_data}
+                | set(personal_health_insurance_by_year)
             )
-            if personal_enabled
+            if personal_enabled and not lean_run
             else []
         )
+        # 연도별 매도/재원 매도 버킷을 이벤트 한 번 순회로 만든다. 이벤트 순서는 그대로 유지된다.
+        tax_years_by_payment: Dict[Tuple[int, int], List[int]] = {}
+        for tax_year in audit_years:
+            ledger = personal_tax_ledger_by_year.get(tax_year, {})
+            payment = (
+                int(ledger.get("payment_year") or 0),
+                int(ledger.get("payment_month") or 0),
+            )
+            tax_years_by_payment.setdefault(payment, []).append(tax_year)
+        sales_by_year: Dict[int, List[Dict[str, Any]]] = {}
+        funding_sales_by_year: Dict[int, List[Dict[str, Any]]] = {}
+        for event in personal_trade_events:
+            event_year = int(event.get("year") or 0)
+            sales_by_year.setdefault(event_year, []).append(event)
+            cash_obligation = event.get("cash_obligation")
+            if not cash_obligation:
+                continue
+            if cash_obligation != "annual_tax":
+                funding_sales_by_year.setdefault(event_year, []).append(event)
+                continue
+            payment = (event_year, int(event.get("month") or 0))
+            for tax_year in tax_years_by_payment.get(payment, []):
+                funding_sales_by_year.setdefault(tax_year, []).append(event)
+
         personal_annual_tax_audit = []
         for tax_year in audit_years:
             ledger = personal_tax_ledger_by_year.get(tax_year, {})
-            annual_sales = [
-                event for event in personal_trade_events if int(event.get("year") or 0) == tax_year
-            ]
+            annual_sales = sales_by_year.get(tax_year, [])
             payment_year = int(ledger.get("payment_year") or 0)
             payment_month = int(ledger.get("payment_month") or 0)
             dividend_tax_detail = ledger or self._personal_dividend_tax_detail(
@@ -844,26 +1411,8 @@ class ProjectionEngine:
                 tax_year,
             )
             realized_gain = sum(float(event.get("realized_gain") or 0.0) for event in annual_sales)
-            capital_tax_detail = ledger or self.tax_engine.calculate_us_capital_gains_tax(
-                realized_gain
-            )
-            funding_sales = [
-                event
-                for event in personal_trade_events
-                if event.get("cash_obligation")
-                and (
-                    (
-                        event.get("cash_obligation") != "annual_tax"
-                        and int(event.get("year") or 0) == tax_year
-                    )
-                    or (
-                        event.get("cash_obligation") == "annual_tax"
-                        and int(event.get("year") or 0) == payment_year
-                        and int(event.get("month") or 0) == payment_month
-                    )
-                )
-            ]
-            year_rows = [row for row in monthly_data if int(row["year"]) == tax_year]
+            capital_tax_detail = ledger or tax_engine.calculate_us_capital_gains_tax(realized_gain)
+            funding_sales = funding_sales_by_year.get(tax_year, [])
             personal_annual_tax_audit.append(
                 {
                     "tax_year": tax_year,
@@ -905,18 +1454,19 @@ class ProjectionEngine:
                     "annual_deduction": float(capital_tax_detail.get("annual_deduction") or 0.0),
                     "taxable_gain": float(capital_tax_detail.get("taxable_gain") or 0.0),
                     "capital_gains_tax": float(capital_tax_detail.get("capital_gains_tax") or 0.0),
-                    "health_insurance_total": sum(
-                        float(row.get("personal_health_insurance") or 0.0) for row in year_rows
-                    ),
-                    "ending_cost_basis": (
-                        float(year_rows[-1].get("personal_cost_basis") or 0.0) if year_rows else 0.0
-                    ),
+                    "health_insurance_total": personal_health_insurance_by_year.get(tax_year, 0),
+                    "ending_cost_basis": personal_ending_cost_basis_by_year.get(tax_year, 0.0),
                     "tax_payment": float(ledger.get("tax_payment") or 0.0),
                     "is_comprehensive": bool(dividend_tax_detail.get("is_comprehensive", False)),
                     "funding_sales": funding_sales,
                 }
             )
+        if profiler is not None:
+            stage_at = profiler.add("post_loop_audit", stage_at)
 
+        monthly_output = format_monthly_output(monthly_data, output_resolution, output_format)
+        if profiler is not None:
+            profiler.add("output_format", stage_at)
         return {
             "summary": {
                 "total_survival_years": survival_m // 12,
@@ -928,20 +1478,36 @@ class ProjectionEngine:
                 "cumulative_household_paid": cumulative_household_paid,
                 "cumulative_household_shortfall": cumulative_household_shortfall,
                 "first_household_shortfall_date": first_household_shortfall_date,
+                "stopped_early": stopped_early,
+                "ending_total_net_worth": sum(
+                    sum(state.balances.data) for state in account_states.values()
+                ),
             },
             "survival_months": survival_m,
-            "monthly_data": monthly_data,
-            "trade_events": list(getattr(self, "_active_trade_events", [])),
+            "run_mode": run_mode,
+            "output_resolution": output_resolution,
+            "output_format": output_format,
+            "monthly_data": monthly_output,
+            "trade_events_mode": trade_events_mode,
+            "trade_events": trade_events.events() if trade_events_mode == "full" else [],
+            "trade_events_by_year": (
+                trade_events.yearly_totals() if trade_events_mode == "yearly" else None
+            ),
             "ending_distribution_run_rates": {
-                "corp": deepcopy(corp_distribution_run_rates),
-                "pension": deepcopy(pension_distribution_run_rates),
-                "personal": deepcopy(personal_distribution_run_rates),
+                "corp": corp_distribution_run_rates.to_dict(),
+                "pension": pension_distribution_run_rates.to_dict(),
+                "personal": personal_distribution_run_rates.to_dict(),
+            },
+            "ending_cost_basis": {
+                key: dict(cost_basis)
+                for key, cost_basis in run_context.cost_basis_by_account.items()
             },
-            "ending_cost_basis": deepcopy(getattr(self, "_active_cost_basis_by_account", {})),
             "personal_tax_ledger": [
                 personal_tax_ledger_by_year[year] for year in sorted(personal_tax_ledger_by_year)
             ],
             "personal_annual_tax_audit": personal_annual_tax_audit,
+            "checkpoints": checkpoints,
+            "profile": profiler.to_dict() if profiler is not None else None,
         }
 
     def _personal_dividend_tax_detail(
@@ -1164,27 +1730,67 @@ class ProjectionEngine:
         params: Dict[str, Any],
         sim_year: int,
         sim_month: int,
+        rate_table: Optional[MonthlyRateTable] = None,
     ) -> float:
+        month_rates = (
+            rate_table.month_rates(account_key, sim_year, sim_month)
+            if rate_table is not None
+            else None
+        )
+        # 배열 상태면 카테고리 키 대신 고정 인덱스로 잔액/run-rate 슬롯에 바로 접근한다.
+        run_rate_data = None
+        if isinstance(account_assets, CategoryArray):
+            balances: Any = account_assets.data
+            slots: Any = range(len(self.CATEGORY_ORDER))
+            sgov_slot: Any = SGOV_INDEX
+            if isinstance(distribution_run_rates, CategoryArray):
+                run_rate_data = distribution_run_rates.data
+                monthly_growths = self._monthly_distribution_growths(params, account_key)
+        else:
+            balances, slots, sgov_slot = account_assets, self.CATEGORY_ORDER, "SGOV Buffer"
         realized_income = 0.0
-        for category in self.CATEGORY_ORDER:
-            balance = account_assets[category]
+        for position, (category, slot) in enumerate(zip(self.CATEGORY_ORDER, slots)):
+            balance = balances[slot]
             if balance <= 0:
                 continue
 
-            category_rates = self._category_rate_spec(
-                account_key, category, account_assets, account_stats, params, sim_year, sim_month
-            )
-            monthly_dy, monthly_pa = self._monthly_return_components(category_rates)
+            if month_rates is not None:
+                monthly_dy, monthly_pa, sole_rates = month_rates[position]
+                if sole_rates is not None and self._is_sole_risk_sleeve(account_assets, category):
+                    monthly_dy, monthly_pa = sole_rates
+            else:
+                category_rates = self._category_rate_spec(
+                    account_key,
+                    category,
+                    account_assets,
+                    account_stats,
+                    params,
+                    sim_year,
+                    sim_month,
+                )
+                monthly_dy, monthly_pa = self._monthly_return_components(category_rates)
 
-            if category == "SGOV Buffer":
+            if slot == sgov_slot:
                 income = balance * monthly_dy
-                account_assets[category] = balance * (1 + monthly_dy + monthly_pa)
+                balances[slot] = balance * (1 + monthly_dy + monthly_pa)
                 realized_income += income
                 continue
 
+            if run_rate_data is not None:
+                income_to_sgov = run_rate_data[slot] / 12.0
+                balances[slot] = balance * (1 + monthly_pa)
+                balances[sgov_slot] += income_to_sgov
+                realized_income += income_to_sgov
+                monthly_growth_rate = monthly_growths[slot]
+                if monthly_growth_rate != 0.0:
+                    run_rate_data[slot] = max(
+                        0.0, run_rate_data[slot] * (1.0 + monthly_growth_rate)
+                    )
+                continue
+
             income_to_sgov = distribution_run_rates.get(category, 0.0) / 12.0
-            account_assets[category] = balance * (1 + monthly_pa)
-            account_assets["SGOV Buffer"] += income_to_sgov
+            balances[slot] = balance * (1 + monthly_pa)
+            balances[sgov_slot] += income_to_sgov
             realized_income += income_to_sgov
             self._grow_distribution_run_rate(distribution_run_rates, params, account_key, category)
         return realized_income
@@ -1224,32 +1830,79 @@ class ProjectionEngine:
         account_key: str,
         category: str,
     ) -> None:
-        annual_growth_rate = float(
-            self._distribution_rule(params, account_key, category).get("growth_rate", 0.0)
-        )
-        if annual_growth_rate == 0.0:
+        monthly_growth_rate = self._monthly_distribution_growths(params, account_key)[
+            CATEGORY_INDEX[category]
+        ]
+        if monthly_growth_rate == 0.0:
             return
-        if annual_growth_rate <= -1.0:
-            monthly_growth_rate = annual_growth_rate / 12.0
-        else:
-            monthly_growth_rate = (1.0 + annual_growth_rate) ** (1.0 / 12.0) - 1.0
         distribution_run_rates[category] = max(
             0.0,
             distribution_run_rates.get(category, 0.0) * (1.0 + monthly_growth_rate),
         )
 
+    def _monthly_distribution_growths(
+        self, params: Dict[str, Any], account_key: str
+    ) -> Tuple[float, ...]:
+        """CATEGORY_ORDER 순서의 월 분배 성장률. 실행 중에는 계좌별로 한 번만 해석한다."""
+        rule_cache = self._distribution_rule_cache(params)
+        if rule_cache is not None:
+            cached = rule_cache.monthly_growths.get(account_key)
+            if cached is not None:
+                return cached
+        growths = []
+        for category in self.CATEGORY_ORDER:
+            annual_growth_rate = float(
+                self._distribution_rule(params, account_key, category).get("growth_rate", 0.0)
+            )
+            if annual_growth_rate == 0.0:
+                growths.append(0.0)
+            elif annual_growth_rate <= -1.0:
+                growths.append(annual_growth_rate / 12.0)
+            else:
+                growths.append((1.0 + annual_growth_rate) ** (1.0 / 12.0) - 1.0)
+        resolved = tuple(growths)
+        if rule_cache is not None:
+            rule_cache.monthly_growths[account_key] = resolved
+        return resolved
+
+    def _distribution_stress_cut_rates(
+        self, params: Dict[str, Any], account_key: str
+    ) -> Tuple[float, ...]:
+        rule_cache = self._distribution_rule_cache(params)
+        if rule_cache is not None:
+            cached = rule_cache.stress_cut_rates.get(account_key)
+            if cached is not None:
+                return cached
+        resolved = tuple(
+            float(
+                self._distribution_rule(params, account_key, category).get("stress_cut_rate", 0.0)
+            )
+            for category in self.CATEGORY_ORDER
+        )
+        if rule_cache is not None:
+            rule_cache.stress_cut_rates[account_key] = resolved
+        return resolved
+
+    def _distribution_rule_cache(self, params: Dict[str, Any]) -> Optional[DistributionRuleCache]:
+        # 실행 밖 호출이나 다른 params로 부른 경우에는 캐시 없이 매번 해석한다.
+        run_context = self._active_run()
+        if run_context is None:
+            return None
+        rule_cache = run_context.distribution_rules
+        if rule_cache is None or rule_cache.params is not params:
+            return None
+        return rule_cache
+
     def _apply_distribution_stress_cut(
         self,
         distribution_run_rates: Dict[str, float],
         params: Dict[str, Any],
         account_key: str,
     ) -> None:
-        for category in self.CATEGORY_ORDER:
+        stress_cut_rates = self._distribution_stress_cut_rates(params, account_key)
+        for category, stress_cut_rate in zip(self.CATEGORY_ORDER, stress_cut_rates):
             if category == "SGOV Buffer":
                 continue
-            stress_cut_rate = float(
-                self._distribution_rule(params, account_key, category).get("stress_cut_rate", 0.0)
-            )
             if stress_cut_rate <= 0:
                 continue
             cut_rate = min(1.0, stress_cut_rate)
@@ -1268,6 +1921,135 @@ class ProjectionEngine:
         default_rules = distribution_rules.get("default", {})
         return default_rules.get(category, {}) or {}
 
+    def _compile_rate_table(
+        self,
+        params: Dict[str, Any],
+        stats_by_account: Dict[str, Dict[str, Any]],
+        start_year: int,
+        start_month: int,
+        months: int,
+    ) -> MonthlyRateTable:
+        """
+        계좌·카테고리별 월 수익률을 루프 전에 테이블로 컴파일한다.
+        월별 override가 없는 달은 값이 같으므로 한 번만 계산해 공유하고, 같은 수익률 입력을
+        쓰는 실행 간에는 캐시된 테이블을 재사용한다.
+        """
+        cache_key = repr(
+            (
+                start_year,
+                start_month,
+                months,
+                params.get("monthly_return_overrides", {}),
+                params.get("category_return_rates", {}),
+                params.get("appreciation_rates", {}),
+                [
+                    (
+                        account_key,
+                        account_stats.get("expected_return", 0.0),
+                        account_stats.get("dividend_yield", 0.0),
+                        account_stats.get("category_dividend_yields"),
+                    )
+                    for account_key, account_stats in stats_by_account.items()
+                ],
+            )
+        )
+        cached = self._rate_table_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        calendar = []
+        for index in range(1, months + 1):
+            sim_month = (start_month + index - 1) % 12 or 12
+            sim_year = start_year + (start_month + index - 2) // 12
+            calendar.append((sim_year, sim_month))
+
+        rates: Dict[str, List[Tuple[RateEntry, ...]]] = {}
+        for account_key, account_stats in stats_by_account.items():
+            account_overrides = params.get("monthly_return_overrides", {}).get(account_key, {})
+            columns = []
+            for category in self.CATEGORY_ORDER:
+                overrides = account_overrides.get(category, {})
+                base_entry = None
+                column = []
+                for sim_year, sim_month in calendar:
+                    monthly_override = (
+                        overrides.get(f"{sim_year}-{sim_month:02d}") if overrides else None
+                    )
+                    if monthly_override:
+                        # 월별 override는 잔액 상태와 무관하므로 sole 수익률을 따로 구하지 않는다.
+                        monthly_dy, monthly_pa = self._monthly_return_components(
+                            {
+                                "dy": float(monthly_override.get("dy", 0.0)),
+                                "pa": float(monthly_override.get("pa", 0.0)),
+                            }
+                        )
+                        column.append((monthly_dy, monthly_pa, None))
+                        continue
+                    if base_entry is None:
+                        base_entry = self._rate_entry(
+                            account_key, category, account_stats, params, sim_year, sim_month
+                        )
+                    column.append(base_entry)
+                columns.append(column)
+            rates[account_key] = list(zip(*columns))
+
+        table = MonthlyRateTable(start_year, start_month, months, rates)
+        with self._rate_table_lock:
+            if len(self._rate_table_cache) >= self.RATE_TABLE_CACHE_SIZE:
+                self._rate_table_cache.pop(next(iter(self._rate_table_cache)))
+            self._rate_table_cache[cache_key] = table
+        return table
+
+    @staticmethod
+    def _cached_health_insurance_detail(
+        cache: Dict[Tuple[float, float], Dict[str, Any]],
+        tax_engine: TaxEngine,
+        property_assessed_value: float,
+        reflected_income: float,
+    ) -> Dict[str, Any]:
+        """
+        실행 동안 같은 (재산, 반영 소득)의 건강보험료 상세를 한 번만 계산한다. 보험료는 이 두 값에만
+        달려 있으므로 소유자별·가계 보험료가 같은 입력이면 한 항목을 함께 쓴다.
+        """
+        key = (property_assessed_value, reflected_income)
+        detail = cache.get(key)
+        if detail is None:
+            detail = tax_engine.calculate_local_health_insurance_detailed(
+                property_assessed_value, reflected_income
+            )
+            cache[key] = detail
+        return detail
+
+    def _rate_entry(
+        self,
+        account_key: str,
+        category: str,
+        account_stats: Dict[str, Any],
+        params: Dict[str, Any],
+        sim_year: int,
+        sim_month: int,
+    ) -> RateEntry:
+        # 잔액 상태로 달라지는 것은 '유일한 양수 비현금 슬리브' 여부뿐이라 두 경우를 모두 계산한다.
+        shared_state = {name: 1.0 for name in self.CATEGORY_ORDER}
+        sole_state = {name: 1.0 if name == category else 0.0 for name in self.CATEGORY_ORDER}
+        rates = self._monthly_return_components(
+            self._category_rate_spec(
+                account_key, category, shared_state, account_stats, params, sim_year, sim_month
+            )
+        )
+        sole_rates = self._monthly_return_components(
+            self._category_rate_spec(
+                account_key, category, sole_state, account_stats, params, sim_year, sim_month
+            )
+        )
+        return rates[0], rates[1], None if sole_rates == rates else sole_rates
+
+    def _is_sole_risk_sleeve(self, account_assets: Dict[str, float], category: str) -> bool:
+        for name, value in account_assets.items():
+            if name != "SGOV Buffer" and value > 0 and name != category:
+                return False
+        return category != "SGOV Buffer" and account_assets[category] > 0
+
     def _monthly_return_components(self, category_rates: Dict[str, float]) -> tuple[float, float]:
         annual_dy = float(category_rates["dy"])
         annual_pa = float(category_rates["pa"])
@@ -1343,6 +2125,28 @@ class ProjectionEngine:
         account_stats: Dict[str, Any],
         params: Dict[str, Any],
     ) -> float:
+        rule_cache = self._distribution_rule_cache(params)
+        cache_key = (account_key, category, id(account_stats))
+        if rule_cache is not None and cache_key in rule_cache.structural_yields:
+            configured_yield = rule_cache.structural_yields[cache_key]
+        else:
+            configured_yield = self._configured_distribution_yield(
+                account_key, category, account_stats, params
+            )
+            if rule_cache is not None:
+                rule_cache.structural_yields[cache_key] = configured_yield
+        if configured_yield is not None:
+            return configured_yield
+        return max(0.0, self._fallback_dividend_yield(category, account_assets, account_stats))
+
+    def _configured_distribution_yield(
+        self,
+        account_key: str,
+        category: str,
+        account_stats: Dict[str, Any],
+        params: Dict[str, Any],
+    ) -> Optional[float]:
+        """설정값(override·카테고리 수익률·카테고리 배당률)으로 정해지는 분배수익률. 없으면 None."""
         distribution_override = (
             params.get("distribution_yield_overrides", {})
             .get(operating_policy_key(account_key), {})
@@ -1360,8 +2164,7 @@ class ProjectionEngine:
         category_yields = account_stats.get("category_dividend_yields") or {}
         if category in category_yields:
             return max(0.0, float(category_yields[category]))
-
-        return max(0.0, self._fallback_dividend_yield(category, account_assets, account_stats))
+        return None
 
     def _fallback_dividend_yield(
         self, category: str, account_assets: Dict[str, float], account_stats: Dict[str, Any]
@@ -1431,10 +2234,8 @@ class ProjectionEngine:
     ) -> float:
         if tax_year in assessed_tax_by_year:
             return assessed_tax_by_year[tax_year]
-        realized_income = realized_income_by_year.get(tax_year, 0.0) + sum(
-            float(event.get("realized_gain") or 0.0)
-            for event in getattr(self, "_active_trade_events", [])
-            if event.get("account") == "corp" and int(event.get("year") or 0) == tax_year
+        realized_income = realized_income_by_year.get(tax_year, 0.0) + realized_gain_for(
+            self._active_trade_events, "corp", tax_year
         )
         deductible_expenses = deductible_expenses_by_year.get(tax_year, 0.0)
         tax_base = max(0.0, realized_income - deductible_expenses)
@@ -1564,18 +2365,18 @@ class ProjectionEngine:
         target_amount: float,
         donor_sequence: tuple,
     ) -> bool:
-        projected_assets = dict(account_assets)
-        if target_amount <= projected_assets[target_category]:
+        # 계좌 사본을 만들지 않고, 같은 donor가 반복될 때를 위해 인출액만 따로 누적한다.
+        current = account_assets[target_category]
+        if target_amount <= current:
             return True
-        needed = target_amount - projected_assets[target_category]
-        remaining = needed
+        remaining = target_amount - current
+        drawn: Dict[str, float] = {}
         for donor, floor in donor_sequence:
             if remaining <= 0:
                 break
-            available = max(0.0, projected_assets[donor] - floor)
+            available = max(0.0, account_assets[donor] - drawn.get(donor, 0.0) - floor)
             moved = min(available, remaining)
-            projected_assets[donor] -= moved
-            projected_assets[target_category] += moved
+            drawn[donor] = drawn.get(donor, 0.0) + moved
             remaining -= moved
         return remaining <= 0
 
@@ -2135,7 +2936,7 @@ class ProjectionEngine:
         paid = min(max(0.0, amount), balance)
         if paid <= 0:
             return 0.0
-        basis = getattr(self, "_active_cost_basis_by_account", {}).get("personal", {})
+        basis = self._active_cost_basis_by_account.get("personal", {})
         current_basis = max(0.0, float(basis.get("SGOV Buffer", 0.0)))
         basis_reduction = current_basis * paid / balance if balance > 0 else 0.0
         basis["SGOV Buffer"] = max(0.0, current_basis - basis_reduction)
@@ -2157,7 +2958,10 @@ class ProjectionEngine:
         due = max(0.0, amount)
         if due <= 0:
             return 0.0
-        event_start = len(getattr(self, "_active_trade_events", []))
+        trade_events = self._active_trade_events
+        if trade_events is None:
+            trade_events = []
+        event_start = len(trade_events)
         if personal_assets["SGOV Buffer"] < due:
             self._transfer_from_sequence(
                 personal_assets,
@@ -2176,9 +2980,12 @@ class ProjectionEngine:
                     ("Growth Engine", 0.0),
                 ),
             )
-        for event in getattr(self, "_active_trade_events", [])[event_start:]:
-            if event.get("account") == "personal":
-                event["cash_obligation"] = obligation_type
+        if isinstance(trade_events, TradeLog):
+            trade_events.mark_cash_obligation(event_start, "personal", obligation_type)
+        else:
+            for event in trade_events[event_start:]:
+                if event.get("account") == "personal":
+                    event["cash_obligation"] = obligation_type
         return self._consume_personal_sgov(personal_assets, due)
 
     def _transfer(
@@ -2195,20 +3002,30 @@ class ProjectionEngine:
         sim_year: int | None = None,
         sim_month: int | None = None,
         cost_basis: Dict[str, float] | None = None,
-        trade_events: list[Dict[str, Any]] | None = None,
+        trade_events: TradeLog | list[Dict[str, Any]] | None = None,
     ) -> float:
         if cost_basis is None and account_key is not None:
-            cost_basis = getattr(self, "_active_cost_basis_by_account", {}).get(account_key)
+            cost_basis = self._active_cost_basis_by_account.get(account_key)
         if trade_events is None:
-            trade_events = getattr(self, "_active_trade_events", None)
-        moved = min(max(0.0, amount), account_assets[from_category])
-        pre_from_balance = account_assets[from_category]
+            trade_events = self._active_trade_events
+        if isinstance(account_assets, CategoryArray):
+            balances: Any = account_assets.data
+            from_slot: Any = CATEGORY_INDEX[from_category]
+            to_slot: Any = CATEGORY_INDEX[to_category]
+        else:
+            balances, from_slot, to_slot = account_assets, from_category, to_category
+        pre_from_balance = balances[from_slot]
+        moved = min(max(0.0, amount), pre_from_balance)
         if moved > 0 and cost_basis is not None:
             pre_from_basis = max(0.0, cost_basis.get(from_category, 0.0))
             basis_sold = pre_from_basis * moved / pre_from_balance if pre_from_balance > 0 else 0.0
             cost_basis[from_category] = max(0.0, pre_from_basis - basis_sold)
             cost_basis[to_category] = max(0.0, cost_basis.get(to_category, 0.0)) + moved
-            if from_category != "SGOV Buffer" and trade_events is not None:
+            if from_category != "SGOV Buffer" and isinstance(trade_events, TradeLog):
+                trade_events.record(
+                    account_key, sim_year, sim_month, from_category, to_category, moved, basis_sold
+                )
+            elif from_category != "SGOV Buffer" and trade_events is not None:
                 trade_events.append(
                     {
                         "account": account_key,
@@ -2221,8 +3038,8 @@ class ProjectionEngine:
                         "realized_gain": moved - basis_sold,
                     }
                 )
-        account_assets[from_category] -= moved
-        account_assets[to_category] += moved
+        balances[from_slot] -= moved
+        balances[to_slot] += moved
         if moved > 0 and distribution_run_rates is not None:
             self._move_distribution_run_rate(
                 account_assets,
@@ -2279,6 +3096,9 @@ class ProjectionEngine:
         return balance / monthly_need
 
     def _equity_value(self, account_assets: Dict[str, float]) -> float:
+        if isinstance(account_assets, CategoryArray):
+            data = account_assets.data
+            return data[EQUITY_INDEXES[0]] + data[EQUITY_INDEXES[1]] + data[EQUITY_INDEXES[2]]
         return (
             account_assets["High Income"]
             + account_assets["Dividend Growth"]
@@ -0,0 +1,124 @@
+from typing import Any, Dict, List
+
+OUTPUT_RESOLUTIONS = ("monthly", "quarterly", "yearly")
+OUTPUT_FORMATS = ("rows", "columnar")
+# lean: 월간 행·세금 감사표 없이 요약·거래 이벤트만 만드는 일괄 평가용 실행 모드.
+RUN_MODES = ("full", "lean")
+# 시나리오·시작 시점별 실행을 나란히 비교할 때 싣는 요약 필드
+SUMMARY_COMPARISON_FIELDS = (
+    "survival_months",
+    "total_survival_years",
+    "is_permanent",
+    "sgov_exhaustion_date",
+    "growth_asset_sell_start_date",
+    "cumulative_household_shortfall",
+    "first_household_shortfall_date",
+    "ending_total_net_worth",
+)
+
+# 기간 합계로 집계하는 월간 흐름(flow) 필드. 나머지 수치/라벨은 기간 말 값을 쓴다.
+FLOW_FIELDS = frozenset(
+    {
+        "target_cashflow",
+        "net_salary",
+        "corp_draw",
+        "pension_draw",
+        "personal_draw",
+        "personal_gross_dividend",
+        "personal_foreign_withholding_tax",
+        "personal_dividend_additional_tax",
+        "personal_capital_gains_tax",
+        "personal_tax_payment",
+        "personal_health_insurance",
+        "corp_bookkeeping_paid",
+        "corp_tax_adjustment_fee_paid",
+        "corp_tax_payment",
+        "corp_realized_income",
+        "shareholder_loan_payment",
+        "shareholder_distribution_gross",
+        "shareholder_distribution_withholding",
+        "shareholder_distribution_net",
+        "household_shortfall",
+        "boost_amount",
+    }
+)
+# 소유자별 월간 흐름 dict는 키별로 합산한다.
+FLOW_MAPPING_FIELDS = frozenset({"personal_health_insurance_by_owner"})
+# 기간 중 한 번이라도 발생했는지를 나타내는 플래그 필드.
+FLAG_FIELDS = frozenset({"shock_flag", "crash20_triggered", "stress"})
+
+
+def _period_label(row: Dict[str, Any], resolution: str) -> str:
+    year = int(row["year"])
+    if resolution == "yearly":
+        return str(year)
+    if resolution == "quarterly":
+        return f"{year}-Q{(int(row['month']) - 1) // 3 + 1}"
+    return f"{year}-{int(row['month']):02d}"
+
+
+def _aggregate_period(period: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    aggregated = dict(rows[-1])
+    for key in FLOW_FIELDS:
+        if key in aggregated:
+            aggregated[key] = sum(float(row.get(key) or 0.0) for row in rows)
+    for key in FLOW_MAPPING_FIELDS:
+        if key in aggregated:
+            totals: Dict[str, float] = {}
+            for row in rows:
+                for owner, value in (row.get(key) or {}).items():
+                    totals[owner] = totals.get(owner, 0.0) + float(value or 0.0)
+            aggregated[key] = totals
+    for key in FLAG_FIELDS:
+        if key in aggregated:
+            aggregated[key] = any(bool(row.get(key)) for row in rows)
+    aggregated["period"] = period
+    aggregated["period_months"] = len(rows)
+    return aggregated
+
+
+def aggregate_monthly_rows(
+    monthly_data: List[Dict[str, Any]], resolution: str = "monthly"
+) -> List[Dict[str, Any]]:
+    """
+    월간 행을 분기/연 단위로 집계한다.
+    흐름 필드는 기간 합계, 플래그는 기간 내 발생 여부, 잔액·커버리지 등 나머지는 기간 말 값이다.
+    """
+    if resolution not in OUTPUT_RESOLUTIONS:
+        raise ValueError(f"지원하지 않는 output_resolution입니다: {resolution}")
+    if resolution == "monthly":
+        return monthly_data
+
+    periods: List[Dict[str, Any]] = []
+    current_label = None
+    current_rows: List[Dict[str, Any]] = []
+    for row in monthly_data:
+        label = _period_label(row, resolution)
+        if current_rows and label != current_label:
+            periods.append(_aggregate_period(current_label, current_rows))
+            current_rows = []
+        current_label = label
+        current_rows.append(row)
+    if current_rows:
+        periods.append(_aggregate_period(current_label, current_rows))
+    return periods
+
+
+def to_columnar(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """행 목록을 필드별 리스트(열) dict로 변환한다. 필드 순서는 첫 행의 키 순서를 따른다."""
+    if not rows:
+        return {}
+    return {key: [row.get(key) for row in rows] for key in rows[0]}
+
+
+def format_monthly_output(
+    monthly_data: List[Dict[str, Any]],
+    resolution: str = "monthly",
+    output_format: str = "rows",
+) -> Any:
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"지원하지 않는 output_format입니다: {output_format}")
+    rows = aggregate_monthly_rows(monthly_data, resolution)
+    if output_format == "columnar":
+        return to_columnar(rows)
+    return rows
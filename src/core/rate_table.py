@@ -0,0 +1,39 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# (monthly_dy, monthly_pa, sole_rates)
+# sole_rates는 해당 카테고리가 계좌의 유일한 양수 비현금 슬리브일 때 적용할 (dy, pa)이며,
+# 일반 값과 같으면 None으로 두어 월 루프에서 잔액 상태 확인을 생략한다.
+RateEntry = Tuple[float, float, Optional[Tuple[float, float]]]
+
+
+class MonthlyRateTable:
+    """
+    [Domain Layer] 시뮬레이션 전 구간의 (계좌, 월, 카테고리) 월 수익률 테이블
+    `_category_rate_spec` + `_monthly_return_components` 결과를 루프 전에 한 번 계산해 두고,
+    월 루프는 인덱스로 조회만 한다.
+    """
+
+    __slots__ = ("start_year", "start_month", "months", "rates")
+
+    def __init__(
+        self,
+        start_year: int,
+        start_month: int,
+        months: int,
+        rates: Dict[str, List[Tuple[RateEntry, ...]]],
+    ) -> None:
+        self.start_year = start_year
+        self.start_month = start_month
+        self.months = months
+        self.rates = rates
+
+    def month_rates(
+        self, account_key: str, sim_year: int, sim_month: int
+    ) -> Optional[Sequence[RateEntry]]:
+        account_rates = self.rates.get(account_key)
+        if account_rates is None:
+            return None
+        month_index = (sim_year - self.start_year) * 12 + (sim_month - self.start_month)
+        if 0 <= month_index < self.months:
+            return account_rates[month_index]
+        return None
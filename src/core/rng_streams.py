@@ -0,0 +1,43 @@
+import secrets
+from typing import Optional, Tuple
+
+import numpy as np
+
+# 결과 meta에 남기는 난수 스트림 모델 이름
+RNG_STREAM_MODEL = "SeedSequence.spawn/PCG64 per path"
+# seed를 주지 않았을 때 새로 뽑는 master seed 비트 수 (JSON 숫자로 손실 없이 왕복하는 범위)
+MASTER_SEED_BITS = 53
+
+
+class PathRandomStreams:
+    """
+    [Domain Layer] 경로별 독립 난수 스트림
+    NumPy `SeedSequence` spawn 모델을 따라 master seed 하나에서 경로 번호마다 자식 시퀀스
+    `SeedSequence(seed, spawn_key=(path,))`를 만들고, 그 시퀀스로 초기화한 PCG64 생성기를 쓴다.
+    이는 `SeedSequence(seed).spawn(n)[path]`와 같으므로 청크 크기·워커 수·실행 순서와 무관하게
+    경로별 난수가 같고, 전체 배치를 돌리지 않고도 특정 경로 하나만 다시 만들 수 있다.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        if seed is None:
+            seed = secrets.randbits(MASTER_SEED_BITS)
+        seed = int(seed)
+        if seed < 0:
+            raise ValueError("seed는 0 이상의 정수여야 합니다.")
+        self.seed = seed
+
+    def generator(self, path: int) -> np.random.Generator:
+        sequence = np.random.SeedSequence(self.seed, spawn_key=(int(path),))
+        return np.random.Generator(np.random.PCG64(sequence))
+
+    def standard_normal(self, start: int, count: int, shape: Tuple[int, ...]) -> np.ndarray:
+        """경로 start..start+count-1의 표준정규 난수를 (count, *shape) 배열로 쌓는다."""
+        return np.stack(
+            [self.generator(path).standard_normal(shape) for path in range(start, start + count)]
+        )
+
+    def integers(self, start: int, count: int, high: int, size: int) -> np.ndarray:
+        """경로 start..start+count-1마다 [0, high) 정수 `size`개를 (count, size) 배열로 뽑는다."""
+        return np.stack(
+            [self.generator(path).integers(0, high, size) for path in range(start, start + count)]
+        )
@@ -0,0 +1,44 @@
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from src.core.tax_engine import TaxEngine
+from src.core.trade_log import TradeLog
+
+
+@dataclass
+class DistributionRuleCache:
+    """
+    실행 1회 동안의 분배 규칙 해석 결과. 같은 `params`로 도는 동안 (계좌, 카테고리)별
+    월 성장률·스트레스 삭감률·구조적 분배수익률을 한 번만 계산해 재사용한다.
+    모두 설정값에서만 나오고 잔액·run-rate 상태와 무관하므로 실행 중에 무효화하지 않는다.
+    """
+
+    params: Dict[str, Any]
+    # 계좌 -> CATEGORY_ORDER 순서의 월 성장률 / 스트레스 삭감률
+    monthly_growths: Dict[str, Tuple[float, ...]] = field(default_factory=dict)
+    stress_cut_rates: Dict[str, Tuple[float, ...]] = field(default_factory=dict)
+    # (계좌, 카테고리, id(account_stats)) -> 설정값 기준 분배수익률(None이면 잔액 기준 fallback)
+    structural_yields: Dict[Tuple[str, str, int], Optional[float]] = field(default_factory=dict)
+
+
+@dataclass
+class ProjectionRunContext:
+    """실행 1회에 속한 가변 상태. 엔진 인스턴스를 여러 실행이 동시에 공유해도 섞이지 않는다."""
+
+    engine_id: int
+    tax_engine: TaxEngine
+    cost_basis_by_account: Dict[str, Any] = field(default_factory=dict)
+    trade_events: TradeLog = field(default_factory=TradeLog)
+    distribution_rules: Optional[DistributionRuleCache] = None
+
+
+# 스레드/asyncio 태스크별로 분리되는 현재 실행 컨텍스트.
+# 실행마다 set/reset하므로 중첩 실행도 안전하다.
+ACTIVE_RUN: ContextVar[Optional[ProjectionRunContext]] = ContextVar(
+    "projection_active_run", default=None
+)
+# `ProjectionEngine.using_tax_engine()` 블록 안에서만 적용되는 (엔진 id, 세금 엔진) 오버라이드.
+SCOPED_TAX_ENGINE: ContextVar[Optional[Tuple[int, TaxEngine]]] = ContextVar(
+    "projection_scoped_tax_engine", default=None
+)
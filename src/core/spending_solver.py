@@ -0,0 +1,119 @@
+from typing import Any, Dict, Optional
+
+from src.core.projection_engine import ProjectionEngine
+
+# 상한을 찾지 못할 때 탐색을 멈추는 월 필요액 (원)
+MAX_SEARCH_MONTHLY_NEED = 1_000_000_000.0
+
+
+class SustainableSpendingSolver:
+    """
+    [Domain Layer] 최대 지속 가능 월 생활비 탐색기
+    ProjectionEngine을 반복 실행해 전 기간 생존(가계 부족 없음)하거나 목표 기말 실질자산에
+    도달하는 가장 큰 `household_monthly_need`를 구간 확장 후 이분 탐색으로 찾는다.
+    각 반복은 lean 모드로 실행하고 첫 가계 부족 달에 멈추며, 수익률 테이블은 필요액과
+    무관하므로 엔진 캐시에서 재사용된다.
+    """
+
+    def __init__(self, projection_engine: ProjectionEngine) -> None:
+        self.projection_engine = projection_engine
+
+    def solve(
+        self,
+        initial_assets: Dict[str, float],
+        params: Dict[str, Any],
+        *,
+        target_ending_real_assets: Optional[float] = None,
+        tolerance: float = 10_000.0,
+        max_iterations: int = 60,
+    ) -> Dict[str, Any]:
+        tolerance = max(1.0, float(tolerance))
+        iterations = 0
+
+        def evaluate(need: float) -> Dict[str, Any]:
+            nonlocal iterations
+            iterations += 1
+            return self._evaluate(initial_assets, params, need, target_ending_real_assets)
+
+        low, low_result = 0.0, evaluate(0.0)
+        if not low_result["sustainable"]:
+            return self._result(0.0, None, low_result, iterations, False, target_ending_real_assets)
+
+        # 1) 현재 필요액에서 시작해 실패하는 필요액이 나올 때까지 두 배씩 늘려 구간을 잡는다.
+        high = max(
+            tolerance,
+            float(params.get("household_monthly_need", params.get("target_monthly_cashflow", 0))),
+        )
+        high_result = evaluate(high)
+        while high_result["sustainable"]:
+            low, low_result = high, high_result
+            if high >= MAX_SEARCH_MONTHLY_NEED or iterations >= max_iterations:
+                return self._result(
+                    low, None, low_result, iterations, True, target_ending_real_assets
+                )
+            high = min(high * 2.0, MAX_SEARCH_MONTHLY_NEED)
+            high_result = evaluate(high)
+
+        # 2) [성공, 실패] 구간을 허용오차 이하가 될 때까지 이분한다.
+        while high - low > tolerance and iterations < max_iterations:
+            middle = (low + high) / 2.0
+            middle_result = evaluate(middle)
+            if middle_result["sustainable"]:
+                low, low_result = middle, middle_result
+            else:
+                high = middle
+        return self._result(low, high, low_result, iterations, True, target_ending_real_assets)
+
+    def _evaluate(
+        self,
+        initial_assets: Dict[str, float],
+        params: Dict[str, Any],
+        need: float,
+        target_ending_real_assets: Optional[float],
+    ) -> Dict[str, Any]:
+        trial_params = {
+            **params,
+            "household_monthly_need": need,
+            "target_monthly_cashflow": need,
+            "run_mode": "lean",
+            "stop_on_first_shortfall": True,
+            "trade_events_mode": "none",
+            "reuse_cached_prefix": False,
+            "checkpoint_interval_months": 0,
+        }
+        summary = self.projection_engine.run_30yr_simulation(initial_assets, trial_params)[
+            "summary"
+        ]
+        years = summary["survival_months"] / 12.0
+        inflation_rate = float(params.get("inflation_rate", 0.0))
+        ending_real_assets = summary["ending_total_net_worth"] / (1.0 + inflation_rate) ** years
+        sustainable = (
+            bool(summary["is_permanent"]) and not summary["cumulative_household_shortfall"]
+        )
+        if target_ending_real_assets is not None:
+            sustainable = sustainable and ending_real_assets >= float(target_ending_real_assets)
+        return {
+            "sustainable": sustainable,
+            "summary": summary,
+            "ending_real_assets": ending_real_assets,
+        }
+
+    @staticmethod
+    def _result(
+        need: float,
+        failing_need: Optional[float],
+        evaluation: Dict[str, Any],
+        iterations: int,
+        feasible: bool,
+        target_ending_real_assets: Optional[float],
+    ) -> Dict[str, Any]:
+        return {
+            "max_household_monthly_need": need,
+            "first_failing_need": failing_need,
+            "feasible": feasible,
+            "criterion": "survival" if target_ending_real_assets is None else "ending_real_assets",
+            "target_ending_real_assets": target_ending_real_assets,
+            "ending_real_assets": evaluation["ending_real_assets"],
+            "iterations": iterations,
+            "summary": evaluation["summary"],
+        }
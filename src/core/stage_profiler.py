@@ -0,0 +1,41 @@
+from time import perf_counter
+from typing import Any, Dict, List
+
+
+class StageProfiler:
+    """
+    [Domain Layer] 시뮬레이션 단계별 누적 wall time·호출 수 계측기
+    호출부가 단계 시작 시각을 잡고 `add`로 경과 시간을 누적한다. `add`는 현재 시각을
+    반환하므로 연속된 단계는 시작 시각을 이어서 쓸 수 있다.
+    """
+
+    __slots__ = ("stages", "started_at")
+
+    def __init__(self) -> None:
+        # 단계 이름 -> [누적 초, 호출 수]
+        self.stages: Dict[str, List[float]] = {}
+        self.started_at = perf_counter()
+
+    def add(self, stage: str, stage_started_at: float) -> float:
+        now = perf_counter()
+        entry = self.stages.get(stage)
+        if entry is None:
+            self.stages[stage] = [now - stage_started_at, 1]
+        else:
+            entry[0] += now - stage_started_at
+            entry[1] += 1
+        return now
+
+    def to_dict(self) -> Dict[str, Any]:
+        total_seconds = perf_counter() - self.started_at
+        staged_seconds = sum(seconds for seconds, _ in self.stages.values())
+        return {
+            "total_seconds": total_seconds,
+            "unattributed_seconds": max(0.0, total_seconds - staged_seconds),
+            "stages": {
+                stage: {"seconds": seconds, "calls": int(calls)}
+                for stage, (seconds, calls) in sorted(
+                    self.stages.items(), key=lambda item: item[1][0], reverse=True
+                )
+            },
+        }
@@ -1,4 +1,25 @@
-from typing import Any, Dict, Optional
+from concurrent.futures import Executor
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from src.core.projection_output import SUMMARY_COMPARISON_FIELDS
+from src.core.tax_engine import shared_tax_engine
+
+if TYPE_CHECKING:
+    from src.core.projection_engine import ProjectionEngine
+
+STRESS_SCENARIOS = ("BEAR", "STAGFLATION", "DIVIDEND_CUT")
+BASELINE_SCENARIO = "BASELINE"
+DEFAULT_BATCH_SCENARIOS = (BASELINE_SCENARIO,) + STRESS_SCENARIOS
+# 시나리오 충격 크기 설정 키 (StressTestEngine config와 같은 이름)
+SHOCK_KEYS = ("bear_market_drop", "stagflation_rate", "dividend_cut_multiplier")
+# 충격을 적용하는 계좌와 위험자산 카테고리 (SGOV·Bond 버퍼는 하락·배당 삭감 대상이 아님)
+STRESS_ACCOUNTS = ("corp", "pension", "personal")
+STRESS_RISK_CATEGORIES = ("High Income", "Dividend Growth", "Growth Engine")
+# 배당 삭감 대상 카테고리 (SGOV 이자는 배당이 아니므로 제외)
+DIVIDEND_CATEGORIES = ("Bond Buffer",) + STRESS_RISK_CATEGORIES
+
+ScenarioSpec = Union[str, Mapping[str, Any]]
 
 
 class StressTestEngine:
@@ -14,12 +35,66 @@ class StressTestEngine:
         self.stag_inflation = config.get("stagflation_rate", 0.04)
         self.div_cut_rate = config.get("dividend_cut_multiplier", 0.75)
 
+    def shock_config(self) -> Dict[str, float]:
+        return {
+            "bear_market_drop": self.bear_drop,
+            "stagflation_rate": self.stag_inflation,
+            "dividend_cut_multiplier": self.div_cut_rate,
+        }
+
+    def with_shocks(self, shocks: Optional[Mapping[str, Any]]) -> "StressTestEngine":
+        """충격 크기 일부를 바꾼 새 엔진. 알 수 없는 키나 범위를 벗어난 값은 거부한다."""
+        if not shocks:
+            return self
+        unknown = sorted(set(shocks) - set(SHOCK_KEYS))
+        if unknown:
+            raise ValueError(f"지원하지 않는 충격 파라미터입니다: {', '.join(unknown)}")
+        config = self.shock_config()
+        for key, value in shocks.items():
+            config[key] = float(value)
+        if not -1.0 <= config["bear_market_drop"] <= 0.0:
+            raise ValueError("bear_market_drop은 -1 이상 0 이하여야 합니다.")
+        if config["stagflation_rate"] <= -1.0:
+            raise ValueError("stagflation_rate는 -1보다 커야 합니다.")
+        if not 0.0 <= config["dividend_cut_multiplier"] <= 1.0:
+            raise ValueError("dividend_cut_multiplier는 0 이상 1 이하여야 합니다.")
+        return StressTestEngine(config)
+
+    @staticmethod
+    def parse_scenario(scenario_id: str) -> Tuple[str, ...]:
+        """
+        `BEAR+DIVIDEND_CUT`처럼 `+`로 합성한 시나리오 ID를 구성 시나리오 목록으로 나눈다.
+        `BASELINE`은 빈 튜플이며, 중복 구성은 한 번만 적용한다.
+        """
+        components: List[str] = []
+        for part in str(scenario_id).split("+"):
+            component = part.strip().upper()
+            if component == BASELINE_SCENARIO:
+                continue
+            if component not in STRESS_SCENARIOS:
+                raise ValueError(
+                    "지원하지 않는 stress scenario입니다. "
+                    f"{', '.join(STRESS_SCENARIOS)} 또는 '+'로 합성한 조합을 사용해주세요."
+                )
+            if component not in components:
+                components.append(component)
+        return tuple(components)
+
     def apply_scenario(self, base_params: Dict[str, Any], scenario_id: str) -> Dict[str, Any]:
+        if "+" in scenario_id:
+            components = self.parse_scenario(scenario_id)
+            params = base_params.copy()
+            for component in components:
+                params = self.apply_scenario(params, component)
+            params["active_stress_scenario"] = "+".join(components)
+            return params
+
         params = base_params.copy()
 
         if scenario_id == "BEAR":
             params["stress_event"] = "MARKET_CRASH"
             params["market_drop"] = self.bear_drop
+            self._apply_market_drop(params, self.bear_drop)
 
         elif scenario_id == "STAGFLATION":
             params["market_return_rate"] = 0.0
@@ -29,6 +104,192 @@ class StressTestEngine:
             if "dividend_yield" in params:
                 params["dividend_yield"] *= self.div_cut_rate
             params["income_multiplier"] = self.div_cut_rate
+            self._apply_dividend_cut(params, self.div_cut_rate)
 
         params["active_stress_scenario"] = scenario_id
         return params
+
+    @staticmethod
+    def _apply_market_drop(params: Dict[str, Any], drop: float) -> None:
+        """
+        시뮬레이션 첫 달 위험자산 가격을 `drop`만큼 한 번에 떨어뜨리는 월 수익률 override를 넣는다.
+        그달에 엔진이 쓸 수익률(기존 월 override, 없으면 카테고리 수익률·평가 상승률 설정)의
+        월 가격 수익률에 하락을 곱해 합치므로, 평소 첫 달 수익률 위에 하락이 더해진다.
+        """
+        from src.core.projection_engine import ProjectionEngine
+
+        rate_engine = ProjectionEngine(tax_engine=shared_tax_engine())
+        start_year = int(params.get("simulation_start_year", 2026))
+        start_month = int(params.get("simulation_start_month", 1))
+        month_key = f"{start_year}-{start_month:02d}"
+        portfolio_stats = params.get("portfolio_stats") or {}
+        overrides = deepcopy(params.get("monthly_return_overrides") or {})
+        for account in STRESS_ACCOUNTS:
+            account_stats = portfolio_stats.get(account) or {}
+            # 첫 달 잔액 구성(목표 비중)으로 단일 위험 슬리브 여부까지 엔진과 같게 판정한다.
+            weights = account_stats.get("strategy_weights") or {}
+            start_state = {
+                category: float(weights.get(category, 0.0)) if weights else 1.0
+                for category in rate_engine.CATEGORY_ORDER
+            }
+            for category in STRESS_RISK_CATEGORIES:
+                normal = rate_engine._category_rate_spec(
+                    account, category, start_state, account_stats, params, start_year, start_month
+                )
+                monthly = overrides.setdefault(account, {}).setdefault(category, {})
+                growth = (1.0 + _monthly_price_return(normal["pa"])) * (1.0 + drop)
+                monthly[month_key] = {
+                    "dy": normal["dy"],
+                    # 월 가격 수익률 g를 엔진의 연 PA 입력으로 (연 -100% 이하는 월 단순 분할)
+                    "pa": growth**12 - 1.0 if growth > 0 else (growth - 1.0) * 12.0,
+                }
+        params["monthly_return_overrides"] = overrides
+
+    @staticmethod
+    def _apply_dividend_cut(params: Dict[str, Any], multiplier: float) -> None:
+        """
+        엔진이 분배수익률을 읽는 입력(분배 override·카테고리 수익률 dy·계좌 배당률·명시 run-rate)을
+        모두 `multiplier`배로 줄인다. 가격 수익률(PA)은 그대로 둔다.
+        """
+        cut = 1.0 - multiplier
+        overrides = deepcopy(params.get("distribution_yield_overrides") or {})
+        for policy_overrides in overrides.values():
+            for category in DIVIDEND_CATEGORIES:
+                if policy_overrides.get(category) is not None:
+                    policy_overrides[category] = float(policy_overrides[category]) * multiplier
+        params["distribution_yield_overrides"] = overrides
+
+        category_rates = deepcopy(params.get("category_return_rates") or {})
+        for account_rates in category_rates.values():
+            for category in DIVIDEND_CATEGORIES:
+                rates = account_rates.get(category)
+                if not rates or "dy" not in rates:
+                    continue
+                dy = float(rates["dy"])
+                rates["dy"] = dy * multiplier
+                if "tr" in rates:
+                    rates["tr"] = float(rates["tr"]) - dy * cut
+        params["category_return_rates"] = category_rates
+
+        portfolio_stats = deepcopy(params.get("portfolio_stats") or {})
+        for stats in portfolio_stats.values():
+            dy = float(stats.get("dividend_yield", 0.0))
+            stats["dividend_yield"] = dy * multiplier
+            # 기대 총수익률도 줄여 단일 위험자산의 가격 수익률(기대수익률 - 배당률)을 유지한다.
+            if "expected_return" in stats:
+                stats["expected_return"] = float(stats["expected_return"]) - dy * cut
+            category_yields = stats.get("category_dividend_yields") or {}
+            for category in DIVIDEND_CATEGORIES:
+                if category in category_yields:
+                    category_yields[category] = float(category_yields[category]) * multiplier
+        params["portfolio_stats"] = portfolio_stats
+
+        run_rates = deepcopy(params.get("distribution_run_rates") or {})
+        for account_run_rates in run_rates.values():
+            for category in DIVIDEND_CATEGORIES:
+                if category in account_run_rates:
+                    account_run_rates[category] = float(account_run_rates[category]) * multiplier
+        if run_rates:
+            params["distribution_run_rates"] = run_rates
+
+    def build_batch(
+        self,
+        base_params: Dict[str, Any],
+        scenarios: Optional[Iterable[ScenarioSpec]] = None,
+        shocks: Optional[Mapping[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        시나리오 목록의 실행 파라미터를 한 번에 만든다. 각 항목은 시나리오 ID 문자열이거나
+        `{"scenario": "BEAR+DIVIDEND_CUT", "shocks": {...}, "label": ...}` 형식이며,
+        항목별 `shocks`는 공통 `shocks` 위에 덮어쓴다.
+        """
+        base_engine = self.with_shocks(shocks)
+        batch = []
+        for spec in DEFAULT_BATCH_SCENARIOS if scenarios is None else scenarios:
+            if isinstance(spec, Mapping):
+                scenario_id = str(spec.get("scenario") or BASELINE_SCENARIO)
+                scenario_shocks = spec.get("shocks") or {}
+                label = spec.get("label")
+            else:
+                scenario_id, scenario_shocks, label = str(spec), {}, None
+            components = self.parse_scenario(scenario_id)
+            engine = base_engine.with_shocks(scenario_shocks)
+            params = (
+                engine.apply_scenario(base_params, "+".join(components))
+                if components
+                else base_params.copy()
+            )
+            batch.append(
+                {
+                    "scenario": label or "+".join(components) or BASELINE_SCENARIO,
+                    "components": list(components),
+                    "shocks": engine.shock_config(),
+                    "params": params,
+                }
+            )
+        if not batch:
+            raise ValueError("비교할 stress scenario가 없습니다.")
+        return batch
+
+    def run_batch(
+        self,
+        projection_engine: "ProjectionEngine",
+        initial_assets: Dict[str, float],
+        base_params: Dict[str, Any],
+        scenarios: Optional[Iterable[ScenarioSpec]] = None,
+        *,
+        shocks: Optional[Mapping[str, Any]] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Dict[str, Any]:
+        """
+        여러 스트레스 시나리오를 한 번에 (가능하면 병렬로) 실행해 요약을 나란히 비교한다.
+        각 실행은 lean·거래 로그 생략 모드이며, 기준선(BASELINE)이 있으면 기준선 대비 차이를 붙인다.
+        """
+        batch = self.build_batch(base_params, scenarios, shocks)
+        params_list = [
+            {
+                **entry["params"],
+                "run_mode": "lean",
+                "trade_events_mode": "none",
+                "reuse_cached_prefix": False,
+                "checkpoint_interval_months": 0,
+                "profile": False,
+            }
+            for entry in batch
+        ]
+        results = projection_engine.run_batch(
+            initial_assets, params_list, max_workers=max_workers, executor=executor
+        )
+
+        comparisons = []
+        for entry, result in zip(batch, results):
+            summary = result["summary"]
+            comparisons.append(
+                {
+                    "scenario": entry["scenario"],
+                    "components": entry["components"],
+                    "shocks": entry["shocks"],
+                    **{field: summary.get(field) for field in SUMMARY_COMPARISON_FIELDS},
+                }
+            )
+        baseline = next((row for row in comparisons if not row["components"]), None)
+        if baseline is not None:
+            for row in comparisons:
+                row["survival_months_vs_baseline"] = (
+                    row["survival_months"] - baseline["survival_months"]
+                )
+                row["ending_total_net_worth_vs_baseline"] = (
+                    row["ending_total_net_worth"] - baseline["ending_total_net_worth"]
+                )
+        return {
+            "baseline_scenario": baseline["scenario"] if baseline is not None else None,
+            "scenarios": comparisons,
+        }
+
+
+def _monthly_price_return(annual_pa: float) -> float:
+    """ProjectionEngine._monthly_return_components와 같은 연 PA -> 월 가격 수익률 변환."""
+    if annual_pa <= -1.0:
+        return annual_pa / 12.0
+    return (1.0 + annual_pa) ** (1.0 / 12.0) - 1.0
@@ -1,10 +1,31 @@
-from typing import Any, Dict, Optional
+import hashlib
+import json
+from bisect import bisect_left
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# 종합소득세 국세 누진구간 (상한, 세율)
+INCOME_TAX_BRACKETS = (
+    (14000000.0, 0.06),
+    (50000000.0, 0.15),
+    (88000000.0, 0.24),
+    (150000000.0, 0.35),
+    (300000000.0, 0.38),
+    (500000000.0, 0.40),
+    (1000000000.0, 0.42),
+    (float("inf"), 0.45),
+)
 
 
 class TaxEngine:
     """
     [Domain Layer] 세무 및 비용 계산 엔진
     모든 세무 상수는 외부에서 주입받으며, 미지정 시 기본값을 사용함. [REQ-ARCH-2]
+    생성 후에는 설정을 바꿀 수 없으므로 같은 설정의 요청끼리 인스턴스를 공유한다
+    (`shared_tax_engine`).
     """
 
     PROPERTY_POINT_BRACKETS = (
@@ -119,6 +140,40 @@ class TaxEngine:
             config.get("health_income_reflection_lag_years", 1)
         )
 
+        # 누진구간 조회표: 정렬된 구간 상한(bisect 대상)과 구간 하한·세율, 각 구간 하한까지의
+        # 누적 세액을 미리 계산해 두므로 구간 조회는 이진 탐색 한 번과 곱셈 한 번이다.
+        # 누적 세액은 기존 구간별 루프와 같은 순서로 더해 결과가 비트 단위로 같다.
+        self._property_upper_bounds = tuple(
+            float(upper) for upper, _ in self.PROPERTY_POINT_BRACKETS
+        )
+        self._property_points = tuple(points for _, points in self.PROPERTY_POINT_BRACKETS)
+        self._income_tax_uppers = tuple(upper for upper, _ in INCOME_TAX_BRACKETS)
+        self._income_tax_lowers = (0.0,) + self._income_tax_uppers[:-1]
+        self._income_tax_rates = tuple(rate for _, rate in INCOME_TAX_BRACKETS)
+        floor_tax = [0.0]
+        for lower, upper, rate in zip(
+            self._income_tax_lowers[:-1], self._income_tax_uppers[:-1], self._income_tax_rates[:-1]
+        ):
+            floor_tax.append(floor_tax[-1] + (upper - lower) * rate)
+        self._income_tax_floor_taxes = tuple(floor_tax)
+
+        # 배열 API용 같은 구간표
+        self._property_upper_array = np.array(self._property_upper_bounds)
+        self._property_points_array = np.array(self._property_points, dtype=np.int64)
+        self._income_tax_upper_array = np.array(self._income_tax_uppers)
+        self._income_tax_lower_array = np.array(self._income_tax_lowers)
+        self._income_tax_rate_array = np.array(self._income_tax_rates)
+        self._income_tax_floor_tax_array = np.array(self._income_tax_floor_taxes)
+        self._frozen = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError("TaxEngine 설정은 생성 후 바꿀 수 없습니다. 새 설정으로 만드세요.")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("TaxEngine 설정은 생성 후 바꿀 수 없습니다. 새 설정으로 만드세요.")
+
     def calculate_corp_tax(self, profit: float) -> float:
         """법인세 산출.
 
@@ -162,11 +217,11 @@ class TaxEngine:
         if taxable_property <= 0:
             return 0, 0
 
-        taxable_manwon = taxable_property / 10000
-        for grade, (upper_manwon, points) in enumerate(self.PROPERTY_POINT_BRACKETS, start=1):
-            if taxable_manwon <= upper_manwon:
-                return grade, points
-        return 60, 2341
+        # 과세표준(만원) 이상인 첫 구간 상한
+        index = bisect_left(self._property_upper_bounds, taxable_property / 10000)
+        if index >= len(self._property_points):
+            return 60, 2341
+        return index + 1, self._property_points[index]
 
     def get_property_points(self, property_val: float) -> int:
         """재산세 과세표준액의 공제 후 60등급 점수를 반환합니다."""
@@ -217,30 +272,14 @@ class TaxEngine:
         result = self.calculate_local_health_insurance_detailed(property_val, annual_income)
         return result["total_premium"]
 
-    @staticmethod
-    def _progressive_income_tax_national(tax_base: float) -> float:
-        """종합소득 과세표준의 국세 산출세액을 누진구간으로 계산합니다."""
+    def _progressive_income_tax_national(self, tax_base: float) -> float:
+        """종합소득 과세표준의 국세 산출세액: 구간 하한까지의 누적 세액 + 초과분 × 구간 세율."""
         taxable = max(0.0, tax_base)
-        brackets = (
-            (14000000.0, 0.06),
-            (50000000.0, 0.15),
-            (88000000.0, 0.24),
-            (150000000.0, 0.35),
-            (300000000.0, 0.38),
-            (500000000.0, 0.40),
-            (1000000000.0, 0.42),
-            (float("inf"), 0.45),
+        index = bisect_left(self._income_tax_uppers, taxable)
+        return (
+            self._income_tax_floor_taxes[index]
+            + (taxable - self._income_tax_lowers[index]) * self._income_tax_rates[index]
         )
-        tax = 0.0
-        lower = 0.0
-        for upper, rate in brackets:
-            band = min(taxable, upper) - lower
-            if band > 0:
-                tax += band * rate
-            if taxable <= upper:
-                break
-            lower = upper
-        return tax
 
     def calculate_progressive_income_tax(self, tax_base: float) -> float:
         """지방소득세 10%를 포함한 종합소득 산출세액 추정값입니다."""
@@ -324,6 +363,140 @@ class TaxEngine:
             "capital_gains_tax": tax,
         }
 
+    # ----- 배열 입력 버전: 값 배열을 한 번에 계산하고 항목별 배열을 돌려준다 -----
+
+    def calculate_corp_tax_array(self, profits: Any) -> np.ndarray:
+        """`calculate_corp_tax`의 배열 버전."""
+        profit = np.asarray(profits, dtype=float)
+        if self.corp_tax_nominal_rate:
+            tax = profit * self.corp_tax_effective_rate
+        else:
+            tax = np.where(
+                profit <= self.corp_tax_threshold,
+                profit * self.corp_tax_low_rate,
+                (self.corp_tax_threshold * self.corp_tax_low_rate)
+                + (profit - self.corp_tax_threshold) * self.corp_tax_high_rate,
+            )
+        return np.where(profit <= 0, 0.0, tax)
+
+    def get_property_grade_array(self, property_vals: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """`get_property_grade`의 배열 버전. 정렬된 구간 상한에서 (등급, 점수) 배열을 찾는다."""
+        taxable = np.maximum(
+            0.0, np.asarray(property_vals, dtype=float) - self.property_basic_deduction
+        )
+        index = np.searchsorted(self._property_upper_array, taxable / 10000, side="left")
+        index = np.minimum(index, len(self._property_upper_array) - 1)
+        has_property = taxable > 0
+        grades = np.where(has_property, index + 1, 0)
+        points = np.where(has_property, self._property_points_array[index], 0)
+        return grades, points
+
+    def calculate_local_health_insurance_array(
+        self, property_vals: Any, annual_incomes: Any
+    ) -> Dict[str, np.ndarray]:
+        """`calculate_local_health_insurance_detailed`의 배열 버전 (금액·등급 항목만)."""
+        property_val, annual_income = np.broadcast_arrays(
+            np.asarray(property_vals, dtype=float), np.asarray(annual_incomes, dtype=float)
+        )
+        grades, points = self.get_property_grade_array(property_val)
+        monthly_income = np.maximum(0.0, annual_income) / 12
+        income_monthly_premium = _truncate_to_ten_won_array(
+            monthly_income * self.health_insurance_rate
+        )
+        property_premium = np.floor(points * self.point_unit_price)
+        base_premium = _truncate_to_ten_won_array(income_monthly_premium + property_premium)
+        long_term_care_premium = _truncate_to_ten_won_array(
+            base_premium * self.long_term_care_rate / self.health_insurance_rate
+        )
+        return {
+            "taxable_property_value": np.maximum(0.0, property_val - self.property_basic_deduction),
+            "property_grade": grades,
+            "property_points": points,
+            "property_premium": property_premium,
+            "monthly_income": monthly_income,
+            "income_monthly_premium": income_monthly_premium,
+            "base_premium": base_premium,
+            "long_term_care_premium": long_term_care_premium,
+            "total_premium": base_premium + long_term_care_premium,
+        }
+
+    def calculate_progressive_income_tax_array(self, tax_bases: Any) -> np.ndarray:
+        """
+        `calculate_progressive_income_tax`의 배열 버전.
+        `np.searchsorted`로 구간을 찾고 구간 하한까지의 누적 세액에 구간 내 초과분 세액을 더한다.
+        """
+        taxable = np.maximum(0.0, np.asarray(tax_bases, dtype=float))
+        index = np.searchsorted(self._income_tax_upper_array, taxable, side="left")
+        national = (
+            self._income_tax_floor_tax_array[index]
+            + (taxable - self._income_tax_lower_array[index]) * self._income_tax_rate_array[index]
+        )
+        return national * 1.1
+
+    def calculate_us_dividend_tax_array(
+        self,
+        gross_dividends: Any,
+        *,
+        other_financial_income: Any = 0.0,
+        other_comprehensive_tax_base: Any = 0.0,
+    ) -> Dict[str, np.ndarray]:
+        """`calculate_us_dividend_tax`의 배열 버전. 세 입력은 서로 브로드캐스트된다."""
+        gross, other_financial, other_base = np.broadcast_arrays(
+            np.maximum(0.0, np.asarray(gross_dividends, dtype=float)),
+            np.maximum(0.0, np.asarray(other_financial_income, dtype=float)),
+            np.maximum(0.0, np.asarray(other_comprehensive_tax_base, dtype=float)),
+        )
+        threshold = self.financial_income_comprehensive_threshold
+        financial_total = gross + other_financial
+        foreign_withholding = gross * self.us_dividend_foreign_withholding_rate
+        separate_tax_floor = gross * self.domestic_dividend_tax_rate
+        is_comprehensive = financial_total > threshold
+
+        comprehensive_excess = np.maximum(0.0, financial_total - threshold)
+        base_progressive_tax = self.calculate_progressive_income_tax_array(other_base)
+        general = self.calculate_progressive_income_tax_array(other_base + comprehensive_excess) + (
+            threshold * self.domestic_dividend_tax_rate
+        )
+        comparison = base_progressive_tax + financial_total * self.domestic_dividend_tax_rate
+        incremental = np.maximum(0.0, np.maximum(general, comparison) - base_progressive_tax)
+        allocated = incremental * np.divide(
+            gross, financial_total, out=np.zeros_like(financial_total), where=financial_total > 0
+        )
+        domestic_tax_before_credit = np.where(
+            is_comprehensive, np.maximum(separate_tax_floor, allocated), separate_tax_floor
+        )
+        foreign_tax_credit = np.minimum(foreign_withholding, domestic_tax_before_credit)
+        domestic_additional_tax = np.maximum(0.0, domestic_tax_before_credit - foreign_tax_credit)
+        return {
+            "gross_dividend": gross,
+            "foreign_withholding_tax": foreign_withholding,
+            "foreign_tax_credit": foreign_tax_credit,
+            "domestic_tax_before_credit": domestic_tax_before_credit,
+            "domestic_additional_tax": domestic_additional_tax,
+            "total_dividend_tax": foreign_withholding + domestic_additional_tax,
+            "financial_income_total": financial_total,
+            "general_calculated_tax": np.where(is_comprehensive, general, 0.0),
+            "comparison_calculated_tax": np.where(is_comprehensive, comparison, 0.0),
+            "incremental_financial_income_tax": np.where(
+                is_comprehensive, incremental, separate_tax_floor
+            ),
+            "is_comprehensive": is_comprehensive,
+        }
+
+    def calculate_us_capital_gains_tax_array(
+        self, annual_realized_gains: Any
+    ) -> Dict[str, np.ndarray]:
+        """`calculate_us_capital_gains_tax`의 배열 버전."""
+        gain = np.asarray(annual_realized_gains, dtype=float)
+        net_gain = np.maximum(0.0, gain)
+        taxable_gain = np.maximum(0.0, net_gain - self.us_capital_gains_annual_deduction)
+        return {
+            "annual_realized_gain": gain,
+            "net_gain_after_loss_offset": net_gain,
+            "taxable_gain": taxable_gain,
+            "capital_gains_tax": taxable_gain * self.us_capital_gains_tax_rate,
+        }
+
     def calculate_corp_profitability(
         self,
         assets: float,
@@ -368,3 +541,55 @@ class TaxEngine:
             "after_tax_yield": (annual_net / assets) * 100 if assets > 0 else 0,
             "after_tax_cagr": (annual_net / assets) - 1 if assets > 0 else 0,
         }
+
+
+# 설정 지문 -> 공유 TaxEngine (최근 사용 순)
+TAX_ENGINE_CACHE_SIZE = 32
+_shared_tax_engines: "OrderedDict[str, TaxEngine]" = OrderedDict()
+_shared_tax_engines_lock = Lock()
+
+
+def _normalize_tax_config_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {str(key): _normalize_tax_config_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_tax_config_value(item) for item in value]
+    if value is None or isinstance(value, bool):
+        return value
+    # 엔진이 float()/int()로 읽으므로 5, 5.0, "5"는 같은 설정이다.
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def tax_config_fingerprint(config: Optional[Dict[str, Any]] = None) -> str:
+    """정규화한 세무 설정(키 정렬, 숫자는 float)의 SHA-256 지문."""
+    normalized = _normalize_tax_config_value(dict(config or {}))
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def shared_tax_engine(config: Optional[Dict[str, Any]] = None) -> TaxEngine:
+    """
+    설정 지문이 같은 요청끼리 공유하는 불변 `TaxEngine`을 돌려준다.
+    최근 `TAX_ENGINE_CACHE_SIZE`개 설정만 보관하고 가장 오래 쓰지 않은 엔진부터 버린다.
+    """
+    fingerprint = tax_config_fingerprint(config)
+    with _shared_tax_engines_lock:
+        engine = _shared_tax_engines.get(fingerprint)
+        if engine is not None:
+            _shared_tax_engines.move_to_end(fingerprint)
+            return engine
+    engine = TaxEngine(config=config)
+    with _shared_tax_engines_lock:
+        # 동시에 같은 설정을 만든 경우 먼저 등록된 엔진을 쓴다.
+        engine = _shared_tax_engines.setdefault(fingerprint, engine)
+        _shared_tax_engines.move_to_end(fingerprint)
+        while len(_shared_tax_engines) > TAX_ENGINE_CACHE_SIZE:
+            _shared_tax_engines.popitem(last=False)
+    return engine
+
+
+def _truncate_to_ten_won_array(amounts: np.ndarray) -> np.ndarray:
+    return np.floor(np.maximum(0.0, amounts) / 10) * 10
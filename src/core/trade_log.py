@@ -0,0 +1,195 @@
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from src.core.account_state import CATEGORY_INDEX, CATEGORY_ORDER
+
+# full: 거래별 이벤트, yearly: (계좌, 연도)별 합계, none: 결과에 거래 로그를 싣지 않는다.
+TRADE_EVENTS_MODES = ("full", "yearly", "none")
+
+_EVENT_AMOUNT_FIELDS = ("sale_proceeds", "cost_basis_sold", "realized_gain")
+
+
+class TradeLog(Sequence):
+    """
+    [Domain Layer] 병렬 배열 기반 매도 거래 로그
+    거래마다 dict를 만들지 않고 계좌·연·월·카테고리 코드와 금액을 같은 인덱스의 배열에 쌓는다.
+    (계좌, 연도)별 합계를 기록 시점에 누적해 두므로 세금 계산·연간 집계가 로그를 다시 훑지 않는다.
+    기존 호출부를 위해 인덱스/순회 시에는 이전과 같은 이벤트 dict를 만들어 돌려준다.
+    """
+
+    __slots__ = (
+        "account_codes",
+        "years",
+        "months",
+        "from_codes",
+        "to_codes",
+        "sale_proceeds",
+        "cost_basis_sold",
+        "realized_gains",
+        "obligation_codes",
+        "_labels",
+        "_label_codes",
+        "_yearly_totals",
+    )
+
+    def __init__(self, events: Optional[Iterable[Mapping[str, Any]]] = None) -> None:
+        self.account_codes = array("H")
+        self.years = array("i")
+        self.months = array("b")
+        self.from_codes = array("b")
+        self.to_codes = array("b")
+        self.sale_proceeds = array("d")
+        self.cost_basis_sold = array("d")
+        self.realized_gains = array("d")
+        self.obligation_codes = array("H")
+        # 계좌 키·현금 의무 유형 문자열 테이블. 코드 0은 None이다.
+        self._labels: List[Optional[str]] = [None]
+        self._label_codes: Dict[Optional[str], int] = {None: 0}
+        # (계좌, 연도) -> [매도금액, 매도 취득원가, 실현손익, 거래 수]
+        self._yearly_totals: Dict[Tuple[Optional[str], int], List[float]] = {}
+        if events:
+            self.extend(events)
+
+    def _label_code(self, label: Optional[str]) -> int:
+        code = self._label_codes.get(label)
+        if code is None:
+            code = len(self._labels)
+            self._labels.append(label)
+            self._label_codes[label] = code
+        return code
+
+    def record(
+        self,
+        account_key: Optional[str],
+        year: Optional[int],
+        month: Optional[int],
+        from_category: str,
+        to_category: str,
+        sale_proceeds: float,
+        cost_basis_sold: float,
+        cash_obligation: Optional[str] = None,
+    ) -> None:
+        realized_gain = sale_proceeds - cost_basis_sold
+        self.account_codes.append(self._label_code(account_key))
+        self.years.append(year or 0)
+        self.months.append(month or 0)
+        self.from_codes.append(CATEGORY_INDEX[from_category])
+        self.to_codes.append(CATEGORY_INDEX[to_category])
+        self.sale_proceeds.append(sale_proceeds)
+        self.cost_basis_sold.append(cost_basis_sold)
+        self.realized_gains.append(realized_gain)
+        self.obligation_codes.append(self._label_code(cash_obligation))
+        totals = self._yearly_totals.get((account_key, year or 0))
+        if totals is None:
+            totals = self._yearly_totals[(account_key, year or 0)] = [0.0, 0.0, 0.0, 0]
+        totals[0] += sale_proceeds
+        totals[1] += cost_basis_sold
+        totals[2] += realized_gain
+        totals[3] += 1
+
+    def append(self, event: Mapping[str, Any]) -> None:
+        """이벤트 dict(체크포인트·기존 형식)를 배열 행으로 옮긴다."""
+        self.record(
+            event.get("account"),
+            event.get("year"),
+            event.get("month"),
+            event["from_category"],
+            event["to_category"],
+            float(event.get("sale_proceeds") or 0.0),
+            float(event.get("cost_basis_sold") or 0.0),
+            event.get("cash_obligation"),
+        )
+
+    def extend(self, events: Iterable[Mapping[str, Any]]) -> None:
+        for event in events:
+            self.append(event)
+
+    def mark_cash_obligation(self, start: int, account_key: str, obligation_type: str) -> None:
+        """`start` 이후 기록된 해당 계좌 매도를 현금 의무 재원 매도로 표시한다."""
+        account_code = self._label_codes.get(account_key)
+        if account_code is None:
+            return
+        obligation_code = self._label_code(obligation_type)
+        for index in range(start, len(self.account_codes)):
+            if self.account_codes[index] == account_code:
+                self.obligation_codes[index] = obligation_code
+
+    def realized_gain(self, account_key: str, year: int) -> float:
+        totals = self._yearly_totals.get((account_key, year))
+        return totals[2] if totals is not None else 0.0
+
+    def event(self, index: int) -> Dict[str, Any]:
+        event = {
+            "account": self._labels[self.account_codes[index]],
+            "year": self.years[index] or None,
+            "month": self.months[index] or None,
+            "from_category": CATEGORY_ORDER[self.from_codes[index]],
+            "to_category": CATEGORY_ORDER[self.to_codes[index]],
+            "sale_proceeds": self.sale_proceeds[index],
+            "cost_basis_sold": self.cost_basis_sold[index],
+            "realized_gain": self.realized_gains[index],
+        }
+        obligation_code = self.obligation_codes[index]
+        if obligation_code:
+            event["cash_obligation"] = self._labels[obligation_code]
+        return event
+
+    def events(self, account_key: Optional[str] = None) -> List[Dict[str, Any]]:
+        if account_key is None:
+            return [self.event(index) for index in range(len(self.account_codes))]
+        account_code = self._label_codes.get(account_key)
+        if account_code is None:
+            return []
+        return [
+            self.event(index)
+            for index, code in enumerate(self.account_codes)
+            if code == account_code
+        ]
+
+    def yearly_totals(self) -> List[Dict[str, Any]]:
+        """(계좌, 연도)별 매도 합계. 처음 매도가 기록된 순서를 따른다."""
+        return [
+            {
+                "account": account_key,
+                "year": year or None,
+                "trade_count": int(totals[3]),
+                **dict(zip(_EVENT_AMOUNT_FIELDS, totals[:3])),
+            }
+            for (account_key, year), totals in self._yearly_totals.items()
+        ]
+
+    def __len__(self) -> int:
+        return len(self.account_codes)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self.event(position) for position in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TradeLog index out of range")
+        return self.event(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self.account_codes)):
+            yield self.event(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TradeLog, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TradeLog({self.events()!r})"
+
+
+def realized_gain_for(trade_events: Any, account_key: str, year: int) -> float:
+    """거래 로그(TradeLog 또는 이벤트 dict 목록)에서 (계좌, 연도) 실현손익 합계를 구한다."""
+    if isinstance(trade_events, TradeLog):
+        return trade_events.realized_gain(account_key, year)
+    return sum(
+        float(event.get("realized_gain") or 0.0)
+        for event in trade_events or []
+        if event.get("account") == account_key and int(event.get("year") or 0) == year
+    )
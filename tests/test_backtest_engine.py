@@ -0,0 +1,244 @@
+import inspect
+import math
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import src.backend.main as main_module
+from src.backend.api import DividendBackend
+from src.core.backtest_engine import HistoricalBacktestEngine
+from src.core.historical_series import (
+    HistoricalSeries,
+    build_return_overrides,
+    resolve_series_file,
+)
+from src.core.projection_engine import ProjectionEngine
+from src.core.tax_engine import TaxEngine
+
+INITIAL_ASSETS = {"corp": 1500000000, "pension": 500000000, "personal": 0}
+HOLDINGS = {
+    "corp": [
+        {"symbol": "SGOV", "category": "SGOV Buffer", "weight": 20},
+        {"symbol": "VOO", "category": "Growth Engine", "weight": 50},
+        {"symbol": "QQQM", "category": "Growth Engine", "weight": 30},
+    ],
+    "pension": [{"symbol": "SCHD", "category": "Dividend Growth", "weight": 100}],
+}
+
+
+def backtest_params() -> dict:
+    stats = {
+        "dividend_yield": 0.04,
+        "expected_return": 0.07,
+        "strategy_weights": {
+            "SGOV Buffer": 0.2,
+            "Bond Buffer": 0.0,
+            "High Income": 0.0,
+            "Dividend Growth": 0.3,
+            "Growth Engine": 0.5,
+        },
+    }
+    return {
+        "simulation_years": 3,
+        "simulation_start_year": 2026,
+        "simulation_start_month": 1,
+        "birth_year": 1972,
+        "birth_month": 8,
+        "private_pension_start_age": 55,
+        "national_pension_start_age": 65,
+        "household_monthly_need": 6000000,
+        "target_monthly_cashflow": 6000000,
+        "inflation_rate": 0.025,
+        "personal_enabled": False,
+        "portfolio_stats": {"corp": dict(stats), "pension": dict(stats)},
+    }
+
+
+def series_frame(months: int = 48) -> pd.DataFrame:
+    records = []
+    for index in range(months):
+        date = f"{2006 + index // 12}-{index % 12 + 1:02d}-28"
+        crash = -0.12 if 30 <= index < 34 else 0.01
+        records.extend(
+            [
+                {
+                    "ticker": "SGOV",
+                    "date": date,
+                    "total_return": 0.003,
+                    "distribution_yield": 0.003,
+                },
+                {"ticker": "VOO", "date": date, "total_return": crash, "distribution_yield": 0.001},
+                {
+                    "ticker": "SCHD",
+                    "date": date,
+                    "total_return": 0.008,
+                    "distribution_yield": 0.003,
+                },
+            ]
+        )
+        # QQQM은 2년차부터만 시계열이 있다.
+        if index >= 12:
+            records.append({"ticker": "QQQM", "date": date, "total_return": 0.02})
+    return pd.DataFrame(records)
+
+
+def test_series_loads_csv_on_continuous_month_axis(tmp_path):
+    path = tmp_path / "series.csv"
+    frame = series_frame(24).drop(index=[3])
+    frame.to_csv(path, index=False)
+
+    series = HistoricalSeries.load(path)
+
+    assert series.months[0] == "2006-01"
+    assert series.months[-1] == "2007-12"
+    assert len(series.months) == 24
+    assert series.tickers == ["QQQM", "SCHD", "SGOV", "VOO"]
+    assert math.isnan(series.total_returns[series.tickers.index("SGOV"), 1])
+    with pytest.raises(ValueError):
+        HistoricalSeries.load(tmp_path / "series.xlsx")
+
+
+def test_series_files_resolve_only_inside_data_directory(tmp_path):
+    data_dir = tmp_path / "history"
+    data_dir.mkdir()
+    series_frame(12).to_csv(data_dir / "series.csv", index=False)
+    series_frame(12).to_csv(tmp_path / "outside.csv", index=False)
+    (data_dir / "link.csv").symlink_to(tmp_path / "outside.csv")
+
+    assert resolve_series_file(data_dir, "series.csv") == (data_dir / "series.csv").resolve()
+    assert resolve_series_file(data_dir, "series") == (data_dir / "series.csv").resolve()
+    for name in ("../outside.csv", str(tmp_path / "outside.csv"), "..", "", "series.txt"):
+        with pytest.raises(ValueError):
+            resolve_series_file(data_dir, name)
+    for name in ("link.csv", "missing.csv", "outside"):
+        with pytest.raises(FileNotFoundError):
+            resolve_series_file(data_dir, name)
+
+
+def test_category_returns_reweight_holdings_present_in_each_month():
+    """카테고리 수익률은 그 달 시계열이 있는 종목끼리 비중을 다시 나눈 가중평균이다."""
+    series = HistoricalSeries.from_frame(series_frame(24))
+
+    returns, unmapped = series.category_returns(
+        {**HOLDINGS, "personal": [{"symbol": "ZZZ", "category": "Growth Engine", "weight": 1}]}
+    )
+
+    corp_total, corp_distribution = returns["corp"]
+    assert corp_total[0, 4] == pytest.approx(0.01)
+    assert corp_total[12, 4] == pytest.approx(0.01 * 0.5 / 0.8 + 0.02 * 0.3 / 0.8)
+    assert corp_distribution[12, 4] == pytest.approx(0.001 * 0.5 / 0.8)
+    assert math.isnan(corp_total[0, 1])
+    assert "personal" not in returns
+    assert unmapped == [{"account": "personal", "symbol": "ZZZ", "category": "Growth Engine"}]
+
+
+def test_return_overrides_replay_history_as_engine_monthly_rates():
+    series = HistoricalSeries.from_frame(series_frame(24))
+    returns, _ = series.category_returns(HOLDINGS)
+    calendar = [(2026, month) for month in range(1, 13)] + [(2027, 1), (2027, 2)]
+
+    overrides, historical_months = build_return_overrides(returns, 12, calendar)
+
+    growth = overrides["corp"]["Growth Engine"]
+    assert historical_months == 12
+    assert set(growth) == {f"2026-{month:02d}" for month in range(1, 13)}
+    engine = ProjectionEngine(tax_engine=TaxEngine())
+    monthly_dy, monthly_pa = engine._monthly_return_components(growth["2026-01"])
+    assert monthly_pa == pytest.approx(returns["corp"][0][12, 4] - returns["corp"][1][12, 4])
+    sgov_dy, _ = engine._monthly_return_components(overrides["corp"]["SGOV Buffer"]["2026-03"])
+    assert sgov_dy == pytest.approx(0.003)
+
+
+def test_rolling_backtest_reports_each_start_and_details():
+    engine = ProjectionEngine(tax_engine=TaxEngine())
+    series = HistoricalSeries.from_frame(series_frame())
+
+    result = HistoricalBacktestEngine(engine).run(
+        INITIAL_ASSETS,
+        backtest_params(),
+        series,
+        HOLDINGS,
+        start_from="2006-01",
+        start_until="2008-12",
+        step_months=6,
+        detail_starts=["2008-05"],
+        max_workers=1,
+    )
+
+    starts = [row["start"] for row in result["starts"]]
+    assert starts == [
+        "2006-01",
+        "2006-07",
+        "2007-01",
+        "2007-07",
+        "2008-01",
+        "2008-05",
+        "2008-07",
+    ]
+    assert result["starts"][0]["historical_months"] == 36
+    assert result["starts"][-1]["historical_months"] == 18
+    assert result["aggregate"]["runs"] == 7
+    assert result["aggregate"]["worst_start"] in starts
+    detail = result["details"]["2008-05"]
+    assert [row["period"] for row in detail["yearly_data"]] == ["2026", "2027", "2028"]
+    replay = engine.run_30yr_simulation(INITIAL_ASSETS, _replay(series, 28))
+    assert detail["summary"] == replay["summary"]
+    with pytest.raises(ValueError):
+        HistoricalBacktestEngine(engine).run(
+            INITIAL_ASSETS, backtest_params(), series, HOLDINGS, start_from="1990-01"
+        )
+
+
+def _replay(series: HistoricalSeries, start_index: int) -> dict:
+    params = backtest_params()
+    returns, _ = series.category_returns(HOLDINGS)
+    calendar = [(2026 + offset // 12, offset % 12 + 1) for offset in range(36)]
+    params["monthly_return_overrides"], _ = build_return_overrides(returns, start_index, calendar)
+    return params
+
+
+def test_backtest_api_runs_with_master_portfolio_holdings(tmp_path, monkeypatch):
+    backend = DividendBackend(data_dir=str(tmp_path), ensure_default_master_bundle=True)
+    monkeypatch.setattr(main_module, "backend", backend)
+    local_client = TestClient(main_module.app)
+    symbols = {
+        item["symbol"]
+        for items in backend.get_master_portfolio_holdings().values()
+        for item in items
+    }
+    records = [
+        {
+            "symbol": symbol,
+            "month": f"{2020 + index // 12}-{index % 12 + 1:02d}",
+            "total_return": 0.005,
+        }
+        for symbol in symbols
+        for index in range(36)
+    ]
+    history_dir = tmp_path / "history"
+    history_dir.mkdir()
+    monkeypatch.setattr(main_module, "HISTORY_DIR", str(history_dir))
+    pd.DataFrame(records).to_csv(history_dir / "history.csv", index=False)
+
+    response = local_client.post(
+        "/api/retirement/backtest",
+        json={"series": "history.csv", "start_from": "2021-12", "step_months": 12},
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["success"] is True
+    assert [row["start"] for row in payload["data"]["starts"]] == ["2021-12", "2022-12"]
+    assert "master_name" in payload["data"]["meta"]
+    # 시작 월별 실행은 공유 프로세스 풀에서, 핸들러는 스레드풀에서 돈다.
+    assert not inspect.iscoroutinefunction(main_module.run_retirement_backtest)
+
+    (tmp_path / "secret.csv").write_text("ticker,date,total_return\nX,top-secret,0\n")
+    for name in ("missing.csv", "../secret.csv", str(tmp_path / "secret.csv")):
+        rejected = local_client.post("/api/retirement/backtest", json={"series": name}).json()
+        assert rejected == {"success": False, "message": main_module.HISTORY_SERIES_ERROR}
+    (history_dir / "broken.csv").write_text("ticker,date,total_return\nX,top-secret,0\n")
+    broken = local_client.post("/api/retirement/backtest", json={"series": "broken"}).json()
+    assert broken["success"] is False
+    assert "top-secret" not in broken["message"]
@@ -0,0 +1,81 @@
+from benchmarks.fixtures import projection_cases
+from benchmarks.run_benchmarks import build_benchmarks, compare_results, run_benchmarks
+from src.core.projection_engine import ProjectionEngine
+from src.core.tax_engine import TaxEngine
+
+
+def _result(**best_seconds: float) -> dict:
+    return {
+        "benchmarks": {
+            name.replace("_", "."): {"best_seconds": seconds, "median_seconds": seconds}
+            for name, seconds in best_seconds.items()
+        }
+    }
+
+
+def test_benchmark_suite_covers_projection_cost_comparison_and_tax_paths():
+    names = set(build_benchmarks())
+
+    assert {
+        "projection.corp_only",
+        "projection.couple_personal",
+        "projection.all_accounts",
+        "projection.stress_bear",
+        "projection.stress_stagflation",
+        "projection.stress_dividend_cut",
+        "cost_comparison.target",
+        "cost_comparison.asset",
+        "tax.local_health_insurance",
+        "tax.monthly_health_insurance",
+        "tax.progressive_income_tax",
+    } <= names
+
+
+def test_stress_fixtures_run_different_scenarios_than_baseline():
+    """스트레스 벤치마크가 기준선과 같은 경로를 재는 일이 없도록 충격이 결과에 반영되어야 한다."""
+    cases = projection_cases()
+    engine = ProjectionEngine(tax_engine=TaxEngine())
+    baseline_assets, baseline_params = cases["projection.all_accounts"]
+    baseline = engine.run_30yr_simulation(baseline_assets, baseline_params)["summary"]
+
+    for name in ("projection.stress_bear", "projection.stress_dividend_cut"):
+        assets, params = cases[name]
+        summary = engine.run_30yr_simulation(assets, params)["summary"]
+        assert summary["ending_total_net_worth"] < baseline["ending_total_net_worth"], name
+
+
+def test_health_insurance_benchmarks_time_the_premium_formula_on_every_repeat(monkeypatch):
+    """반복 측정이 캐시 조회만 재지 않도록 매 반복 보험료 공식(재산 등급 조회 포함)을 실행한다."""
+    calls = []
+    grade = TaxEngine.get_property_grade
+
+    def counting_grade(self, property_val):
+        calls.append(property_val)
+        return grade(self, property_val)
+
+    monkeypatch.setattr(TaxEngine, "get_property_grade", counting_grade)
+    run = build_benchmarks()["tax.monthly_health_insurance"]()
+    run()
+    first = len(calls)
+    run()
+
+    assert first > 0
+    assert len(calls) == 2 * first
+
+
+def test_compare_results_flags_only_regressions_beyond_threshold():
+    baseline = _result(projection_a=0.010, projection_b=0.010, tax_c=0.001)
+    current = _result(projection_a=0.0124, projection_b=0.0126, tax_c=0.0005, tax_d=0.002)
+
+    regressions = compare_results(baseline, current, threshold=0.25)
+
+    assert [regression["name"] for regression in regressions] == ["projection.b"]
+    assert regressions[0]["ratio"] > 1.25
+
+
+def test_run_benchmarks_measures_selected_fixtures():
+    results = run_benchmarks(["tax.us_capital_gains_tax", "projection.corp_only"], repeat=1)
+
+    assert set(results["benchmarks"]) == {"tax.us_capital_gains_tax", "projection.corp_only"}
+    assert results["benchmarks"]["projection.corp_only"]["best_seconds"] > 0
+    assert results["meta"]["python"]
@@ -863,6 +863,49 @@ def test_cost_comparison_applies_external_financial_income_to_comparison_tax(tmp
     assert result["total_tax"] == pytest.approx(2068000.0)
 
 
+def test_cost_comparison_required_asset_solvers_match_reference_bisection(tmp_path):
+    backend = DividendBackend(data_dir=str(tmp_path), ensure_default_master_bundle=True)
+    tax_engine = TaxEngine(
+        {**backend.retirement_config["tax_and_insurance"], "corp_tax_nominal_rate": 0}
+    )
+    assumptions = {
+        "dy": 0.04,
+        "pa": 0.03,
+        "personal_external_financial_income": 12000000.0,
+        "personal_other_comprehensive_tax_base": 30000000.0,
+    }
+
+    def personal_net_cash(asset_value):
+        return backend._calculate_personal_investment_year(
+            tax_engine, asset_value, asset_value, 500000000.0, assumptions
+        )["net_cash"]
+
+    def post_tax_profit(tax_base):
+        return tax_base - tax_engine.calculate_corp_tax(tax_base)
+
+    def reference(func, target):
+        low, high = 0.0, 1.0e12
+        for _ in range(120):
+            mid = (low + high) / 2
+            low, high = (low, mid) if func(mid) >= target else (mid, high)
+        return high
+
+    personal = backend._solve_personal_required_assets(
+        tax_engine, 120000000.0, 500000000.0, assumptions
+    )
+    tax_base = backend._solve_corporate_required_tax_base(tax_engine, 250000000.0)
+
+    assert personal["required_assets"] == pytest.approx(
+        reference(personal_net_cash, 120000000.0), rel=1e-12
+    )
+    assert personal["result"]["net_cash"] >= 120000000.0
+    assert tax_base == pytest.approx(reference(post_tax_profit, 250000000.0), rel=1e-12)
+    unreachable = backend._solve_personal_required_assets(
+        tax_engine, 120000000.0, 500000000.0, {**assumptions, "dy": 0.0}
+    )
+    assert unreachable["required_assets"] == float("inf")
+
+
 def test_cost_comparison_pa_only_without_sale_is_not_taxable(tmp_path):
     backend = DividendBackend(data_dir=str(tmp_path), ensure_default_master_bundle=True)
     tax_engine = TaxEngine(backend.retirement_config["tax_and_insurance"])
@@ -0,0 +1,55 @@
+import math
+
+import pytest
+
+from src.core.inverse_solver import brent_threshold, linear_breakpoints, solve_monotone_inverse
+from src.core.tax_engine import TaxEngine
+
+
+def _bisect(func, target, high, iterations=200):
+    low = 0.0
+    for _ in range(iterations):
+        mid = (low + high) / 2
+        if func(mid) >= target:
+            high = mid
+        else:
+            low = mid
+    return high
+
+
+@pytest.mark.parametrize("target", [1.0e6, 1.78e8, 5.0e8, 3.0e9])
+def test_piecewise_linear_corp_tax_is_inverted_in_a_few_evaluations(target):
+    engine = TaxEngine({"corp_tax_nominal_rate": 0.0})
+
+    def post_tax_profit(tax_base):
+        return tax_base - engine.calculate_corp_tax(tax_base)
+
+    solution = solve_monotone_inverse(post_tax_profit, target, [engine.corp_tax_threshold])
+
+    assert solution.method == "linear"
+    assert solution.evaluations <= 6
+    assert post_tax_profit(solution.value) >= target
+    assert solution.value == pytest.approx(_bisect(post_tax_profit, target, 1.0e10), rel=1e-14)
+
+
+def test_step_function_falls_back_to_brent_and_finds_the_step():
+    """10원 절사처럼 계단이 있는 함수는 Brent로 계단 위치까지 좁힌다."""
+
+    def stepped(x):
+        return math.floor(x / 1669.0) * 1669.0 * 0.9 + x * 0.05
+
+    solution = solve_monotone_inverse(stepped, 123456789.0)
+
+    assert solution.method == "brent"
+    assert solution.evaluations < 60
+    assert stepped(solution.value) >= 123456789.0
+    assert solution.value == pytest.approx(_bisect(stepped, 123456789.0, 1.0e9), rel=1e-14)
+
+
+def test_unreachable_target_and_brent_bracket_errors():
+    assert solve_monotone_inverse(lambda x: -5.0, 1.0).value == math.inf
+    assert solve_monotone_inverse(lambda x: x, -1.0).method == "lower_bound"
+    assert linear_breakpoints([0.0, 20.0, 80.0], 0.04) == [500.0, 2000.0]
+    assert linear_breakpoints([20.0], 0.0) == []
+    with pytest.raises(ValueError):
+        brent_threshold(lambda x: x, 10.0, 0.0, 5.0)
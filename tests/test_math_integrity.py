@@ -1,8 +1,10 @@
+from collections import Counter
 from copy import deepcopy
 
 import pytest
 
 import src.backend.main as main_module
+from src.core.account_state import AccountState, CategoryArray
 from src.core.projection_engine import ProjectionEngine
 from src.core.tax_engine import TaxEngine
 
@@ -179,6 +181,67 @@ def test_distribution_run_rate_is_cut_after_crash20_when_configured():
     assert result["monthly_data"][1]["corp_realized_income"] == pytest.approx(300000)
 
 
+def test_distribution_growth_continues_from_cut_run_rate_after_crash20():
+    """실행 단위 분배 규칙 캐시를 써도 Crash20 삭감 뒤 성장률은 삭감된 run-rate에 이어 적용된다."""
+    params = base_params()
+    params["simulation_years"] = 1
+    params["category_return_rates"] = {
+        "corp": {"Growth Engine": {"dy": 0.06, "pa": -3.0, "tr": -2.94}},
+        "pension": {"Growth Engine": {"dy": 0.0, "pa": 0.0, "tr": 0.0}},
+    }
+    params["distribution_rules"] = {
+        "corp": {"Growth Engine": {"growth_rate": 0.12, "stress_cut_rate": 0.40}},
+    }
+    engine = make_engine()
+
+    result = engine._execute_loop(
+        {"corp": 100000000, "pension": 0},
+        params,
+        months=3,
+    )
+
+    monthly_growth = 1.12 ** (1.0 / 12.0)
+    incomes = [row["corp_realized_income"] for row in result["monthly_data"]]
+    assert incomes[0] == pytest.approx(500000)
+    assert incomes[1] == pytest.approx(500000 * monthly_growth * 0.6)
+    assert incomes[2] == pytest.approx(500000 * monthly_growth**2 * 0.6)
+    # 실행 밖에서는 캐시 없이 매번 규칙을 해석한다.
+    assert engine._distribution_rule_cache(params) is None
+
+
+def test_stress_cut_does_not_re_resolve_distribution_rules_within_a_run(monkeypatch):
+    """규칙은 실행 중 바뀌지 않으므로 Crash20 삭감이 반복돼도 계좌·카테고리별로 한 번만 해석한다."""
+    params = base_params()
+    params["category_return_rates"] = {
+        "corp": {"Growth Engine": {"dy": 0.06, "pa": -3.0, "tr": -2.94}},
+        "pension": {"Growth Engine": {"dy": 0.0, "pa": 0.0, "tr": 0.0}},
+    }
+    params["distribution_rules"] = {
+        "corp": {"Growth Engine": {"growth_rate": 0.12, "stress_cut_rate": 0.40}},
+    }
+    engine = make_engine()
+    resolved = Counter()
+    distribution_rule = engine._distribution_rule
+
+    def counting_rule(rule_params, account_key, category):
+        resolved[(account_key, category)] += 1
+        return distribution_rule(rule_params, account_key, category)
+
+    apply_cut = engine._apply_distribution_stress_cut
+
+    def counting_cut(run_rates, cut_params, account_key):
+        resolved["cuts", account_key] += 1
+        apply_cut(run_rates, cut_params, account_key)
+
+    monkeypatch.setattr(engine, "_distribution_rule", counting_rule)
+    monkeypatch.setattr(engine, "_apply_distribution_stress_cut", counting_cut)
+    engine._execute_loop({"corp": 100000000, "pension": 0}, params, months=12)
+
+    assert resolved["cuts", "corp"] > 1
+    # 성장률 1번 + 삭감률 1번
+    assert resolved[("corp", "Growth Engine")] == 2
+
+
 def test_distribution_run_rate_scales_down_after_partial_transfer():
     """비현금 카테고리 일부 매도 후 다음 달 분배금은 남은 포지션 비율만큼 감소해야 한다."""
     engine = make_engine()
@@ -221,6 +284,134 @@ def test_distribution_run_rate_scales_down_after_partial_transfer():
     assert realized_income == pytest.approx(100000)
 
 
+def test_category_array_keeps_dict_view_for_existing_callers():
+    """배열 기반 계좌 상태도 카테고리 키 조회·대입·순회·dict 비교가 그대로 동작해야 한다."""
+    state = AccountState(
+        "corp",
+        {"SGOV Buffer": 10.0, "Growth Engine": 90.0},
+        run_rates={"Growth Engine": 3.0},
+    )
+
+    state.balances["Bond Buffer"] += 5.0
+    assert list(state.balances) == list(ProjectionEngine.CATEGORY_ORDER)
+    assert state.balances.data == [10.0, 5.0, 0.0, 0.0, 90.0]
+    assert state.balances == {
+        "SGOV Buffer": 10.0,
+        "Bond Buffer": 5.0,
+        "High Income": 0.0,
+        "Dividend Growth": 0.0,
+        "Growth Engine": 90.0,
+    }
+    assert state.cost_basis["Growth Engine"] == 90.0
+    assert state.run_rates.get("Growth Engine") == 3.0
+    assert state.run_rates.get("Unknown", 1.5) == 1.5
+    assert isinstance(deepcopy(state.balances), CategoryArray)
+    with pytest.raises(TypeError):
+        del state.balances["SGOV Buffer"]
+
+
+def test_array_account_state_matches_dict_state_through_transfer_and_returns():
+    """배열 상태 fast path는 dict 상태와 매도·분배금·수익 반영 결과가 정확히 같아야 한다."""
+    engine = make_engine()
+    params = base_params()
+    params["category_return_rates"] = {
+        "corp": {"Growth Engine": {"dy": 0.06, "pa": 0.07, "tr": 0.13}},
+    }
+    assets = {
+        "SGOV Buffer": 3000000.0,
+        "Bond Buffer": 0.0,
+        "High Income": 0.0,
+        "Dividend Growth": 0.0,
+        "Growth Engine": 100000000.0,
+    }
+    run_rates = {category: 0.0 for category in ProjectionEngine.CATEGORY_ORDER}
+    run_rates["Growth Engine"] = 6000000.0
+    state = AccountState("corp", assets, run_rates=run_rates)
+    results = []
+    for account_assets, account_run_rates, cost_basis in (
+        (assets, run_rates, dict(assets)),
+        (state.balances, state.run_rates, state.cost_basis),
+    ):
+        assert engine._can_fill_target(
+            account_assets, "SGOV Buffer", 40000000.0, (("Growth Engine", 0.0),)
+        )
+        engine._transfer(
+            account_assets,
+            "Growth Engine",
+            "SGOV Buffer",
+            37000000.0,
+            distribution_run_rates=account_run_rates,
+            account_key="corp",
+            account_stats=params["portfolio_stats"]["corp"],
+            params=params,
+            sim_year=2026,
+            sim_month=5,
+            cost_basis=cost_basis,
+            trade_events=[],
+        )
+        income = engine._apply_monthly_returns(
+            "corp",
+            account_assets,
+            account_run_rates,
+            params["portfolio_stats"]["corp"],
+            params,
+            2026,
+            6,
+        )
+        results.append(
+            (
+                dict(account_assets),
+                dict(account_run_rates),
+                dict(cost_basis),
+                income,
+                engine._equity_value(account_assets),
+            )
+        )
+
+    assert results[0] == results[1]
+    assert not engine._can_fill_target(
+        state.balances, "SGOV Buffer", 500000000.0, (("Growth Engine", 0.0),)
+    )
+
+
+def test_compiled_rate_table_matches_per_month_rate_spec():
+    """컴파일된 월 수익률 테이블은 월별 override·유일 슬리브 fallback까지 기존 계산과 같다."""
+    engine = make_engine()
+    params = base_params()
+    params["appreciation_rates"] = {"growth_stocks": 0.03, "dividend_stocks": 0.02}
+    params["portfolio_stats"]["corp"].update({"dividend_yield": 0.02, "expected_return": 0.09})
+    params["monthly_return_overrides"] = {
+        "corp": {"Growth Engine": {"2026-03": {"dy": 0.12, "pa": -0.4}}},
+    }
+    stats = params["portfolio_stats"]["corp"]
+    table = engine._compile_rate_table(params, {"corp": stats}, 2026, 1, 24)
+    sole_assets = {
+        "SGOV Buffer": 50000000.0,
+        "Bond Buffer": 0.0,
+        "High Income": 0.0,
+        "Dividend Growth": 0.0,
+        "Growth Engine": 100000000.0,
+    }
+    mixed_assets = dict(sole_assets, **{"Dividend Growth": 30000000.0})
+
+    for account_assets in (sole_assets, mixed_assets):
+        for sim_month in (2, 3, 4):
+            expected_assets = dict(account_assets)
+            expected = engine._apply_monthly_returns(
+                "corp", expected_assets, {}, stats, params, 2026, sim_month
+            )
+            compiled_assets = AccountState("corp", account_assets).balances
+            compiled = engine._apply_monthly_returns(
+                "corp", compiled_assets, {}, stats, params, 2026, sim_month, rate_table=table
+            )
+            assert compiled == expected
+            assert compiled_assets == expected_assets
+
+    assert engine._compile_rate_table(params, {"corp": stats}, 2026, 1, 24) is table
+    params["monthly_return_overrides"]["corp"]["Growth Engine"]["2026-04"] = {"dy": 0.0, "pa": 0.0}
+    assert engine._compile_rate_table(params, {"corp": stats}, 2026, 1, 24) is not table
+
+
 def test_distribution_run_rate_is_created_after_new_risk_deployment():
     """현금성 자산에서 비현금 카테고리를 새로 매수하면 target DY 기반 run-rate가 생겨야 한다."""
     engine = make_engine()
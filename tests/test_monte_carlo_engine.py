@@ -0,0 +1,520 @@
+import inspect
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import src.backend.main as main_module
+from src.backend.api import DividendBackend
+from src.backend.main import app
+from src.core.historical_series import HistoricalSeries, build_return_overrides
+from src.core.mc_sampler import block_rows, bootstrap_history, bootstrap_returns
+from src.core.mc_state import DIVIDEND, GROWTH
+from src.core.monte_carlo_engine import MonteCarloEngine
+from src.core.projection_engine import ProjectionEngine
+from src.core.tax_engine import TaxEngine
+
+client = TestClient(app)
+
+CATEGORY_RATES = {
+    "SGOV Buffer": {"dy": 0.045, "pa": 0.0, "tr": 0.045},
+    "Bond Buffer": {"dy": 0.04, "pa": 0.0, "tr": 0.04},
+    "High Income": {"dy": 0.09, "pa": -0.01, "tr": 0.08},
+    "Dividend Growth": {"dy": 0.035, "pa": 0.05, "tr": 0.085},
+    "Growth Engine": {"dy": 0.006, "pa": 0.09, "tr": 0.096},
+}
+STRATEGY_WEIGHTS = {
+    "SGOV Buffer": 0.15,
+    "Bond Buffer": 0.10,
+    "High Income": 0.15,
+    "Dividend Growth": 0.35,
+    "Growth Engine": 0.25,
+}
+INITIAL_ASSETS = {"corp": 1500000000, "pension": 500000000, "personal": 0}
+HOLDINGS = {
+    "corp": [
+        {"symbol": "SGOV", "category": "SGOV Buffer", "weight": 20},
+        {"symbol": "VOO", "category": "Growth Engine", "weight": 80},
+    ],
+    "pension": [
+        {"symbol": "SGOV", "category": "SGOV Buffer", "weight": 30},
+        {"symbol": "SCHD", "category": "Dividend Growth", "weight": 70},
+    ],
+}
+
+
+def make_engine() -> ProjectionEngine:
+    # 법인세 0%: 무작위 경로 테스트를 세금 없이 운용 규칙만으로 빠르게 돌린다.
+    return ProjectionEngine(
+        tax_engine=TaxEngine(
+            config={
+                "corp_tax_nominal_rate": 0.0,
+                "corp_tax_low_rate": 0.0,
+                "corp_tax_high_rate": 0.0,
+            }
+        )
+    )
+
+
+def mc_params(**overrides) -> dict:
+    stats = {
+        "dividend_yield": 0.04,
+        "expected_return": 0.08,
+        "strategy_weights": dict(STRATEGY_WEIGHTS),
+        "category_return_rates": deepcopy(CATEGORY_RATES),
+    }
+    params = {
+        "simulation_years": 10,
+        "simulation_start_year": 2026,
+        "simulation_start_month": 1,
+        "birth_year": 1972,
+        "birth_month": 8,
+        "private_pension_start_age": 55,
+        "national_pension_start_age": 65,
+        "household_monthly_need": 9000000,
+        "target_monthly_cashflow": 9000000,
+        "inflation_rate": 0.025,
+        "corp_salary": 2000000,
+        "monthly_bookkeeping_fee": 300000,
+        "employee_count": 1,
+        "initial_shareholder_loan": 300000000,
+        "national_pension_amount": 1500000,
+        "pension_withdrawal_target": 2000000,
+        "personal_enabled": False,
+        "planned_cashflows": [
+            {"year": 2028, "month": 6, "amount": 50000000, "type": "OUTFLOW", "entity": "CORP"}
+        ],
+        "portfolio_stats": {"corp": deepcopy(stats), "pension": deepcopy(stats)},
+        "category_return_rates": {
+            "corp": deepcopy(CATEGORY_RATES),
+            "pension": deepcopy(CATEGORY_RATES),
+        },
+        "distribution_rules": {"corp": {"Dividend Growth": {"growth_rate": 0.05}}},
+    }
+    params.update(overrides)
+    return params
+
+
+def personal_mc_params(**overrides) -> dict:
+    """개인 계좌(배당 종합과세·양도세·건강보험료)까지 켠 파라미터."""
+    params = mc_params(
+        personal_enabled=True,
+        personal_initial_cost_basis=500000000,
+        personal_property_assessed_value=600000000,
+        annual_corp_tax_adjustment_fee=1500000,
+        **overrides,
+    )
+    params["portfolio_stats"]["personal"] = deepcopy(params["portfolio_stats"]["corp"])
+    params["category_return_rates"]["personal"] = deepcopy(CATEGORY_RATES)
+    return params
+
+
+def zero_volatility() -> dict:
+    return {category: 0.0 for category in ProjectionEngine.CATEGORY_ORDER}
+
+
+# (엔진, 파라미터, 초기 자산): 세금 없는 운용 규칙 비교와 기본 세법(법인세·개인 세금·건강보험료)
+PARITY_CASES = {
+    "no_tax": (make_engine, mc_params, INITIAL_ASSETS),
+    "default_tax": (
+        lambda: ProjectionEngine(tax_engine=TaxEngine()),
+        personal_mc_params,
+        {**INITIAL_ASSETS, "personal": 800000000},
+    ),
+}
+
+
+@pytest.mark.parametrize("case", PARITY_CASES)
+@pytest.mark.parametrize("need", [6000000, 9000000, 14000000])
+def test_zero_volatility_paths_match_deterministic_projection(case, need):
+    """변동성 0이면 모든 경로가 결정론 엔진의 월별 총자산·가계 지급액과 일치해야 한다."""
+    make, make_params, initial_assets = PARITY_CASES[case]
+    engine = make()
+    params = make_params(
+        category_volatility=zero_volatility(),
+        simulation_years=30,
+        household_monthly_need=need,
+        target_monthly_cashflow=need,
+    )
+    deterministic = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    result = MonteCarloEngine(engine).run(initial_assets, deepcopy(params), paths=3, seed=1)
+
+    bands = result["bands"]
+    for index, row in enumerate(deterministic["monthly_data"]):
+        assert bands["total_assets"]["p5"][index] == bands["total_assets"]["p95"][index]
+        assert abs(bands["total_assets"]["p50"][index] - row["total_net_worth"]) <= (
+            row["total_net_worth"] * 1e-9
+        )
+        paid = row["target_cashflow"] - row["household_shortfall"]
+        assert abs(bands["household_cash"]["p50"][index] - paid) < 1e-3
+    assert result["summary"]["survival_probability"] == 1.0
+    assert result["summary"]["full_funding_probability"] == (
+        1.0 if deterministic["summary"]["first_household_shortfall_date"] is None else 0.0
+    )
+    assert result["months"][0] == "2026-01"
+
+
+@pytest.mark.parametrize("case", PARITY_CASES)
+def test_zero_volatility_depletion_matches_deterministic_survival(case):
+    """자산 고갈 시나리오에서 생존 개월과 최초 미충족 여부가 결정론 엔진과 같아야 한다."""
+    make, make_params, _ = PARITY_CASES[case]
+    engine = make()
+    params = make_params(
+        category_volatility=zero_volatility(),
+        household_monthly_need=30000000,
+        target_monthly_cashflow=30000000,
+    )
+    initial_assets = {"corp": 500000000, "pension": 100000000}
+    deterministic = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    result = MonteCarloEngine(engine).run(initial_assets, deepcopy(params), paths=2, seed=3)
+
+    summary = result["summary"]
+    assert summary["survival_months_percentiles"]["p50"] == deterministic["survival_months"]
+    assert deterministic["survival_months"] < summary["months"]
+    assert summary["survival_probability"] == 0.0
+    assert summary["full_funding_probability"] == 0.0
+
+
+def test_zero_volatility_fallback_rates_follow_path_balances_across_reviews():
+    """
+    카테고리별 수익률이 없으면 단독 리스크 슬리브 PA·대체 분배수익률이 잔액 구성에 따라 바뀐다.
+    리뷰 이후 Bond Buffer만 남는 연금 계좌도 경로별로 같은 수익률을 골라야 한다.
+    """
+    engine = make_engine()
+    params = mc_params(
+        category_volatility=zero_volatility(), simulation_years=3, category_return_rates={}
+    )
+    for account in ("corp", "pension"):
+        del params["portfolio_stats"][account]["category_return_rates"]
+        del params["portfolio_stats"][account]["strategy_weights"]
+    initial_assets = {"corp": 300000000, "pension": 100000000}
+    deterministic = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    result = MonteCarloEngine(engine).run(initial_assets, deepcopy(params), paths=2, seed=1)
+
+    bands = result["bands"]
+    for index, row in enumerate(deterministic["monthly_data"]):
+        assert bands["total_assets"]["p50"][index] == pytest.approx(
+            row["total_net_worth"], rel=1e-9
+        )
+        paid = row["target_cashflow"] - row["household_shortfall"]
+        assert bands["household_cash"]["p50"][index] == pytest.approx(paid, abs=1e-3)
+
+
+def test_prepare_does_not_mutate_caller_params():
+    """계좌 통계가 빠진 params를 넘겨도 호출자의 portfolio_stats에 빈 계좌를 채우지 않아야 한다."""
+    params = mc_params()
+    expected = deepcopy(params)
+
+    MonteCarloEngine(make_engine()).prepare(INITIAL_ASSETS, params)
+
+    assert params == expected
+    assert "personal" not in params["portfolio_stats"]
+
+
+def test_random_paths_are_seeded_and_bands_are_ordered():
+    """같은 seed는 같은 결과를, 백분위 밴드는 P5 ≤ P50 ≤ P95 순서를 유지해야 한다."""
+    engine = MonteCarloEngine(make_engine())
+    first = engine.run(INITIAL_ASSETS, mc_params(), paths=300, seed=11, chunk_size=128)
+    second = engine.run(INITIAL_ASSETS, mc_params(), paths=300, seed=11, chunk_size=128)
+
+    assert first == second
+    assert first["summary"]["paths"] == 300
+    assert first["meta"]["seed"] == 11
+    assert 0.0 <= first["summary"]["survival_probability"] <= 1.0
+    total_bands = first["bands"]["total_assets"]
+    assert len(total_bands["p50"]) == 120
+    assert all(
+        low <= mid <= high
+        for low, mid, high in zip(total_bands["p5"], total_bands["p50"], total_bands["p95"])
+    )
+    assert total_bands["p5"][-1] < total_bands["p95"][-1]
+
+
+def test_path_streams_make_results_independent_of_chunks_and_workers():
+    """경로별 난수 스트림이므로 청크 크기·프로세스 수가 달라도 결과가 같아야 한다."""
+    engine = MonteCarloEngine(make_engine())
+    serial = engine.run(INITIAL_ASSETS, mc_params(), paths=40, seed=8, chunk_size=40)
+    parallel = engine.run(
+        INITIAL_ASSETS, mc_params(), paths=40, seed=8, chunk_size=12, max_workers=2
+    )
+
+    assert parallel == serial
+    assert serial["meta"]["rng"] == "SeedSequence.spawn/PCG64 per path"
+    unseeded = engine.run(INITIAL_ASSETS, mc_params(), paths=20)
+    replay = engine.run(INITIAL_ASSETS, mc_params(), paths=20, seed=unseeded["meta"]["seed"])
+    assert replay == unseeded
+
+
+def test_single_path_replay_matches_batch_paths():
+    """meta seed와 경로 번호만으로 배치의 경로 하나를 다시 계산할 수 있어야 한다."""
+    engine = MonteCarloEngine(make_engine())
+    batch = engine.run(INITIAL_ASSETS, mc_params(), paths=5, seed=31)
+
+    replays = [
+        engine.replay_path(INITIAL_ASSETS, mc_params(), seed=31, path=path) for path in range(5)
+    ]
+
+    for metric in ("total_assets", "sgov_months", "household_cash"):
+        values = np.array([replay[metric] for replay in replays])
+        for band, expected in batch["bands"][metric].items():
+            percentile = float(band[1:])
+            assert np.percentile(values, percentile, axis=0) == pytest.approx(expected, rel=1e-12)
+    assert replays[3]["path"] == 3
+    assert replays[3]["seed"] == 31
+    assert len(replays[3]["months"]) == 120
+    with pytest.raises(ValueError):
+        engine.replay_path(INITIAL_ASSETS, mc_params(), seed=31, path=-1)
+
+
+def test_streaming_aggregation_matches_exact_bands_within_sketch_accuracy():
+    """스트리밍 집계는 생존 요약이 같고 월별 밴드가 전 경로 백분위와 0.5% 이내로 일치해야 한다."""
+    engine = MonteCarloEngine(make_engine())
+    exact = engine.run(INITIAL_ASSETS, mc_params(), paths=400, seed=21, chunk_size=96)
+    streamed = engine.run(
+        INITIAL_ASSETS, mc_params(), paths=400, seed=21, chunk_size=96, streaming=True
+    )
+
+    assert streamed["meta"]["aggregation"] == "sketch"
+    assert exact["meta"]["aggregation"] == "exact"
+    assert streamed["summary"] == exact["summary"]
+    assert set(streamed["bands"]) == {"total_assets", "sgov_months", "household_cash"}
+    for metric, bands in exact["bands"].items():
+        for band, values in bands.items():
+            expected = np.array(values)
+            estimate = np.array(streamed["bands"][metric][band])
+            assert np.all(np.abs(estimate - expected) <= 0.005 * np.abs(expected) + 1e-6)
+
+
+def test_monte_carlo_api_returns_survival_summary_and_bands():
+    """몬테카를로 API는 생존확률 요약과 자산/가계현금 밴드를 반환해야 한다."""
+    response = client.get("/api/retirement/monte-carlo?paths=50&seed=7")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["success"] is True
+    data = payload["data"]
+    assert data["summary"]["paths"] == 50
+    assert set(data["bands"]) == {"total_assets", "sgov_months", "household_cash"}
+    assert data["meta"]["seed"] == 7
+    assert "master_name" in data["meta"]
+    # 경로 수만큼 CPU를 쓰므로 스레드풀에서 실행되는 일반 def 엔드포인트다.
+    assert not inspect.iscoroutinefunction(main_module.run_retirement_monte_carlo)
+
+
+def test_monte_carlo_path_api_replays_one_path_from_batch_seed():
+    batch = client.get("/api/retirement/monte-carlo?paths=3").json()["data"]
+
+    response = client.get(f"/api/retirement/monte-carlo/path?seed={batch['meta']['seed']}&path=2")
+
+    payload = response.json()
+    assert payload["success"] is True
+    assert payload["data"]["path"] == 2
+    assert len(payload["data"]["total_assets"]) == batch["summary"]["months"]
+    assert client.get("/api/retirement/monte-carlo/path?seed=1&path=-1").json()["success"] is False
+    assert not inspect.iscoroutinefunction(main_module.replay_retirement_monte_carlo_path)
+
+
+def test_monte_carlo_api_rejects_invalid_path_count():
+    response = client.get("/api/retirement/monte-carlo?paths=0")
+
+    assert response.status_code == 200
+    assert response.json()["success"] is False
+    limit = main_module.MONTE_CARLO_STREAMING_MAX_PATHS
+    assert limit == 50000
+    streamed = client.get(f"/api/retirement/monte-carlo?paths={limit + 1}&streaming=true")
+    assert streamed.json()["success"] is False
+
+
+def history_series(months: int, crash_months=()) -> HistoricalSeries:
+    records = []
+    for index in range(months):
+        date = f"{2000 + index // 12}-{index % 12 + 1:02d}"
+        crash = index in crash_months
+        records.extend(
+            [
+                {
+                    "ticker": "SGOV",
+                    "date": date,
+                    "total_return": 0.004,
+                    "distribution_yield": 0.004,
+                },
+                {"ticker": "VOO", "date": date, "total_return": -0.2 if crash else 0.008},
+                {
+                    "ticker": "SCHD",
+                    "date": date,
+                    "total_return": -0.15 if crash else 0.006,
+                    "distribution_yield": 0.003,
+                },
+            ]
+        )
+    return HistoricalSeries.from_frame(pd.DataFrame(records))
+
+
+def test_bootstrap_of_constant_history_matches_return_overrides():
+    """수익률이 일정한 과거 표본의 부트스트랩은 같은 값을 override로 넣은 실행과 같아야 한다."""
+    engine = make_engine()
+    series = history_series(120)
+    returns, _ = series.category_returns(HOLDINGS)
+    calendar = [(2026 + offset // 12, offset % 12 + 1) for offset in range(120)]
+    overrides, _ = build_return_overrides(returns, 0, calendar)
+    params = mc_params(category_volatility=zero_volatility())
+
+    bootstrap = MonteCarloEngine(engine).run_bootstrap(
+        INITIAL_ASSETS, deepcopy(params), series, HOLDINGS, paths=4, block_months=7, seed=5
+    )
+    replay = MonteCarloEngine(engine).run(
+        INITIAL_ASSETS, {**deepcopy(params), "monthly_return_overrides": overrides}, paths=1
+    )
+
+    assert bootstrap["meta"]["mode"] == "block_bootstrap"
+    assert bootstrap["meta"]["history_months"] == 120
+    expected = replay["bands"]["total_assets"]["p50"]
+    for band in ("p5", "p95"):
+        assert bootstrap["bands"]["total_assets"][band] == pytest.approx(expected, rel=1e-9)
+    assert bootstrap["summary"]["survival_probability"] == replay["summary"]["survival_probability"]
+
+
+def test_bootstrap_blocks_are_sampled_jointly_across_accounts_and_categories():
+    """블록은 모든 계좌·카테고리에 같은 과거 달을 쓰므로 동시 폭락이 경로 안에서 함께 나타난다."""
+    engine = MonteCarloEngine(make_engine())
+    series = history_series(36, crash_months={10, 11, 25})
+    setup = engine.prepare(INITIAL_ASSETS, mc_params())
+    returns, _ = series.category_returns(HOLDINGS)
+    history = bootstrap_history(series, returns)
+    starts = np.random.default_rng(1).integers(0, 36, (64, 20))
+
+    rows = block_rows(starts, 6, setup.months, 36)
+    growth, _ = bootstrap_returns(setup, history, rows)
+
+    assert rows.shape == (120, 64)
+    assert (rows[:6, 0] == (starts[0, 0] + np.arange(6)) % 36).all()
+    no_sole = np.zeros((64, 5), dtype=bool)
+    for t in range(setup.months):
+        corp_crash = growth(0, t, no_sole)[:, GROWTH] < 0.9
+        pension_crash = growth(1, t, no_sole)[:, DIVIDEND] < 0.9
+        assert (corp_crash == pension_crash).all()
+        assert corp_crash.any() == np.isin(rows[t], [10, 11, 25]).any()
+
+
+def test_bootstrap_reports_shortfall_dates_and_worst_decile_paths():
+    engine = MonteCarloEngine(make_engine())
+    series = history_series(60, crash_months=set(range(20, 32)))
+    params = mc_params(household_monthly_need=13000000, target_monthly_cashflow=13000000)
+
+    first = engine.run_bootstrap(
+        INITIAL_ASSETS, deepcopy(params), series, HOLDINGS, paths=200, seed=9, replay_worst=1
+    )
+    second = engine.run_bootstrap(
+        INITIAL_ASSETS, deepcopy(params), series, HOLDINGS, paths=200, seed=9, replay_worst=1
+    )
+
+    assert first == second
+    shortfall = first["first_shortfall"]
+    assert shortfall["probability"] == pytest.approx(
+        1.0 - first["summary"]["full_funding_probability"]
+    )
+    assert 0.0 < shortfall["probability"] < 1.0
+    assert sum(shortfall["by_year"].values()) == pytest.approx(shortfall["probability"])
+    assert shortfall["month_percentiles"]["p5"] <= shortfall["month_percentiles"]["p95"]
+    worst = first["worst_decile"]
+    assert worst["paths"] == 20
+    assert len(worst["total_assets"]["mean"]) == 120
+    endings = [sample["ending_total_assets"] for sample in worst["samples"]]
+    assert endings == sorted(endings)
+    assert endings[-1] <= worst["ending_total_assets_max"]
+    assert worst["ending_total_assets_max"] <= first["bands"]["total_assets"]["p25"][-1]
+    assert len(worst["samples"][0]["block_starts"]) == 10
+    assert "survival_months" in worst["samples"][0]["replay_summary"]
+    assert "replay_summary" not in worst["samples"][1]
+    with pytest.raises(ValueError):
+        engine.run_bootstrap(INITIAL_ASSETS, mc_params(), series, HOLDINGS, block_months=0)
+
+
+def test_streaming_bootstrap_keeps_shortfall_distribution_and_worst_samples():
+    engine = MonteCarloEngine(make_engine())
+    series = history_series(60, crash_months=set(range(20, 32)))
+    params = mc_params(household_monthly_need=13000000, target_monthly_cashflow=13000000)
+    options = {"paths": 150, "seed": 2, "chunk_size": 40}
+
+    exact = engine.run_bootstrap(INITIAL_ASSETS, deepcopy(params), series, HOLDINGS, **options)
+    streamed = engine.run_bootstrap(
+        INITIAL_ASSETS, deepcopy(params), series, HOLDINGS, streaming=True, **options
+    )
+
+    assert streamed["first_shortfall"] == exact["first_shortfall"]
+    assert streamed["worst_decile"]["samples"] == exact["worst_decile"]["samples"]
+    assert streamed["worst_decile"]["paths"] == exact["worst_decile"]["paths"]
+    assert "total_assets" not in streamed["worst_decile"]
+
+
+def test_bootstrap_worst_path_can_be_replayed_alone():
+    engine = MonteCarloEngine(make_engine())
+    series = history_series(60, crash_months=set(range(20, 32)))
+    result = engine.run_bootstrap(
+        INITIAL_ASSETS, mc_params(), series, HOLDINGS, paths=50, block_months=6, seed=17
+    )
+    worst = result["worst_decile"]["samples"][0]
+
+    replay = engine.replay_path(
+        INITIAL_ASSETS,
+        mc_params(),
+        seed=17,
+        path=worst["path"],
+        series=series,
+        holdings=HOLDINGS,
+        block_months=6,
+    )
+
+    assert replay["mode"] == "block_bootstrap"
+    assert replay["block_starts"] == worst["block_starts"]
+    assert replay["total_assets"][-1] == pytest.approx(worst["ending_total_assets"], rel=1e-12)
+    assert replay["survival_months"] == worst["survival_months"]
+
+
+def test_bootstrap_api_uses_master_portfolio_holdings(tmp_path, monkeypatch):
+    backend = DividendBackend(data_dir=str(tmp_path), ensure_default_master_bundle=True)
+    monkeypatch.setattr(main_module, "backend", backend)
+    local_client = TestClient(main_module.app)
+    symbols = {
+        item["symbol"]
+        for items in backend.get_master_portfolio_holdings().values()
+        for item in items
+    }
+    records = [
+        {
+            "symbol": symbol,
+            "month": f"{2020 + index // 12}-{index % 12 + 1:02d}",
+            "total_return": 0.005,
+        }
+        for symbol in symbols
+        for index in range(24)
+    ]
+    history_dir = tmp_path / "history"
+    history_dir.mkdir()
+    monkeypatch.setattr(main_module, "HISTORY_DIR", str(history_dir))
+    pd.DataFrame(records).to_csv(history_dir / "history.csv", index=False)
+
+    response = local_client.post(
+        "/api/retirement/monte-carlo/bootstrap",
+        json={"series": "history", "paths": 30, "seed": 4, "block_months": 6},
+    )
+
+    payload = response.json()
+    assert payload["success"] is True
+    assert payload["data"]["summary"]["paths"] == 30
+    assert payload["data"]["meta"]["block_months"] == 6
+    assert "master_name" in payload["data"]["meta"]
+    assert payload["data"]["worst_decile"]["paths"] == 3
+    assert not inspect.iscoroutinefunction(main_module.run_retirement_bootstrap)
+
+    invalid = local_client.post(
+        "/api/retirement/monte-carlo/bootstrap", json={"series": "history.csv", "paths": 0}
+    )
+    assert invalid.json()["success"] is False
+    for name in ("../history/history.csv", str(history_dir / "history.csv")):
+        rejected = local_client.post(
+            "/api/retirement/monte-carlo/bootstrap", json={"series": name, "paths": 10}
+        ).json()
+        assert rejected == {"success": False, "message": main_module.HISTORY_SERIES_ERROR}
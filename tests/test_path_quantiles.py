@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from src.core.path_quantiles import PathQuantileAggregator, QuantileSketch, histogram_percentiles
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def sample_values(seed: int, paths: int, months: int = 24) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    values = np.exp(rng.normal(20.0, 1.5, (paths, months)))
+    values[rng.random((paths, months)) < 0.05] = 0.0
+    return values
+
+
+def test_sketch_quantiles_stay_within_relative_accuracy():
+    values = sample_values(1, 5000)
+    sketch = QuantileSketch(24, min_value=1.0e4, max_value=1.0e14, relative_accuracy=0.005)
+
+    sketch.add(values)
+
+    exact = np.percentile(values, PERCENTILES, axis=0)
+    estimate = sketch.quantiles(PERCENTILES)
+    assert estimate.shape == (5, 24)
+    assert np.all(np.abs(estimate - exact) <= 0.005 * exact + 1e-9)
+    constant = QuantileSketch(3, min_value=1.0, max_value=1.0e6)
+    constant.add(np.full((10, 3), 1234.5))
+    assert (constant.quantiles([5, 95]) == 1234.5).all()
+
+
+def test_merged_sketches_equal_single_sketch_and_memory_is_path_independent():
+    """워커별 스케치를 병합한 결과는 전체 표본을 한 번에 넣은 결과와 같아야 한다."""
+    values = sample_values(2, 3000)
+    single = QuantileSketch(24, min_value=1.0e4, max_value=1.0e14)
+    single.add(values)
+    merged = QuantileSketch(24, min_value=1.0e4, max_value=1.0e14)
+    for part in np.array_split(values, 4):
+        partial = QuantileSketch(24, min_value=1.0e4, max_value=1.0e14)
+        partial.add(part)
+        merged.merge(partial)
+
+    assert merged.count == 3000
+    assert (merged.counts == single.counts).all()
+    assert (merged.quantiles(PERCENTILES) == single.quantiles(PERCENTILES)).all()
+    small = PathQuantileAggregator(24)
+    large = PathQuantileAggregator(24)
+    for aggregator, paths in ((small, 10), (large, 5000)):
+        aggregator.add(
+            {
+                "total_assets": sample_values(3, paths),
+                "sgov_months": np.full((paths, 24), 12.0),
+                "household_cash": np.full((paths, 24), 9.0e6),
+                "survival_months": np.full(paths, 24),
+                "first_shortfall_index": np.full(paths, -1),
+            }
+        )
+    assert small.memory_bytes() == large.memory_bytes()
+    with pytest.raises(ValueError):
+        merged.merge(QuantileSketch(24, min_value=1.0, max_value=1.0e14))
+
+
+def test_histogram_percentiles_match_numpy_on_integer_samples():
+    samples = np.random.default_rng(4).integers(0, 120, 999)
+    counts = np.bincount(samples, minlength=121)
+
+    assert histogram_percentiles(counts, PERCENTILES) == pytest.approx(
+        np.percentile(samples, PERCENTILES)
+    )
+    assert (
+        histogram_percentiles(counts, PERCENTILES, method="lower")
+        == np.percentile(samples, PERCENTILES, method="lower")
+    ).all()
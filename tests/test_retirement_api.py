@@ -1,3 +1,5 @@
+import inspect
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -362,6 +364,52 @@ def test_run_retirement_simulation_with_events():
     assert found_event is True, f"{event_year}년 {6}월 이벤트를 찾을 수 없습니다."
 
 
+def test_run_retirement_simulation_returns_yearly_columnar_output():
+    response = client.get(
+        "/api/retirement/simulate?output_resolution=yearly&output_format=columnar"
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    columns = data["data"]["monthly_data"]
+    assert data["data"]["output_resolution"] == "yearly"
+    assert len(columns["period"]) == len(columns["total_net_worth"])
+    assert columns["period_months"][0] >= 1
+    assert columns["period"] == sorted(set(columns["period"]))
+
+
+def test_run_retirement_simulation_debug_flag_returns_stage_profile():
+    response = client.get("/api/retirement/simulate?debug=true")
+
+    data = response.json()["data"]
+    stages = data["profile"]["stages"]
+    assert {"returns", "planned_cashflows", "may_review", "post_loop_audit"} <= set(stages)
+    assert stages["post_loop_audit"]["calls"] == 1
+    assert client.get("/api/retirement/simulate").json()["data"]["profile"] is None
+
+
+def test_run_retirement_simulation_does_not_replace_shared_engine_tax_engine():
+    shared_tax_engine = main_module.projection_engine.tax_engine
+
+    response = client.get("/api/retirement/simulate")
+
+    assert response.json()["success"] is True
+    assert main_module.projection_engine.tax_engine is shared_tax_engine
+
+
+def test_run_retirement_simulation_runs_in_threadpool():
+    """30년 루프는 이벤트 루프를 막지 않도록 일반 def 엔드포인트(스레드풀 실행)여야 한다."""
+    assert not inspect.iscoroutinefunction(main_module.run_retirement_simulation)
+
+
+def test_run_retirement_simulation_rejects_unknown_output_resolution():
+    response = client.get("/api/retirement/simulate?output_resolution=weekly")
+
+    assert response.status_code == 200
+    assert response.json()["success"] is False
+
+
 def test_run_retirement_simulation_uses_strategy_rule_rebalance_month():
     """현재 월 결과에는 설정된 전략 규칙과 기본 현금흐름이 함께 반영되어야 한다."""
     live_backend = main_module.backend
@@ -1,7 +1,12 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
 import pytest
 
 from src.core.projection_engine import ProjectionEngine
 from src.core.tax_engine import TaxEngine
+from src.core.trade_log import TradeLog
 
 
 def make_engine() -> ProjectionEngine:
@@ -1618,6 +1623,78 @@ def test_personal_dividend_domestic_tax_is_paid_in_following_may():
     assert "funding_sales" in annual_audit
 
 
+def test_personal_annual_tax_audit_buckets_match_full_rescan():
+    params = base_params()
+    params.update(
+        {
+            "simulation_years": 10,
+            "simulation_start_month": 1,
+            "inflation_rate": 0.025,
+            "corp_enabled": False,
+            "personal_enabled": True,
+            "personal_withdrawal_target": 10000000.0,
+            "target_monthly_cashflow": 10000000.0,
+            "household_monthly_need": 10000000.0,
+            "personal_property_assessed_value": 600000000.0,
+            "personal_external_financial_income": 30000000,
+        }
+    )
+    rates = {
+        "SGOV Buffer": {"dy": 0.04, "pa": 0.0, "tr": 0.04},
+        "High Income": {"dy": 0.12, "pa": 0.02, "tr": 0.14},
+        "Dividend Growth": {"dy": 0.03, "pa": 0.08, "tr": 0.11},
+        "Growth Engine": {"dy": 0.0, "pa": 0.12, "tr": 0.12},
+    }
+    params["portfolio_stats"]["personal"] = {
+        "strategy_weights": {
+            "SGOV Buffer": 0.01,
+            "High Income": 0.5,
+            "Dividend Growth": 0.2,
+            "Growth Engine": 0.29,
+        },
+        "category_return_rates": rates,
+    }
+    params.setdefault("category_return_rates", {})["personal"] = rates
+
+    result = make_engine().run_30yr_simulation(
+        {"corp": 0.0, "pension": 100000000.0, "personal": 600000000.0}, params
+    )
+
+    rows = result["monthly_data"]
+    events = [event for event in result["trade_events"] if event["account"] == "personal"]
+    audits = result["personal_annual_tax_audit"]
+    assert any(
+        event.get("cash_obligation") == "annual_tax"
+        for audit in audits
+        for event in audit["funding_sales"]
+    )
+    for audit in audits:
+        tax_year = audit["tax_year"]
+        year_rows = [row for row in rows if row["year"] == tax_year]
+        annual_sales = [event for event in events if event["year"] == tax_year]
+        funding_sales = [
+            event
+            for event in events
+            if event.get("cash_obligation")
+            and (
+                (event["cash_obligation"] != "annual_tax" and event["year"] == tax_year)
+                or (
+                    event["cash_obligation"] == "annual_tax"
+                    and event["year"] == (audit["payment_year"] or 0)
+                    and event["month"] == (audit["payment_month"] or 0)
+                )
+            )
+        ]
+        assert audit["funding_sales"] == funding_sales
+        assert audit["sale_proceeds"] == sum(event["sale_proceeds"] for event in annual_sales)
+        assert audit["health_insurance_total"] == sum(
+            row["personal_health_insurance"] for row in year_rows
+        )
+        assert audit["ending_cost_basis"] == (
+            year_rows[-1]["personal_cost_basis"] if year_rows else 0.0
+        )
+
+
 def test_personal_health_income_is_reflected_after_configured_lag():
     params = base_params()
     params.update(
@@ -1653,6 +1730,49 @@ def test_personal_health_income_is_reflected_after_configured_lag():
     assert november["personal_health_insurance"] > october["personal_health_insurance"]
 
 
+@pytest.mark.parametrize(("split_mode", "expected_calls"), [("single", 4), ("couple", 2)])
+def test_personal_health_premium_is_recomputed_only_when_reflected_income_changes(
+    monkeypatch, split_mode, expected_calls
+):
+    params = base_params()
+    params.update(
+        {
+            "simulation_start_year": 2026,
+            "simulation_start_month": 1,
+            "personal_split_mode": split_mode,
+            "personal_enabled": True,
+            "personal_withdrawal_target": 0.0,
+            "personal_property_assessed_value": 1000000000.0,
+        }
+    )
+    params["portfolio_stats"]["personal"] = {
+        "strategy_weights": {"SGOV Buffer": 1.0},
+        "category_return_rates": {"SGOV Buffer": {"dy": 0.12, "pa": 0.0, "tr": 0.12}},
+    }
+    params.setdefault("category_return_rates", {})["personal"] = {
+        "SGOV Buffer": {"dy": 0.12, "pa": 0.0, "tr": 0.12}
+    }
+    initial_assets = {"corp": 0.0, "pension": 0.0, "personal": 120000000.0}
+    expected = make_engine()._execute_loop(initial_assets, deepcopy(params), months=23)
+    calls = []
+    original = TaxEngine.calculate_local_health_insurance_detailed
+
+    def counting(self, property_val, annual_income):
+        calls.append((property_val, annual_income))
+        return original(self, property_val, annual_income)
+
+    monkeypatch.setattr(TaxEngine, "calculate_local_health_insurance_detailed", counting)
+    result = make_engine()._execute_loop(initial_assets, params, months=23)
+
+    # 소유자·가계 보험료를 반영 소득이 0인 구간에 한 번, 2027년 11월 반영 때 한 번씩만 계산한다.
+    # 부부는 1인당 금융소득이 기준 이하라 반영 소득이 계속 0이고, 두 소유자가 한 항목을 함께 쓴다.
+    assert len(calls) == expected_calls
+    assert len(set(calls)) == expected_calls
+    if split_mode == "single":
+        assert calls[-1][1] >= 10000000.0
+    assert result["monthly_data"] == expected["monthly_data"]
+
+
 def test_personal_tax_payment_uses_existing_donor_and_trade_event_rules():
     engine = make_engine()
     assets = {
@@ -2364,3 +2484,376 @@ def test_personal_couple_property_health_premium_uses_household_assessed_value_o
     month = result["monthly_data"][0]
     assert month["personal_health_insurance"] == pytest.approx(expected)
     assert month["personal_health_insurance_by_owner"] == {"self": 0.0, "spouse": 0.0}
+
+
+def _batch_params() -> list[dict]:
+    params_list = []
+    for inflation_rate, sgov_target_months in ((0.0, 30), (0.03, 24), (0.05, 36)):
+        params = base_params()
+        params.update(
+            {
+                "simulation_years": 3,
+                "inflation_rate": inflation_rate,
+                "sgov_target_months": sgov_target_months,
+                "portfolio_stats": {
+                    **params["portfolio_stats"],
+                    "corp": {**params["portfolio_stats"]["corp"], "dividend_yield": 0.04},
+                },
+            }
+        )
+        params_list.append(params)
+    return params_list
+
+
+def test_run_batch_matches_serial_runs_in_input_order():
+    engine = make_engine()
+    initial_assets = {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}
+    params_list = _batch_params()
+    expected = [
+        make_engine().run_30yr_simulation(initial_assets, deepcopy(params))
+        for params in params_list
+    ]
+
+    results = engine.run_batch(initial_assets, params_list, max_workers=2)
+
+    assert results == expected
+    assert params_list == _batch_params()
+
+
+def test_iter_batch_streams_every_index_once():
+    engine = make_engine()
+    initial_assets = {"corp": 1_000_000_000.0, "pension": 300_000_000.0, "personal": 0.0}
+
+    streamed = dict(engine.iter_batch(initial_assets, _batch_params(), max_workers=1))
+
+    assert sorted(streamed) == [0, 1, 2]
+    assert streamed[1]["monthly_data"][-1]["index"] == 36
+
+
+def test_yearly_resolution_sums_flows_and_keeps_period_end_balances():
+    initial_assets = {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}
+    params = _batch_params()[1]
+    monthly = make_engine().run_30yr_simulation(initial_assets, deepcopy(params))
+    yearly = make_engine().run_30yr_simulation(
+        initial_assets, {**deepcopy(params), "output_resolution": "yearly"}
+    )
+
+    rows = monthly["monthly_data"]
+    periods = yearly["monthly_data"]
+    assert yearly["output_resolution"] == "yearly"
+    # 2026-05 시작이므로 첫·마지막 연도는 부분 기간이다.
+    assert [period["period"] for period in periods] == ["2026", "2027", "2028", "2029"]
+    assert [period["period_months"] for period in periods] == [8, 12, 12, 4]
+    first_year = rows[:8]
+    assert periods[0]["corp_draw"] == pytest.approx(sum(row["corp_draw"] for row in first_year))
+    assert periods[0]["target_cashflow"] == pytest.approx(
+        sum(row["target_cashflow"] for row in first_year)
+    )
+    assert periods[0]["total_net_worth"] == first_year[-1]["total_net_worth"]
+    assert periods[0]["corp_sgov_balance"] == first_year[-1]["corp_sgov_balance"]
+    assert periods[0]["stress"] == any(row["stress"] for row in first_year)
+    assert yearly["summary"] == monthly["summary"]
+
+
+def test_columnar_quarterly_output_has_one_list_per_field():
+    initial_assets = {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}
+    params = {**_batch_params()[0], "output_resolution": "quarterly", "output_format": "columnar"}
+    result = make_engine().run_30yr_simulation(initial_assets, params)
+
+    columns = result["monthly_data"]
+    assert result["output_format"] == "columnar"
+    assert columns["period"][:4] == ["2026-Q2", "2026-Q3", "2026-Q4", "2027-Q1"]
+    assert columns["period_months"][:2] == [2, 3]
+    assert sum(columns["period_months"]) == 36
+    assert all(len(values) == len(columns["period"]) for values in columns.values())
+
+
+def test_invalid_output_resolution_is_rejected():
+    params = {**base_params(), "output_resolution": "weekly"}
+
+    with pytest.raises(ValueError):
+        make_engine().run_30yr_simulation({"corp": 1_000_000_000.0, "pension": 0.0}, params)
+
+
+def test_shared_engine_runs_concurrently_without_mixing_run_state():
+    engine = make_engine()
+    initial_assets = {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}
+    tax_engines = [TaxEngine(), TaxEngine(config={"corp_tax_low_rate": 0.2})]
+    jobs = [(params, tax) for params in _batch_params() for tax in tax_engines]
+    expected = [
+        ProjectionEngine(tax).run_30yr_simulation(initial_assets, deepcopy(params))
+        for params, tax in jobs
+    ]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(
+            pool.map(
+                lambda job: engine.run_30yr_simulation(
+                    initial_assets, deepcopy(job[0]), tax_engine=job[1]
+                ),
+                jobs * 2,
+            )
+        )
+
+    assert results == expected * 2
+    assert engine.tax_engine is not tax_engines[1]
+    assert engine._active_trade_events is None
+    assert engine._active_cost_basis_by_account == {}
+
+
+def test_using_tax_engine_applies_only_inside_the_block():
+    engine = make_engine()
+    default_tax_engine = engine.tax_engine
+    scoped_tax_engine = TaxEngine(config={"corp_tax_low_rate": 0.2})
+
+    with engine.using_tax_engine(scoped_tax_engine):
+        assert engine.tax_engine is scoped_tax_engine
+        assert make_engine().tax_engine is not scoped_tax_engine
+
+    assert engine.tax_engine is default_tax_engine
+
+
+def _checkpoint_params() -> dict:
+    params = _batch_params()[1]
+    params["checkpoint_interval_months"] = 12
+    return params
+
+
+def test_resume_from_json_checkpoint_reproduces_full_run():
+    engine = make_engine()
+    initial_assets = {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}
+    params = _checkpoint_params()
+    full = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+
+    assert [checkpoint["index"] for checkpoint in full["checkpoints"]] == [12, 24]
+    checkpoint = json.loads(json.dumps(full["checkpoints"][0]))
+    resumed = engine.resume_from(checkpoint, deepcopy(params))
+
+    for key in full:
+        if key != "checkpoints":
+            assert resumed[key] == full[key], key
+
+
+def test_checkpoints_keep_rows_when_returned_rows_are_edited():
+    """결과 행(중첩 dict 포함)을 고쳐도 체크포인트와 접두 캐시에서 이어 붙인 행은 바뀌지 않는다."""
+
+    def scribble(rows):
+        for row in rows:
+            row["total_net_worth"] = -1.0
+            for value in row.values():
+                if isinstance(value, dict):
+                    value.clear()
+
+    engine = make_engine()
+    initial_assets = {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}
+    params = _checkpoint_params()
+    full = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    expected = deepcopy(full["monthly_data"])
+    checkpoint = full["checkpoints"][0]
+
+    scribble(full["monthly_data"])
+    assert checkpoint["monthly_data"] == expected[:12]
+    resumed = engine.resume_from(checkpoint, deepcopy(params))
+    assert resumed["monthly_data"] == expected
+    scribble(resumed["monthly_data"])
+    assert checkpoint["monthly_data"] == expected[:12]
+
+    params["reuse_cached_prefix"] = True
+    scribble(engine.run_30yr_simulation(initial_assets, deepcopy(params))["monthly_data"])
+    params["planned_cashflows"] = [
+        {"year": 2028, "month": 2, "amount": 50_000_000, "type": "OUTFLOW", "entity": "CORP"}
+    ]
+    edited = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    assert edited["resumed_from_month"] == 12
+    assert edited["monthly_data"][:12] == expected[:12]
+
+
+def test_resume_from_applies_changed_params_only_after_checkpoint():
+    engine = make_engine()
+    initial_assets = {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}
+    params = _checkpoint_params()
+    full = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    checkpoint = full["checkpoints"][0]
+
+    changed = deepcopy(params)
+    changed["planned_cashflows"] = [
+        {"year": 2027, "month": 8, "amount": 50_000_000, "type": "OUTFLOW", "entity": "CORP"}
+    ]
+    resumed = engine.resume_from(checkpoint, changed)
+    expected = engine.run_30yr_simulation(initial_assets, changed)
+
+    assert resumed["monthly_data"][:12] == full["monthly_data"][:12]
+    assert resumed["monthly_data"] == expected["monthly_data"]
+    assert resumed["monthly_data"][12:] != full["monthly_data"][12:]
+
+
+def test_resume_from_rejects_checkpoint_from_another_calendar():
+    engine = make_engine()
+    params = _checkpoint_params()
+    full = engine.run_30yr_simulation(
+        {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}, deepcopy(params)
+    )
+    params["simulation_start_month"] = 1
+
+    with pytest.raises(ValueError):
+        engine.resume_from(full["checkpoints"][0], params)
+
+
+def test_reuse_cached_prefix_recomputes_only_from_first_changed_cashflow():
+    engine = make_engine()
+    initial_assets = {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}
+    params = _batch_params()[1]
+    params["reuse_cached_prefix"] = True
+    first = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+
+    params["planned_cashflows"] = [
+        {"year": 2028, "month": 2, "amount": 50_000_000, "type": "OUTFLOW", "entity": "CORP"}
+    ]
+    edited = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    params["planned_cashflows"][0]["month"] = 3
+    scrubbed = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    params.pop("reuse_cached_prefix")
+    expected = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+
+    assert first["resumed_from_month"] == 0
+    assert edited["resumed_from_month"] == 12
+    assert scrubbed["resumed_from_month"] == 12
+    assert scrubbed["checkpoints"] == []
+    for key in expected:
+        if key != "checkpoints":
+            assert scrubbed[key] == expected[key], key
+
+
+def test_reuse_cached_prefix_reruns_fully_when_other_params_change():
+    engine = make_engine()
+    initial_assets = {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}
+    params = _batch_params()[1]
+    params["reuse_cached_prefix"] = True
+    engine.run_30yr_simulation(initial_assets, deepcopy(params))
+
+    params["inflation_rate"] = 0.04
+    rerun = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+
+    assert rerun["resumed_from_month"] == 0
+
+
+def test_lean_run_mode_keeps_summary_and_trade_events_without_rows():
+    engine = make_engine()
+    initial_assets = {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}
+    params = _batch_params()[1]
+    full = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    params["run_mode"] = "lean"
+    lean = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+
+    assert lean["monthly_data"] == []
+    assert lean["personal_annual_tax_audit"] == []
+    assert lean["summary"] == full["summary"]
+    assert lean["trade_events"] == full["trade_events"]
+    assert lean["ending_cost_basis"] == full["ending_cost_basis"]
+
+
+def test_trade_events_mode_yearly_aggregates_sales_inside_engine():
+    engine = make_engine()
+    initial_assets = {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}
+    params = _batch_params()[1]
+    full = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    params["trade_events_mode"] = "yearly"
+    yearly = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    params["trade_events_mode"] = "none"
+    silent = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+
+    expected = {}
+    for event in full["trade_events"]:
+        totals = expected.setdefault(
+            (event["account"], event["year"]), {"trade_count": 0, "realized_gain": 0.0}
+        )
+        totals["trade_count"] += 1
+        totals["realized_gain"] += event["realized_gain"]
+    assert full["trade_events"]
+    assert full["trade_events_by_year"] is None
+    assert yearly["trade_events"] == []
+    assert {
+        (row["account"], row["year"]): {
+            "trade_count": row["trade_count"],
+            "realized_gain": pytest.approx(row["realized_gain"]),
+        }
+        for row in yearly["trade_events_by_year"]
+    } == expected
+    assert silent["trade_events"] == []
+    assert silent["trade_events_by_year"] is None
+    assert yearly["summary"] == silent["summary"] == full["summary"]
+
+    params["trade_events_mode"] = "compact"
+    with pytest.raises(ValueError):
+        engine.run_30yr_simulation(initial_assets, deepcopy(params))
+
+
+def test_trade_log_round_trips_events_and_marks_cash_obligation_sales():
+    trade_log = TradeLog()
+    trade_log.record("personal", 2026, 3, "Growth Engine", "SGOV Buffer", 100.0, 60.0)
+    trade_log.record("corp", 2026, 3, "Bond Buffer", "SGOV Buffer", 50.0, 50.0)
+    trade_log.record("personal", 2027, 5, "High Income", "SGOV Buffer", 30.0, 10.0)
+    trade_log.mark_cash_obligation(1, "personal", "annual_tax")
+
+    assert trade_log.realized_gain("personal", 2026) == pytest.approx(40.0)
+    assert trade_log.realized_gain("personal", 2028) == 0.0
+    assert trade_log[2] == {
+        "account": "personal",
+        "year": 2027,
+        "month": 5,
+        "from_category": "High Income",
+        "to_category": "SGOV Buffer",
+        "sale_proceeds": 30.0,
+        "cost_basis_sold": 10.0,
+        "realized_gain": 20.0,
+        "cash_obligation": "annual_tax",
+    }
+    assert "cash_obligation" not in trade_log[0]
+    assert TradeLog(trade_log.events()) == trade_log
+    assert [row["trade_count"] for row in trade_log.yearly_totals()] == [1, 1, 1]
+
+
+def test_stop_on_first_shortfall_ends_run_at_first_household_shortfall():
+    engine = make_engine()
+    initial_assets = {"corp": 300_000_000.0, "pension": 0.0, "personal": 0.0}
+    params = _batch_params()[1]
+    params["run_mode"] = "lean"
+    full = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    params["stop_on_first_shortfall"] = True
+    stopped = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+
+    shortfall_date = full["summary"]["first_household_shortfall_date"]
+    assert shortfall_date is not None
+    assert stopped["summary"]["first_household_shortfall_date"] == shortfall_date
+    assert stopped["summary"]["stopped_early"] is True
+    assert stopped["summary"]["is_permanent"] is False
+    assert stopped["survival_months"] < full["survival_months"]
+
+
+def test_unknown_run_mode_is_rejected():
+    params = base_params()
+    params["run_mode"] = "summary"
+
+    with pytest.raises(ValueError):
+        make_engine().run_30yr_simulation({"corp": 1_000_000_000.0, "pension": 0.0}, params)
+
+
+def test_profile_records_stage_time_and_calls_only_when_enabled():
+    engine = make_engine()
+    initial_assets = {"corp": 1_500_000_000.0, "pension": 500_000_000.0, "personal": 0.0}
+    params = _batch_params()[1]
+    plain = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+    params["profile"] = True
+    profiled = engine.run_30yr_simulation(initial_assets, deepcopy(params))
+
+    assert plain["profile"] is None
+    stages = profiled["profile"]["stages"]
+    assert stages["returns"]["calls"] == 36
+    assert stages["may_review"]["calls"] == 3
+    assert stages["november_rebalance"]["calls"] == 3
+    assert stages["august_review"]["calls"] == 3
+    assert stages["post_loop_audit"]["calls"] == 1
+    assert profiled["profile"]["total_seconds"] >= sum(
+        stage["seconds"] for stage in stages.values()
+    )
+    assert profiled["monthly_data"] == plain["monthly_data"]
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from src.core.rng_streams import MASTER_SEED_BITS, PathRandomStreams
+
+
+def test_path_streams_follow_seed_sequence_spawn_model():
+    """경로 스트림은 SeedSequence(seed).spawn(n)[path]로 만든 생성기와 같아야 한다."""
+    streams = PathRandomStreams(42)
+    children = np.random.SeedSequence(42).spawn(6)
+
+    for path in (0, 5):
+        expected = np.random.Generator(np.random.PCG64(children[path])).standard_normal(8)
+        assert (streams.generator(path).standard_normal(8) == expected).all()
+    block = streams.standard_normal(2, 3, (4, 5))
+    assert block.shape == (3, 4, 5)
+    assert (block[1] == streams.generator(3).standard_normal((4, 5))).all()
+    assert not np.allclose(block[0], block[1])
+
+
+def test_missing_seed_is_drawn_and_recorded():
+    streams = PathRandomStreams()
+
+    assert 0 <= streams.seed < 2**MASTER_SEED_BITS
+    again = PathRandomStreams(streams.seed)
+    assert (again.integers(0, 4, 10, 3) == streams.integers(0, 4, 10, 3)).all()
+    with pytest.raises(ValueError):
+        PathRandomStreams(-1)
@@ -0,0 +1,114 @@
+import inspect
+from copy import deepcopy
+
+from fastapi.testclient import TestClient
+
+import src.backend.main as main_module
+from src.backend.main import app
+from src.core.projection_engine import ProjectionEngine
+from src.core.spending_solver import SustainableSpendingSolver
+from src.core.tax_engine import TaxEngine
+
+client = TestClient(app)
+
+INITIAL_ASSETS = {"corp": 1500000000, "pension": 500000000, "personal": 0}
+
+
+def solver_params(**overrides) -> dict:
+    stats = {
+        "dividend_yield": 0.04,
+        "expected_return": 0.07,
+        "strategy_weights": {
+            "SGOV Buffer": 0.15,
+            "Bond Buffer": 0.10,
+            "High Income": 0.15,
+            "Dividend Growth": 0.35,
+            "Growth Engine": 0.25,
+        },
+    }
+    params = {
+        "simulation_years": 10,
+        "simulation_start_year": 2026,
+        "simulation_start_month": 1,
+        "birth_year": 1972,
+        "birth_month": 8,
+        "private_pension_start_age": 55,
+        "national_pension_start_age": 65,
+        "household_monthly_need": 9000000,
+        "target_monthly_cashflow": 9000000,
+        "inflation_rate": 0.025,
+        "initial_shareholder_loan": 300000000,
+        "national_pension_amount": 1500000,
+        "pension_withdrawal_target": 2000000,
+        "personal_enabled": False,
+        "portfolio_stats": {"corp": deepcopy(stats), "pension": deepcopy(stats)},
+    }
+    params.update(overrides)
+    return params
+
+
+def _run_with_need(engine: ProjectionEngine, need: float) -> dict:
+    params = solver_params(household_monthly_need=need, target_monthly_cashflow=need)
+    return engine.run_30yr_simulation(INITIAL_ASSETS, params)["summary"]
+
+
+def test_solver_brackets_largest_need_that_survives_without_shortfall():
+    """찾은 필요액은 전 기간 부족 없이 생존하고, 바로 위 실패 필요액은 부족이 생겨야 한다."""
+    engine = ProjectionEngine(tax_engine=TaxEngine())
+    result = SustainableSpendingSolver(engine).solve(
+        INITIAL_ASSETS, solver_params(), tolerance=50000
+    )
+
+    assert result["feasible"] is True
+    assert result["criterion"] == "survival"
+    need = result["max_household_monthly_need"]
+    assert 0 < need < result["first_failing_need"] <= need + 50000
+    passing = _run_with_need(engine, need)
+    assert passing["is_permanent"] is True
+    assert passing["cumulative_household_shortfall"] == 0
+    failing = _run_with_need(engine, result["first_failing_need"])
+    assert not failing["is_permanent"] or failing["cumulative_household_shortfall"] > 0
+
+
+def test_ending_real_asset_target_lowers_sustainable_need():
+    engine = ProjectionEngine(tax_engine=TaxEngine())
+    solver = SustainableSpendingSolver(engine)
+    survival = solver.solve(INITIAL_ASSETS, solver_params(), tolerance=50000)
+    target = survival["ending_real_assets"] * 1.2
+    result = solver.solve(
+        INITIAL_ASSETS, solver_params(), target_ending_real_assets=target, tolerance=50000
+    )
+
+    assert result["criterion"] == "ending_real_assets"
+    assert result["max_household_monthly_need"] < survival["max_household_monthly_need"]
+    assert result["ending_real_assets"] >= target
+
+
+def test_solver_reports_infeasible_when_zero_need_fails_target():
+    engine = ProjectionEngine(tax_engine=TaxEngine())
+    result = SustainableSpendingSolver(engine).solve(
+        INITIAL_ASSETS, solver_params(), target_ending_real_assets=1e15
+    )
+
+    assert result["feasible"] is False
+    assert result["max_household_monthly_need"] == 0.0
+
+
+def test_max_sustainable_need_api_returns_solver_result():
+    response = client.get("/api/retirement/max-sustainable-need?tolerance=100000")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["success"] is True
+    data = payload["data"]
+    assert data["max_household_monthly_need"] >= 0
+    assert "master_name" in data["meta"]
+    # 전 기간 실행을 여러 번 반복하므로 스레드풀에서 실행되는 일반 def 엔드포인트다.
+    assert not inspect.iscoroutinefunction(main_module.solve_max_sustainable_need)
+
+
+def test_max_sustainable_need_api_rejects_non_positive_tolerance():
+    response = client.get("/api/retirement/max-sustainable-need?tolerance=0")
+
+    assert response.status_code == 200
+    assert response.json()["success"] is False
@@ -1,4 +1,56 @@
+import inspect
+from copy import deepcopy
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.backend.main as main_module
+from src.backend.main import app
+from src.core.projection_engine import ProjectionEngine
 from src.core.stress_engine import StressTestEngine
+from src.core.tax_engine import TaxEngine
+
+client = TestClient(app)
+
+INITIAL_ASSETS = {"corp": 1500000000, "pension": 500000000, "personal": 0}
+CATEGORY_RATES = {
+    "SGOV Buffer": {"dy": 0.045, "pa": 0.0, "tr": 0.045},
+    "Bond Buffer": {"dy": 0.04, "pa": 0.0, "tr": 0.04},
+    "High Income": {"dy": 0.09, "pa": -0.01, "tr": 0.08},
+    "Dividend Growth": {"dy": 0.035, "pa": 0.05, "tr": 0.085},
+    "Growth Engine": {"dy": 0.006, "pa": 0.09, "tr": 0.096},
+}
+
+
+def batch_params() -> dict:
+    stats = {
+        "dividend_yield": 0.04,
+        "expected_return": 0.07,
+        "strategy_weights": {
+            "SGOV Buffer": 0.15,
+            "Bond Buffer": 0.10,
+            "High Income": 0.15,
+            "Dividend Growth": 0.35,
+            "Growth Engine": 0.25,
+        },
+    }
+    return {
+        "simulation_years": 10,
+        "simulation_start_year": 2026,
+        "simulation_start_month": 1,
+        "birth_year": 1972,
+        "birth_month": 8,
+        "private_pension_start_age": 55,
+        "national_pension_start_age": 65,
+        "household_monthly_need": 9000000,
+        "target_monthly_cashflow": 9000000,
+        "inflation_rate": 0.025,
+        "initial_shareholder_loan": 300000000,
+        "national_pension_amount": 1500000,
+        "pension_withdrawal_target": 2000000,
+        "personal_enabled": False,
+        "portfolio_stats": {"corp": dict(stats), "pension": dict(stats)},
+    }
 
 
 def test_stress_scenario_overrides():
@@ -23,3 +75,166 @@ def test_stress_scenario_overrides():
     assert cut_params["dividend_yield"] == 0.05 * 0.75
 
     print("\n[Stress Test] All scenario overrides validated.")
+
+
+def test_composed_scenario_applies_each_component_once():
+    """'+'로 합성한 시나리오는 구성 시나리오를 순서대로 한 번씩 적용한다."""
+    engine = StressTestEngine()
+    base_params = {"market_return_rate": 0.0485, "inflation_rate": 0.025, "dividend_yield": 0.05}
+
+    params = engine.apply_scenario(base_params, "BEAR+DIVIDEND_CUT+bear")
+
+    assert params["active_stress_scenario"] == "BEAR+DIVIDEND_CUT"
+    assert params["market_drop"] == -0.30
+    assert params["dividend_yield"] == 0.05 * 0.75
+    assert base_params["dividend_yield"] == 0.05
+    assert StressTestEngine.parse_scenario("baseline") == ()
+    with pytest.raises(ValueError):
+        StressTestEngine.parse_scenario("BEAR+CRASH")
+
+
+def test_user_defined_shocks_override_scenario_magnitudes():
+    engine = StressTestEngine()
+
+    batch = engine.build_batch(
+        {"inflation_rate": 0.025},
+        ["BASELINE", {"scenario": "STAGFLATION", "shocks": {"stagflation_rate": 0.06}}],
+        shocks={"bear_market_drop": -0.5},
+    )
+
+    assert [entry["scenario"] for entry in batch] == ["BASELINE", "STAGFLATION"]
+    assert batch[0]["params"] == {"inflation_rate": 0.025}
+    assert batch[1]["params"]["inflation_rate"] == 0.06
+    assert batch[1]["shocks"]["bear_market_drop"] == -0.5
+    with pytest.raises(ValueError):
+        engine.with_shocks({"bear_market_drop": 0.2})
+    with pytest.raises(ValueError):
+        engine.with_shocks({"crash_depth": -0.2})
+
+
+def test_bear_and_dividend_cut_shock_inputs_the_engine_reads():
+    """BEAR는 첫 달 위험자산 가격 하락 override로, DIVIDEND_CUT은 분배수익률 축소로 적용된다."""
+    engine = StressTestEngine()
+    base_params = batch_params()
+    base_params["category_return_rates"] = {"corp": deepcopy(CATEGORY_RATES)}
+    original = deepcopy(base_params)
+
+    bear = engine.apply_scenario(base_params, "BEAR")
+    cut = engine.apply_scenario(base_params, "DIVIDEND_CUT")
+
+    assert base_params == original
+    projection_engine = ProjectionEngine(tax_engine=TaxEngine())
+    for account in ("corp", "pension", "personal"):
+        overrides = bear["monthly_return_overrides"][account]
+        assert set(overrides) == {"High Income", "Dividend Growth", "Growth Engine"}
+    # 평소 첫 달 수익률(corp는 카테고리 수익률 pa 9%) 위에 -30% 하락을 더한다.
+    monthly_dy, monthly_pa = projection_engine._monthly_return_components(
+        bear["monthly_return_overrides"]["corp"]["Growth Engine"]["2026-01"]
+    )
+    assert monthly_dy == pytest.approx(0.006 / 12)
+    assert monthly_pa == pytest.approx(1.09 ** (1 / 12) * 0.7 - 1)
+    corp_rates = cut["category_return_rates"]["corp"]
+    assert corp_rates["Dividend Growth"]["dy"] == pytest.approx(0.035 * 0.75)
+    assert corp_rates["Dividend Growth"]["pa"] == 0.05
+    assert corp_rates["SGOV Buffer"] == CATEGORY_RATES["SGOV Buffer"]
+    assert cut["portfolio_stats"]["corp"]["dividend_yield"] == pytest.approx(0.04 * 0.75)
+
+
+def test_bear_first_month_balance_is_normal_return_combined_with_drop():
+    """BEAR 첫 달 위험자산 잔액은 평소 첫 달 수익률을 반영한 잔액에 하락률을 곱한 값이다."""
+    params = batch_params()
+    params["simulation_years"] = 1
+    params["category_return_rates"] = {"corp": deepcopy(CATEGORY_RATES)}
+    params["appreciation_rates"] = {"growth_stocks": 0.08}
+    engine = ProjectionEngine(tax_engine=TaxEngine())
+
+    baseline = engine.run_30yr_simulation(INITIAL_ASSETS, deepcopy(params))["monthly_data"][0]
+    bear = engine.run_30yr_simulation(
+        INITIAL_ASSETS, StressTestEngine().apply_scenario(params, "BEAR")
+    )["monthly_data"][0]
+
+    # corp는 카테고리 수익률(9%), pension은 평가 상승률 설정(8%)이 평소 첫 달 수익률이다.
+    assert baseline["corp_growth_balance"] == pytest.approx(1500000000 * 0.25 * 1.09 ** (1 / 12))
+    assert baseline["pension_growth_balance"] == pytest.approx(500000000 * 0.25 * 1.08 ** (1 / 12))
+    for key in ("corp_growth_balance", "pension_growth_balance"):
+        assert bear[key] == pytest.approx(baseline[key] * 0.7)
+
+
+def test_run_batch_bear_and_dividend_cut_differ_from_baseline():
+    """충격이 엔진 입력에 반영되어 BEAR·DIVIDEND_CUT 기말 자산이 기준선보다 낮아야 한다."""
+    params = batch_params()
+    params["category_return_rates"] = {
+        "corp": deepcopy(CATEGORY_RATES),
+        "pension": deepcopy(CATEGORY_RATES),
+    }
+
+    result = StressTestEngine().run_batch(
+        ProjectionEngine(tax_engine=TaxEngine()),
+        INITIAL_ASSETS,
+        params,
+        ["BASELINE", "BEAR", "DIVIDEND_CUT", "BEAR+DIVIDEND_CUT"],
+        max_workers=1,
+    )
+
+    deltas = {
+        row["scenario"]: row["ending_total_net_worth_vs_baseline"] for row in result["scenarios"]
+    }
+    assert deltas["BASELINE"] == 0
+    assert deltas["BEAR"] < 0
+    assert deltas["DIVIDEND_CUT"] < 0
+    assert deltas["BEAR+DIVIDEND_CUT"] < min(deltas["BEAR"], deltas["DIVIDEND_CUT"])
+
+
+def test_run_batch_returns_side_by_side_summaries_against_baseline():
+    """배치 실행은 시나리오별 요약을 입력 순서대로 나란히 두고 기준선 대비 차이를 붙인다."""
+    projection_engine = ProjectionEngine(tax_engine=TaxEngine())
+    params = batch_params()
+
+    result = StressTestEngine().run_batch(
+        projection_engine,
+        INITIAL_ASSETS,
+        params,
+        ["BASELINE", "STAGFLATION", "BEAR+STAGFLATION"],
+        max_workers=1,
+    )
+    stagflation = projection_engine.run_30yr_simulation(
+        INITIAL_ASSETS, StressTestEngine().apply_scenario(params, "STAGFLATION")
+    )
+
+    rows = result["scenarios"]
+    assert result["baseline_scenario"] == "BASELINE"
+    assert [row["scenario"] for row in rows] == ["BASELINE", "STAGFLATION", "BEAR+STAGFLATION"]
+    assert rows[1]["components"] == ["STAGFLATION"]
+    assert rows[1]["survival_months"] == stagflation["summary"]["survival_months"]
+    assert rows[1]["ending_total_net_worth"] == stagflation["summary"]["ending_total_net_worth"]
+    assert rows[0]["ending_total_net_worth_vs_baseline"] == 0
+    assert rows[1]["ending_total_net_worth_vs_baseline"] == (
+        rows[1]["ending_total_net_worth"] - rows[0]["ending_total_net_worth"]
+    )
+
+
+def test_stress_batch_api_compares_default_scenarios():
+    response = client.post(
+        "/api/retirement/stress-batch",
+        json={"stress_scenarios": ["BASELINE", "BEAR+DIVIDEND_CUT"]},
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["success"] is True
+    assert [row["scenario"] for row in payload["data"]["scenarios"]] == [
+        "BASELINE",
+        "BEAR+DIVIDEND_CUT",
+    ]
+    assert "master_name" in payload["data"]["meta"]
+
+    rejected = client.post(
+        "/api/retirement/stress-batch", json={"stress_scenarios": ["BEAR+CRASH"]}
+    )
+    assert rejected.json()["success"] is False
+
+
+def test_stress_batch_endpoint_runs_off_the_event_loop_with_one_shared_pool():
+    """배치 엔드포인트는 스레드풀에서 돌고, 요청마다 프로세스 풀을 새로 띄우지 않는다."""
+    assert not inspect.iscoroutinefunction(main_module.run_retirement_stress_batch)
+    assert main_module._shared_simulation_pool() is main_module._shared_simulation_pool()
@@ -1,6 +1,14 @@
+import pickle
+
+import numpy as np
 import pytest
 
-from src.core.tax_engine import TaxEngine
+from src.core.tax_engine import (
+    TAX_ENGINE_CACHE_SIZE,
+    TaxEngine,
+    shared_tax_engine,
+    tax_config_fingerprint,
+)
 
 
 def test_local_health_insurance_calculation():
@@ -69,6 +77,21 @@ def test_property_grade_boundaries_and_basic_deduction():
     assert engine.get_property_grade(7881240001) == (60, 2341)
 
 
+def test_progressive_income_tax_uses_cumulative_tax_at_bracket_floors():
+    """누진세는 구간 하한까지의 누적 세액 + 초과분 × 구간 세율이다."""
+    engine = TaxEngine()
+
+    assert engine._progressive_income_tax_national(-1.0) == 0.0
+    assert engine._progressive_income_tax_national(14000000) == pytest.approx(840000.0)
+    assert engine._progressive_income_tax_national(50000000) == pytest.approx(6240000.0)
+    assert engine._progressive_income_tax_national(50000001) == pytest.approx(6240000.24)
+    assert engine._progressive_income_tax_national(88000000) == pytest.approx(15360000.0)
+    assert engine._progressive_income_tax_national(1200000000) == pytest.approx(
+        384060000.0 + 200000000 * 0.45
+    )
+    assert engine.calculate_progressive_income_tax(50000000) == pytest.approx(6864000.0)
+
+
 def test_corp_tax_calculation():
     """법인세 계산 테스트 (2026년 명목 10%, 지방소득세 포함 11%)"""
     engine = TaxEngine()
@@ -181,3 +204,78 @@ def test_us_capital_gains_tax_offsets_annual_losses_and_applies_deduction():
     assert result["taxable_gain"] == 4500000
     assert result["capital_gains_tax"] == pytest.approx(990000)
     assert engine.calculate_us_capital_gains_tax(-1000000)["capital_gains_tax"] == 0
+
+
+@pytest.mark.parametrize("config", [{}, {"corp_tax_nominal_rate": 0.0}])
+def test_array_api_matches_scalar_tax_methods(config):
+    """배열 API는 값마다 스칼라 메서드를 부른 결과와 정확히 같아야 한다."""
+    engine = TaxEngine(config)
+    rng = np.random.default_rng(3)
+    bases = np.concatenate(
+        [rng.uniform(-1.0e7, 5.0e9, 400), [0.0, 14000000.0, 88000000.0, 1.0e9, 104500000.0]]
+    )
+    incomes = rng.uniform(-1.0e6, 3.0e8, bases.size)
+
+    corp_tax = engine.calculate_corp_tax_array(bases)
+    progressive = engine.calculate_progressive_income_tax_array(bases)
+    grades, points = engine.get_property_grade_array(bases)
+    health = engine.calculate_local_health_insurance_array(bases, incomes)
+    gains = engine.calculate_us_capital_gains_tax_array(bases)
+    for index, (base, income) in enumerate(zip(bases.tolist(), incomes.tolist())):
+        assert corp_tax[index] == engine.calculate_corp_tax(base)
+        assert progressive[index] == engine.calculate_progressive_income_tax(base)
+        assert (grades[index], points[index]) == engine.get_property_grade(base)
+        detail = engine.calculate_local_health_insurance_detailed(base, income)
+        assert {key: values[index] for key, values in health.items()} == {
+            key: detail[key] for key in health
+        }
+        capital = engine.calculate_us_capital_gains_tax(base)
+        assert {key: values[index] for key, values in gains.items()} == {
+            key: capital[key] for key in gains
+        }
+
+
+def test_dividend_tax_array_broadcasts_and_matches_comprehensive_taxation():
+    engine = TaxEngine()
+    gross = np.array([0.0, 5000000.0, 18000000.0, 60000000.0])
+
+    result = engine.calculate_us_dividend_tax_array(
+        gross, other_financial_income=4000000.0, other_comprehensive_tax_base=90000000.0
+    )
+
+    assert result["is_comprehensive"].tolist() == [False, False, True, True]
+    for index, value in enumerate(gross.tolist()):
+        expected = engine.calculate_us_dividend_tax(
+            value, other_financial_income=4000000.0, other_comprehensive_tax_base=90000000.0
+        )
+        assert {key: values[index] for key, values in result.items()} == {
+            key: expected[key] for key in result
+        }
+
+
+def test_shared_tax_engine_reuses_instances_by_normalized_config():
+    """정규화한 설정이 같으면 같은 불변 엔진을 공유하고, 캐시는 최근 설정만 보관한다."""
+    config = {"corp_tax_nominal_rate": 0.2, "personal_tax_payment_month": 5}
+    engine = shared_tax_engine(config)
+
+    same = shared_tax_engine({"personal_tax_payment_month": "5", "corp_tax_nominal_rate": 0.2})
+    assert same is engine
+    assert tax_config_fingerprint(config) != tax_config_fingerprint({})
+    assert shared_tax_engine({"corp_tax_nominal_rate": 0.25}) is not engine
+    with pytest.raises(AttributeError):
+        engine.corp_tax_nominal_rate = 0.25
+    for index in range(TAX_ENGINE_CACHE_SIZE):
+        shared_tax_engine({"point_unit_price": 200 + index})
+    assert shared_tax_engine(config) is not engine
+
+
+def test_frozen_tax_engine_round_trips_to_worker_processes():
+    engine = TaxEngine(config={"point_unit_price": 210.0})
+
+    copied = pickle.loads(pickle.dumps(engine))
+
+    assert copied.calculate_local_health_insurance_detailed(
+        600000000, 30000000
+    ) == engine.calculate_local_health_insurance_detailed(600000000, 30000000)
+    with pytest.raises(AttributeError):
+        copied.point_unit_price = 200.0